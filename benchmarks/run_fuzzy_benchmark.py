@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Fuzzy AppID matching benchmark for OptiScaler-GUI.
+
+Builds a synthetic Steam catalogue (game-like names with sequels, subtitles
+and editions), then runs the last-resort fuzzy lookup for a set of queries
+(misspelled catalogue names, names with extra or missing words, unknown
+titles) two ways:
+- baseline: difflib.get_close_matches over every normalized name (the old path)
+- indexed:  SteamAppIndex.fuzzy_match (trigram-ranked candidates + difflib)
+and reports time per query and how often both agree.
+
+Usage:
+    python benchmarks/run_fuzzy_benchmark.py --apps 50000 --queries 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+
+from scanner.steam_app_index import SteamAppIndex, normalize_name, write_index  # noqa: E402
+
+_WORDS = ("shadow", "iron", "crimson", "star", "frontier", "legends", "echo", "rift", "hollow",
+          "titan", "neon", "forge", "dawn", "storm", "relic", "drift", "kingdom", "empire",
+          "dragon", "knight", "space", "zombie", "racing", "tactics", "simulator", "chronicles",
+          "dungeon", "tower", "city", "farm", "war", "ghost", "blade", "hunter", "quest", "island")
+_SUFFIXES = ("", "", "", " 2", " 3", " ii", " remastered", " deluxe edition", ": the lost chapter",
+             " - soundtrack", " vr", " online")
+
+
+def make_catalogue(apps: int, seed: int = 7) -> dict:
+    """name → appid for a synthetic catalogue of about apps entries."""
+    rng = random.Random(seed)
+    catalogue = {}
+    appid = 10
+    while len(catalogue) < apps:
+        words = rng.sample(_WORDS, rng.randint(1, 4))
+        # Invented words keep the vocabulary as wide as a real catalogue's
+        if rng.random() < 0.6:
+            words.append("".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9))))
+        rng.shuffle(words)
+        catalogue[" ".join(words) + rng.choice(_SUFFIXES)] = str(appid)
+        appid += 10
+    return catalogue
+
+
+def _misspell(rng: random.Random, name: str) -> str:
+    chars = list(name)
+    for _ in range(rng.randint(1, 2)):
+        i = rng.randrange(len(chars))
+        op = rng.choice(("drop", "swap", "replace"))
+        if op == "drop" and len(chars) > 4:
+            del chars[i]
+        elif op == "swap" and i + 1 < len(chars):
+            chars[i], chars[i + 1] = chars[i + 1], chars[i]
+        else:
+            chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+    return "".join(chars)
+
+
+def make_queries(catalogue: dict, count: int, seed: int = 11) -> list:
+    """Mix of near-miss catalogue names and titles that are not in it."""
+    rng = random.Random(seed)
+    names = list(catalogue)
+    queries = []
+    for i in range(count):
+        kind = i % 3
+        if kind == 0:
+            queries.append(_misspell(rng, rng.choice(names)))
+        elif kind == 1:
+            queries.append(rng.choice(names) + " " + rng.choice(("goty", "hd", "pc")))
+        else:
+            queries.append(" ".join(rng.sample(_WORDS, 3)) + " unknown title")
+    return [normalize_name(q) for q in queries]
+
+
+def run_benchmark(apps: int, queries: int, workdir: Path) -> dict:
+    catalogue = make_catalogue(apps)
+    path = workdir / "steam_app_index.bin"
+    start = time.perf_counter()
+    write_index(path, catalogue)
+    build_s = time.perf_counter() - start
+    index = SteamAppIndex.open(path)
+    try:
+        all_norms = index.normalized_names()
+        query_list = make_queries(catalogue, queries)
+
+        start = time.perf_counter()
+        baseline = [(difflib.get_close_matches(q, all_norms, n=1, cutoff=0.82) or [None])[0] for q in query_list]
+        baseline_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [index.fuzzy_match(q, cutoff=0.82) for q in query_list]
+        indexed_s = time.perf_counter() - start
+    finally:
+        index.close()
+
+    agree = sum(1 for a, b in zip(baseline, indexed) if a == b)
+    return {
+        "apps": len(catalogue),
+        "queries": len(query_list),
+        "index_build_s": round(build_s, 3),
+        "index_mb": round(path.stat().st_size / (1024 * 1024), 2),
+        "baseline_ms_per_query": round(1000 * baseline_s / len(query_list), 3),
+        "indexed_ms_per_query": round(1000 * indexed_s / len(query_list), 3),
+        "baseline_matches": sum(1 for m in baseline if m),
+        "indexed_matches": sum(1 for m in indexed if m),
+        "agreement": round(agree / len(query_list), 4),
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy AppID matching: difflib scan vs trigram index")
+    parser.add_argument("--apps", type=int, nargs="+", default=[50000], help="Catalogue sizes")
+    parser.add_argument("--queries", type=int, default=60, help="Fuzzy lookups per size")
+    parser.add_argument("--json", help="Write all results to this JSON file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = []
+    for apps in args.apps:
+        with tempfile.TemporaryDirectory(prefix="fuzzy_bench_") as tmp:
+            result = run_benchmark(apps, args.queries, Path(tmp))
+        print(f"{result['apps']:7} apps  baseline {result['baseline_ms_per_query']:9.3f} ms/query  "
+              f"indexed {result['indexed_ms_per_query']:7.3f} ms/query  "
+              f"matches {result['baseline_matches']}/{result['indexed_matches']}  agreement {result['agreement']:.1%}")
+        results.append(result)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
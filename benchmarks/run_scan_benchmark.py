@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Scan benchmark for OptiScaler-GUI.
+
+Generates synthetic Steam/Epic/GOG/Xbox/Heroic libraries (see
+synthetic_library.py) at one or more sizes and measures GameScanner.scan_games:
+- wall time of a cold scan (empty scan index) and a warm rescan (next session)
+- time per launcher source
+- Python-visible filesystem calls (open, os.scandir, os.listdir, os.stat, os.lstat)
+- peak traced memory of a cold scan (tracemalloc)
+
+Usage:
+    python benchmarks/run_scan_benchmark.py --sizes 10 500 5000 --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import patch
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT / "src") not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT / "src"))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic_library import LAUNCHERS, SyntheticLibrary, generate_library  # noqa: E402
+from scanner.game_scanner import FolderFacts, GameScanner  # noqa: E402
+from scanner.scan_index import ScanIndex  # noqa: E402
+
+
+class FsCallCounter:
+    """Count filesystem calls made by any thread while active.
+
+    open/scandir/listdir are counted through audit hooks (which also see calls
+    made from C, e.g. pathlib.iterdir); os.stat/os.lstat have no audit event and
+    are counted by wrapping the os functions. DirEntry.stat() is not counted:
+    it is served from the directory listing on Windows.
+    """
+
+    _EVENTS = {"open": "open", "os.scandir": "scandir", "os.listdir": "listdir"}
+    _hook_installed = False
+    _active = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.counts = {"open": 0, "scandir": 0, "listdir": 0, "stat": 0}
+
+    @classmethod
+    def _audit(cls, event, _args):
+        counter = cls._active
+        if counter is not None and event in cls._EVENTS:
+            with cls._lock:
+                counter.counts[cls._EVENTS[event]] += 1
+
+    def _wrap(self, real):
+        def call(*args, **kwargs):
+            with self._lock:
+                self.counts["stat"] += 1
+            return real(*args, **kwargs)
+        return call
+
+    def __enter__(self):
+        if not FsCallCounter._hook_installed:
+            # Audit hooks can't be removed; the hook is idle while no counter is active
+            sys.addaudithook(FsCallCounter._audit)
+            FsCallCounter._hook_installed = True
+        self._patches = [patch("os.stat", self._wrap(os.stat)), patch("os.lstat", self._wrap(os.lstat))]
+        for p in self._patches:
+            p.start()
+        FsCallCounter._active = self
+        return self
+
+    def __exit__(self, *exc):
+        FsCallCounter._active = None
+        for p in reversed(self._patches):
+            p.stop()
+        return False
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def make_scanner(lib: SyntheticLibrary, index_path: Path) -> GameScanner:
+    """GameScanner pointed only at the synthetic library (no host launchers or discovery)."""
+    scanner = GameScanner()
+    scanner.steam_paths = [str(lib.steam_path)]
+    scanner.epic_games_paths = [str(lib.epic_path)]
+    scanner.gog_paths = [str(lib.gog_path)]
+    scanner.xbox_paths = [str(lib.xbox_path)]
+    scanner._find_heroic_config_roots = lambda: [lib.heroic_root]
+    scanner._discover_library_sources = lambda force_refresh=False: []
+    scanner._scan_index = ScanIndex(index_path, factory=FolderFacts.from_dict)
+    scanner._snapshot_path = str(Path(index_path).with_name("scan_snapshot.json"))
+    return scanner
+
+
+def timed_scan(scanner: GameScanner, memory: bool = False) -> dict:
+    """Run one full scan and return its measurements."""
+    per_launcher = {}
+    launcher_sources = scanner._launcher_sources
+
+    def timed_sources():
+        def wrap(label, fn):
+            def run():
+                start = time.perf_counter()
+                try:
+                    return fn()
+                finally:
+                    per_launcher[label] = round(time.perf_counter() - start, 4)
+            return run
+        return [(label, wrap(label, fn)) for label, fn in launcher_sources()]
+
+    scanner._launcher_sources = timed_sources
+    if memory:
+        tracemalloc.start()
+    with FsCallCounter() as fs_calls:
+        start = time.perf_counter()
+        games = scanner.scan_games(force_refresh=True)
+        wall = time.perf_counter() - start
+    result = {
+        "wall_s": round(wall, 4),
+        "games_found": len(games),
+        "per_launcher_s": per_launcher,
+        "fs_calls": dict(fs_calls.counts, total=fs_calls.total),
+        "index_hits": scanner._scan_index.hits,
+        "index_misses": scanner._scan_index.misses,
+    }
+    if memory:
+        result["peak_mem_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 2)
+        tracemalloc.stop()
+    return result
+
+
+def run_benchmark(size: int, workdir: Path, files_per_game: int = 30, memory: bool = True) -> dict:
+    """Generate a library of size games under workdir and benchmark cold/warm scans."""
+    start = time.perf_counter()
+    lib = generate_library(workdir / "library", size, files_per_game=files_per_game)
+    generate_s = time.perf_counter() - start
+    index_path = workdir / "scan_index.json"
+
+    result = {
+        "games": lib.total_games,
+        "files_per_game": files_per_game,
+        "generate_s": round(generate_s, 2),
+        "expected_per_launcher": {k: len(v) for k, v in lib.expected.items()},
+        # Cold: first session, nothing indexed
+        "cold": timed_scan(make_scanner(lib, index_path)),
+        # Warm: next session, every folder unchanged (served from the index)
+        "warm": timed_scan(make_scanner(lib, index_path)),
+    }
+    if memory:
+        result["cold_memory"] = timed_scan(make_scanner(lib, workdir / "scan_index_mem.json"), memory=True)
+    return result
+
+
+def _print_result(result: dict) -> None:
+    print(f"\n== {result['games']} games ({result['files_per_game']} files each, generated in {result['generate_s']}s)")
+    for phase in ("cold", "warm"):
+        r = result[phase]
+        launchers = ", ".join(f"{k} {r['per_launcher_s'].get(k, 0):.3f}s" for k in LAUNCHERS)
+        print(f"  {phase:5} {r['wall_s']:8.3f}s  found {r['games_found']:5}  fs calls {r['fs_calls']['total']:7}  "
+              f"index {r['index_hits']}/{r['index_hits'] + r['index_misses']}  [{launchers}]")
+    if "cold_memory" in result:
+        print(f"  peak traced memory (cold): {result['cold_memory']['peak_mem_mb']} MB")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark GameScanner.scan_games on synthetic libraries")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 500], help="Total games per library (e.g. 10 500 5000)")
+    parser.add_argument("--files-per-game", type=int, default=30, help="Approximate files per game folder")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass (faster)")
+    parser.add_argument("--workdir", help="Generate libraries here instead of a temporary directory (kept afterwards)")
+    parser.add_argument("--json", help="Write all results to this JSON file")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    results = []
+    for size in args.sizes:
+        if args.workdir:
+            workdir = Path(args.workdir) / f"scan_bench_{size}"
+            workdir.mkdir(parents=True, exist_ok=True)
+            result = run_benchmark(size, workdir, args.files_per_game, not args.no_memory)
+        else:
+            with tempfile.TemporaryDirectory(prefix=f"scan_bench_{size}_") as tmp:
+                result = run_benchmark(size, Path(tmp), args.files_per_game, not args.no_memory)
+        _print_result(result)
+        results.append(result)
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\nResults written to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,148 @@
+"""
+Synthetic multi-launcher game library generator for scan benchmarks.
+
+Builds, under one root directory, the on-disk layouts the scanner reads:
+- Steam:  Steam/steamapps/appmanifest_<id>.acf + steamapps/common/<dir>
+- Epic:   Epic Games/<dir>/.egstore/<id>.mancfg
+- GOG:    GOG Games/<dir>/goggame-<id>.info
+- Xbox:   XboxGames/<dir> (gamelaunchhelper.exe, .xsp, Content/)
+- Heroic: heroic/legendaryConfig/legendary/installed.json → Heroic Games/<dir>
+
+Each game folder gets a realistic mix of engine layouts (Unreal, Unity,
+custom), nested content folders, and occasional anti-cheat / OptiScaler files.
+All files are empty; only directory structure and names matter to the scanner.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import time
+from pathlib import Path
+
+LAUNCHERS = ("Steam", "Epic", "GOG", "Xbox", "Heroic")
+
+_WORDS = ("Shadow", "Iron", "Crimson", "Star", "Frontier", "Legends", "Echo", "Rift",
+          "Hollow", "Titan", "Neon", "Forge", "Dawn", "Storm", "Relic", "Drift")
+
+
+class SyntheticLibrary:
+    """Paths of a generated library plus the games expected in each launcher."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.steam_path = self.root / "Steam"
+        self.epic_path = self.root / "Epic Games"
+        self.gog_path = self.root / "GOG Games"
+        self.xbox_path = self.root / "XboxGames"
+        self.heroic_root = self.root / "heroic"
+        self.heroic_games_path = self.root / "Heroic Games"
+        self.expected = {launcher: [] for launcher in LAUNCHERS}
+
+    @property
+    def total_games(self) -> int:
+        return sum(len(names) for names in self.expected.values())
+
+
+def _game_name(rng: random.Random, launcher: str, index: int) -> str:
+    return f"{rng.choice(_WORDS)} {rng.choice(_WORDS)} {launcher} {index:05d}"
+
+
+def _touch_all(folder: Path, names) -> None:
+    folder.mkdir(parents=True, exist_ok=True)
+    for name in names:
+        (folder / name).touch()
+
+
+def populate_game_folder(folder: Path, exe_name: str, rng: random.Random, files_per_game: int) -> None:
+    """Fill one game folder with about files_per_game files in an engine-like layout."""
+    _touch_all(folder, [f"{exe_name}.exe"])
+    engine = rng.choices(("unreal", "unity", "custom"), weights=(4, 3, 3))[0]
+    budget = max(files_per_game - 1, 6)
+    if engine == "unreal":
+        _touch_all(folder / "Engine" / "Binaries" / "Win64", [f"{exe_name}-Win64-Shipping.exe"])
+        content = folder / exe_name / "Content" / "Paks"
+        _touch_all(content, [f"pakchunk{i}-WindowsNoEditor.pak" for i in range(budget // 2)])
+        _touch_all(folder / "Engine" / "Content" / "Slate", [f"slate{i}.uasset" for i in range(budget - budget // 2)])
+    elif engine == "unity":
+        _touch_all(folder, ["UnityPlayer.dll", "UnityCrashHandler64.exe"])
+        _touch_all(folder / f"{exe_name}_Data", [f"sharedassets{i}.assets" for i in range(budget // 2)])
+        _touch_all(folder / f"{exe_name}_Data" / "Managed", [f"Assembly{i}.dll" for i in range(budget - budget // 2)])
+    else:
+        for d in range(3):
+            _touch_all(folder / "Data" / f"chunk{d}", [f"data{d}_{i}.bin" for i in range(budget // 3)])
+    if rng.random() < 0.1:
+        _touch_all(folder / "EasyAntiCheat", ["EasyAntiCheat_EOS_Setup.exe"])
+    if rng.random() < 0.05:
+        _touch_all(folder, ["OptiScaler.dll", "OptiScaler.ini"])
+
+
+def generate_library(root: Path, total_games: int, files_per_game: int = 30, seed: int = 1234,
+                     age_seconds: float = 3600) -> SyntheticLibrary:
+    """Create a library of total_games games split evenly across all launchers."""
+    rng = random.Random(seed)
+    lib = SyntheticLibrary(root)
+    per_launcher = [total_games // len(LAUNCHERS)] * len(LAUNCHERS)
+    for i in range(total_games % len(LAUNCHERS)):
+        per_launcher[i] += 1
+    counts = dict(zip(LAUNCHERS, per_launcher))
+
+    steamapps = lib.steam_path / "steamapps"
+    (steamapps / "common").mkdir(parents=True, exist_ok=True)
+    for i in range(counts["Steam"]):
+        name = _game_name(rng, "Steam", i)
+        installdir = name.replace(" ", "")
+        appid = 100000 + i
+        (steamapps / f"appmanifest_{appid}.acf").write_text(
+            f'"AppState"\n{{\n\t"appid"\t\t"{appid}"\n\t"name"\t\t"{name}"\n'
+            f'\t"installdir"\t\t"{installdir}"\n}}\n', encoding="utf-8")
+        populate_game_folder(steamapps / "common" / installdir, installdir, rng, files_per_game)
+        lib.expected["Steam"].append(name)
+
+    for i in range(counts["Epic"]):
+        name = _game_name(rng, "Epic", i)
+        folder = lib.epic_path / name.replace(" ", "")
+        populate_game_folder(folder, name.replace(" ", ""), rng, files_per_game)
+        (folder / ".egstore").mkdir(exist_ok=True)
+        (folder / ".egstore" / f"{i:08X}.mancfg").write_text(json.dumps({"DisplayName": name}), encoding="utf-8")
+        lib.expected["Epic"].append(name)
+
+    for i in range(counts["GOG"]):
+        name = _game_name(rng, "GOG", i)
+        folder = lib.gog_path / name.replace(" ", "_")
+        populate_game_folder(folder, name.replace(" ", ""), rng, files_per_game)
+        (folder / f"goggame-{1200000000 + i}.info").write_text(json.dumps({"gameTitle": name}), encoding="utf-8")
+        lib.expected["GOG"].append(name)
+
+    for i in range(counts["Xbox"]):
+        # Xbox names come from the folder name (title-cased), so keep it simple
+        folder_name = f"XboxGame{i:05d}"
+        folder = lib.xbox_path / folder_name
+        _touch_all(folder, ["gamelaunchhelper.exe", "appxmanifest.xml", "resources.xsp"])
+        populate_game_folder(folder / "Content", folder_name, rng, files_per_game)
+        lib.expected["Xbox"].append(folder_name.title())
+
+    installed = {}
+    for i in range(counts["Heroic"]):
+        name = _game_name(rng, "Heroic", i)
+        folder = lib.heroic_games_path / name.replace(" ", "")
+        populate_game_folder(folder, name.replace(" ", ""), rng, files_per_game)
+        installed[f"heroic{i}"] = {"title": name, "install_path": str(folder)}
+        lib.expected["Heroic"].append(name)
+    legendary = lib.heroic_root / "legendaryConfig" / "legendary"
+    legendary.mkdir(parents=True, exist_ok=True)
+    (legendary / "installed.json").write_text(json.dumps(installed), encoding="utf-8")
+    for path in (lib.epic_path, lib.gog_path, lib.xbox_path, lib.heroic_games_path):
+        path.mkdir(parents=True, exist_ok=True)
+    if age_seconds:
+        backdate(lib.root, age_seconds)
+    return lib
+
+
+def backdate(root: Path, seconds: float) -> None:
+    """Set every directory's mtime seconds into the past, like a long-installed
+    library (the scan index never trusts folders modified in the last moments)."""
+    stamp = time.time() - seconds
+    for current, _dirs, _files in os.walk(root):
+        os.utime(current, (stamp, stamp))
@@ -14,6 +14,8 @@ a = Analysis(
     datas=[
         # Translations and assets
         (str(src_dir / 'translations'), 'src/translations'),
+        # Detection rules and community list (loaded relative to the scanner package)
+        (str(src_dir / 'data'), 'data'),
         ('assets', 'assets'),
         ('requirements.txt', '.'),
         ('README.md', '.'),
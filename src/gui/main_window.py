@@ -2,7 +2,7 @@ import customtkinter as ctk
 import sys
 import threading
 from pathlib import Path
-from scanner.game_scanner import GameScanner
+from scanner.game_scanner import GameScanner, apply_game_updates
 from gui.widgets.game_list_frame import GameListFrame
 from gui.widgets.global_settings_frame import GlobalSettingsFrame
 from utils.translation_manager import t
@@ -30,6 +30,8 @@ class MainWindow(ctk.CTk):
         # Initialize components
         self.scanner = GameScanner()
         self.current_frame = None
+        # Bumped per scan so batches from a superseded scan are ignored
+        self._scan_generation = 0
         
         # Create UI
         self._create_header()
@@ -37,9 +39,9 @@ class MainWindow(ctk.CTk):
         self._create_footer()
         self._create_progress_overlay()
         
-        # Show default view; force a startup rescan to ensure the UI is populated
-        # (this ensures a consistent initial load even if scanner cache is empty)
-        self.show_game_list(force_refresh=True)
+        # Show default view: paint the last session's scan snapshot right away and
+        # revalidate it in the background; without a snapshot, run a full scan
+        self._show_startup_game_list()
         
         # Check for updates on startup (after UI is ready)
         self.after(1000, self._check_for_updates_on_startup)
@@ -73,6 +75,15 @@ class MainWindow(ctk.CTk):
             width=100
         )
         self.settings_btn.grid(row=0, column=1, padx=5, pady=5)
+
+        # Game search: filters the game list on every keystroke through its
+        # in-memory index; the query is kept for lists created later
+        self.search_entry = ctk.CTkEntry(
+            self.header_frame,
+            placeholder_text=t("ui.search_games", "Search games")
+        )
+        self.search_entry.grid(row=0, column=2, padx=5, pady=5, sticky="ew")
+        self.search_entry.bind("<KeyRelease>", self._on_search_changed)
         
         # NOTE: The Log button was previously in the header and made the UI noisy.
         # Move the log viewer access into Settings (GlobalSettingsFrame) to avoid
@@ -111,6 +122,20 @@ class MainWindow(ctk.CTk):
         except Exception:
             pass
     
+    def _search_query(self):
+        try:
+            return self.search_entry.get()
+        except Exception:
+            return ''
+
+    def _on_search_changed(self, event=None):
+        """Apply the search box to the game list currently shown."""
+        if isinstance(self.current_frame, GameListFrame):
+            try:
+                self.current_frame.set_search(self._search_query())
+            except Exception as e:
+                debug_log(f"ERROR: Failed to filter games: {e}")
+
     def _create_content_area(self):
         """Create main content area"""
         self.content_frame = ctk.CTkFrame(self)
@@ -220,6 +245,45 @@ class MainWindow(ctk.CTk):
             debug_log(f"ERROR: Failed to start game scanning: {e}")
             self._display_scan_error(e)
 
+    def _show_startup_game_list(self):
+        """Render the persisted scan snapshot before touching any game folder,
+        then rescan in the background and patch only the rows that differ."""
+        try:
+            snapshot = self.scanner.load_snapshot()
+        except Exception as e:
+            debug_log(f"Failed to load scan snapshot: {e}")
+            snapshot = None
+        if not snapshot:
+            self.show_game_list(force_refresh=True)
+            return
+
+        debug_log(f"Showing {len(snapshot)} games from the scan snapshot; revalidating in background")
+        self._display_games(snapshot)
+        self._scan_generation += 1
+        generation = self._scan_generation
+
+        def revalidate_threaded():
+            try:
+                added, removed, changed = self.scanner.revalidate_snapshot()
+            except Exception as e:
+                debug_log(f"ERROR: Failed to revalidate scan snapshot: {e}")
+                return
+            self.after(0, lambda: self._apply_scan_diff(generation, added, removed, changed))
+
+        threading.Thread(target=revalidate_threaded, daemon=True).start()
+
+    def _apply_scan_diff(self, generation, added, removed, changed):
+        """Apply a background revalidation to the displayed game list. changed
+        holds (game, {field: value}) updates, applied here on the UI thread."""
+        if generation != self._scan_generation or not (added or removed or changed):
+            return
+        changed = apply_game_updates(changed)
+        if isinstance(self.current_frame, GameListFrame):
+            try:
+                self.current_frame.apply_diff(added, removed, changed)
+            except Exception as e:
+                debug_log(f"ERROR: Failed to apply scan changes: {e}")
+
     def rescan_games(self):
         """Trigger a full rescan of games (same as show_game_list, but explicit)."""
         # Reuse show_game_list which wraps the scanning pipeline and progress overlay
@@ -242,14 +306,20 @@ class MainWindow(ctk.CTk):
                     debug_log(f"ERROR: Failed to scan games (sync mode): {e}")
                     self._display_scan_error(e)
             else:
+                self._scan_generation += 1
+                generation = self._scan_generation
+
                 def scan_games_threaded():
-                    """Scan games in background thread"""
+                    """Scan games in background thread, streaming each batch to the UI"""
                     try:
-                        # Get games from scanner
-                        games = self.scanner.scan_games(force_refresh=force_refresh)
-                        
-                        # Update UI in main thread
-                        self.after(0, lambda: self._display_games(games))
+                        first = True
+                        for batch in self.scanner.scan_games_iter(force_refresh=force_refresh):
+                            # Update UI in main thread
+                            self.after(0, lambda b=batch, f=first: self._display_scan_batch(generation, b, f))
+                            first = False
+                        if first:
+                            # Nothing found: still replace the progress overlay with an empty list
+                            self.after(0, lambda: self._display_scan_batch(generation, [], True))
                     except Exception as e:
                         debug_log(f"ERROR: Failed to scan games: {e}")
                         error = e  # Capture error in local variable
@@ -265,6 +335,18 @@ class MainWindow(ctk.CTk):
             progress_manager.hide_progress("main")
             self._display_scan_error(e)
     
+    def _display_scan_batch(self, generation, games, first):
+        """Show the first streamed batch as a new list; append later batches to it."""
+        if generation != self._scan_generation:
+            return
+        if first:
+            self._display_games(games)
+        elif isinstance(self.current_frame, GameListFrame):
+            try:
+                self.current_frame.append_games(games)
+            except Exception as e:
+                debug_log(f"ERROR: Failed to append scanned games: {e}")
+
     def _display_games(self, games):
         """Display the games list after scanning completes"""
         try:
@@ -295,7 +377,8 @@ class MainWindow(ctk.CTk):
                 self.content_frame,
                 games=games,
                 game_scanner=self.scanner,
-                on_edit_settings=self.edit_game_settings
+                on_edit_settings=self.edit_game_settings,
+                search=self._search_query()
             )
             # Always place the game list in the main row (row 0). Summary is
             # removed and not shown, so games should take primary vertical space.
@@ -370,6 +453,7 @@ class MainWindow(ctk.CTk):
         # Update header text
         self.games_btn.configure(text=t("ui.games_tab"))
         self.settings_btn.configure(text=t("ui.settings_tab"))
+        self.search_entry.configure(placeholder_text=t("ui.search_games", "Search games"))
         
         # Log viewer is accessible from the Settings UI; do not update header log button here.
         
@@ -414,6 +498,7 @@ class MainWindow(ctk.CTk):
         try:
             from gui.widgets.settings_editor_frame import SettingsEditorFrame
             from optiscaler.manager import OptiScalerManager
+            from optiscaler.settings_model import load_settings_model
             
             # Get the correct OptiScaler installation path
             manager = OptiScalerManager()
@@ -435,26 +520,18 @@ class MainWindow(ctk.CTk):
             # Show progress animation AND start creating editor simultaneously
             progress_manager.start_indeterminate("main", "Settings Editor", "Loading OptiScaler settings...")
             
-            # Create editor in background while animation runs
-            def create_editor_background():
+            def finish_loading(model):
+                # Only widget creation is left for the UI thread
                 try:
-                    # Create settings editor frame with correct path (runs in parallel with animation)
                     editor_frame = SettingsEditorFrame(
                         self.content_frame,
                         game_path=optiscaler_path,
-                        on_back=self.show_game_list
+                        on_back=self.show_game_list,
+                        model=model
                     )
-                    
-                    # Return the created frame
-                    return editor_frame
-                    
                 except Exception as e:
                     debug_log(f"ERROR: Failed to create settings editor: {e}")
-                    return None
-            
-            def finish_loading():
-                # Create the editor (this will take however long it takes)
-                editor_frame = create_editor_background()
+                    editor_frame = None
                 
                 # Hide progress and show result
                 progress_manager.hide_progress("main")
@@ -464,8 +541,18 @@ class MainWindow(ctk.CTk):
                 else:
                     self._display_settings_error("Failed to create settings editor")
             
-            # Start editor creation after a small delay to let animation start
-            self.after(100, finish_loading)
+            def load_settings_threaded():
+                """Parse the INI and resolve translations while the animation runs"""
+                try:
+                    model = load_settings_model(str(Path(optiscaler_path) / "OptiScaler.ini"), manager)
+                except Exception as e:
+                    debug_log(f"ERROR: Failed to load OptiScaler settings: {e}")
+                    error = e
+                    self.after(0, lambda err=error: self._display_settings_error(err))
+                    return
+                self.after(0, lambda: finish_loading(model))
+            
+            threading.Thread(target=load_settings_threaded, daemon=True).start()
             
         except Exception as e:
             debug_log(f"ERROR: Failed to start settings editor loading: {e}")
@@ -1,24 +1,33 @@
 import customtkinter as ctk
 from PIL import Image, ImageDraw, ImageFont
-# Determine correct LANCZOS constant across Pillow versions without static attribute
-LANCZOS = getattr(getattr(Image, 'Resampling', Image), 'LANCZOS', None)
-if LANCZOS is None:
-    # Fallback to a commonly available resampling filter (BICUBIC or NEAREST if not present)
-    LANCZOS = getattr(Image, 'BICUBIC', getattr(Image, 'NEAREST', None))
 from pathlib import Path
 import tkinter as tk
 from optiscaler.manager import OptiScalerManager
 from CTkMessagebox import CTkMessagebox
 import concurrent.futures
+import math
 import subprocess
 import threading
 import time
+from collections import OrderedDict
 from utils.config import config as app_config
 from utils.translation_manager import t
 from utils.progress import progress_manager
 from utils.debug import debug_log
 from utils.update_manager import update_manager
 from utils.compatibility_checker import compatibility_checker
+from utils.thumbnails import THUMBNAIL_HEIGHT, load_thumbnail
+from utils.viewport_loader import ViewportLoader, visible_rows
+from utils.virtual_list import RowLayout
+from scanner.game_search import GameSearchIndex
+from gui.widgets.game_row import ROW_PADY, GameRow, row_height
+
+# The virtualized layout drives CTkScrollableFrame internals: the canvas
+# (_parent_canvas), its scrollbar (_scrollbar) and the canvas window item that
+# holds the frame (_create_window_id). Checked against customtkinter 6.0.0
+# (same layout as 5.2.x); GameListFrame falls back to the chunked layout when
+# they are missing.
+CTK_INTERNALS_CHECKED = "6.0.0"
 
 # PyInstaller-aware import system
 import sys
@@ -138,24 +147,23 @@ def create_placeholder_pil_image(width, height, text=None):
 
 class GameListFrame(ctk.CTkScrollableFrame):
 
-    def __init__(self, master, games, game_scanner, on_edit_settings, **kwargs):
+    def __init__(self, master, games, game_scanner, on_edit_settings, search='', **kwargs):
         super().__init__(master, **kwargs)
         self.grid_columnconfigure(0, weight=1)
-        # Apply cached filters from config
-        from utils.config import get_config_value
-        self.games = list(games) or []
-        show_verified = bool(get_config_value('filter_show_verified_only', False))
-        show_supported = bool(get_config_value('filter_show_supported_only', False))
-        if show_verified:
-            self.games = [g for g in self.games if getattr(g, 'community_verified', False)]
-        if show_supported:
-            self.games = [g for g in self.games if getattr(g, 'engine_supported', True)]
+        # Every game handed to the list; self.games are the ones shown, in order
+        # (matching the search query and the verified/supported filters)
+        self._all_games = list(games or [])
+        self._search = GameSearchIndex(self._all_games)
+        self._query = (search or '').strip()
+        self.games = self._visible(self._all_games)
         self.game_scanner = game_scanner
         self.optiscaler_manager = OptiScalerManager()
         self.on_edit_settings = on_edit_settings
         # ThreadPoolExecutor for background image fetching and other short tasks
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=getattr(app_config, 'max_workers', 4))
-        self._image_label_map = {}  # Map game.path -> label widget for later updates
+        self._row_frames = {}  # Map game.path -> GameRow currently showing it
+        # Pending debounced snapshot save after thumbnails resolve
+        self._snapshot_save_after_id = None
         
         # Cache update check result to avoid multiple API calls
         self._update_check_cache = None
@@ -163,6 +171,42 @@ class GameListFrame(ctk.CTkScrollableFrame):
 
         # Pending after() callback for chunked rendering (cancelled on destroy/refresh)
         self._render_after_id = None
+        # Rows built so far; append_games() resumes rendering from here
+        self._rendered_count = 0
+        # Thumbnails are fetched for the rows in view plus a look-ahead, and
+        # re-prioritized (far-away queued rows cancelled) as the list scrolls
+        self._thumb_loader = ViewportLoader(game_scanner.download_scheduler, self._fetch_thumbnail,
+                                            key=lambda g: ('image', g.path),
+                                            lookahead=app_config.thumbnail_lookahead_rows)
+        self._viewport = (0.0, 1.0)
+        self._viewport_after_id = None
+        try:
+            self._parent_canvas.configure(yscrollcommand=self._on_yscroll)
+        except Exception as e:
+            debug_log(f"Viewport scroll hook unavailable: {e}")
+
+        # Virtualized layout: a pool of GameRow widgets slightly larger than the
+        # viewport is placed over the rows on screen and re-bound as the list
+        # scrolls, so widget count does not grow with the library
+        self._virtual = app_config.virtualized_game_list
+        self._layout = RowLayout()
+        self._row_pool = []
+        self._visible_range = (0, 0)
+        self._scrollregion = None
+        # Thumbnails of games whose row is not built right now (virtualized layout)
+        self._thumb_images = OrderedDict()
+        if self._virtual and not self._virtual_internals_ok():
+            debug_log(f"customtkinter {getattr(ctk, '__version__', '?')} lacks the CTkScrollableFrame internals "
+                      f"checked with {CTK_INTERNALS_CHECKED}; using the chunked game list")
+            self._virtual = False
+        if self._virtual:
+            # The frame holding the rows stays viewport-sized and the canvas
+            # scrollregion spans the laid-out rows instead of the frame.
+            # CTkScrollableFrame's own <Configure> handler (kept) resets the
+            # scrollregion to the frame's bbox; this one runs after it and puts
+            # the laid-out height back.
+            self.bind("<Configure>", self._on_virtual_frame_configure, add="+")
+            self._parent_canvas.bind("<Configure>", lambda e: self._sync_virtual_rows(), add="+")
         # Warm the update-check cache off the main thread so the first installed
         # game row doesn't block the UI on a network call
         self._executor.submit(self._get_update_info)
@@ -183,6 +227,184 @@ class GameListFrame(ctk.CTkScrollableFrame):
         except Exception:
             pass
 
+        # Rows of games whose OptiScaler status changed are patched in place
+        def _on_games_changed(changed):
+            try:
+                self.after(0, lambda: self.apply_diff([], [], changed))
+            except Exception as e:
+                debug_log(f"Game change schedule error: {e}")
+
+        try:
+            game_scanner.on_games_changed = _on_games_changed
+        except Exception:
+            pass
+
+    def _filter_query(self):
+        """The search query plus the verified/supported filters from config."""
+        from utils.config import get_config_value
+        query = self._query
+        if bool(get_config_value('filter_show_verified_only', False)):
+            query += " verified:yes"
+        if bool(get_config_value('filter_show_supported_only', False)):
+            query += " supported:yes"
+        return query
+
+    def _visible(self, games):
+        return self._search.filter(games, self._filter_query())
+
+    def set_search(self, query):
+        """Show only the games matching query (see scanner.game_search). Rows
+        are hidden or re-bound; nothing is rescanned or rebuilt."""
+        query = (query or '').strip()
+        if query == self._query:
+            return
+        self._query = query
+        games = self._visible(self._all_games)
+        if self._virtual:
+            self.games = games
+            try:
+                self._parent_canvas.yview_moveto(0)
+            except Exception:
+                pass
+            self._layout_virtual_rows(rebind=False)
+            return
+        if self._render_after_id is not None:
+            try:
+                self.after_cancel(self._render_after_id)
+            except Exception:
+                pass
+            self._render_after_id = None
+        # Hide every built row; the chunked render re-grids the matching ones
+        # and only builds rows for games that never had one
+        for row in self._row_frames.values():
+            row.grid_remove()
+        self.games = games
+        self._rendered_count = 0
+        self._render_chunk(0)
+
+    def append_games(self, games):
+        """Add games from a later scan batch without rebuilding existing rows."""
+        games = list(games)
+        self._all_games.extend(games)
+        self._search.add(games)
+        self._show_games(self._visible(games))
+
+    def _show_games(self, new_games):
+        """Append rows for games that start matching the current view."""
+        if not new_games:
+            return
+        self.games.extend(new_games)
+        debug_log(f"append_games: {len(new_games)} more games ({len(self.games)} shown)")
+        if self._virtual:
+            self._layout.append(self._row_height(g) for g in new_games)
+            self._rendered_count = len(self.games)
+            self._sync_virtual_rows()
+            self._schedule_viewport_update()
+            return
+        # A chunked render still in flight picks the new games up by itself
+        if self._render_after_id is None:
+            self._render_chunk(self._rendered_count)
+
+    def apply_diff(self, added, removed, changed):
+        """Patch the list after a background rescan: drop rows of removed games,
+        rebuild rows of changed games in place and append new games.
+        changed holds the already-displayed Game objects, updated in place."""
+        added, removed, changed = list(added), list(removed), list(changed)
+        if removed:
+            gone = {id(g) for g in removed}
+            self._all_games = [g for g in self._all_games if id(g) not in gone]
+            self._search.remove(removed)
+            self._remove_games(removed)
+            for game in removed:
+                row = self._row_frames.get(game.path)
+                if not self._virtual and row is not None and row.game is game:
+                    del self._row_frames[game.path]
+                    try:
+                        row.destroy()
+                    except Exception:
+                        pass
+        for game in changed:
+            self._search.update(game)
+        self._all_games.extend(added)
+        self._search.add(added)
+        visible = {id(g) for g in self._visible(changed + added)}
+        shown = {id(g) for g in self.games}
+        hidden = [g for g in changed if id(g) in shown and id(g) not in visible]
+        if hidden:
+            self._remove_games(hidden)
+        for game in changed:
+            if id(game) in visible and id(game) in shown:
+                self._rebuild_game_row(game)
+        self._show_games([g for g in added + changed if id(g) in visible and id(g) not in shown])
+        debug_log(f"apply_diff: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+
+    def _remove_games(self, games):
+        """Take games out of the shown list and close the gaps they leave. Their
+        rows are hidden (chunked layout) or returned to the pool (virtualized)."""
+        gone = {id(g) for g in games}
+        if self._virtual:
+            self.games = [g for g in self.games if id(g) not in gone]
+            self._layout.reset(self._row_height(g) for g in self.games)
+            self._rendered_count = len(self.games)
+            # Rows bound to removed games go back to the pool
+            self._sync_virtual_rows()
+            return
+        rendered = self.games[:self._rendered_count]
+        for game in rendered:
+            if id(game) in gone:
+                frame = self._row_frames.get(game.path)
+                if frame is not None:
+                    try:
+                        frame.grid_remove()
+                    except Exception:
+                        pass
+        self._rendered_count = sum(1 for g in rendered if id(g) not in gone)
+        self.games = [g for g in self.games if id(g) not in gone]
+        for i, game in enumerate(self.games[:self._rendered_count]):
+            frame = self._row_frames.get(game.path)
+            if frame is not None:
+                frame.grid_configure(row=i)
+
+    def _rebuild_game_row(self, game):
+        """Re-bind one already-rendered row after its game changed."""
+        index = next((i for i, g in enumerate(self.games) if g is game), None)
+        if index is None or index >= self._rendered_count:
+            # Not rendered yet: the chunked render builds it from the new state
+            return
+        row = self._row_frames.get(game.path)
+        try:
+            if self._virtual:
+                self._layout.set_height(index, self._row_height(game))
+                if row is not None:
+                    row.show(game, self._update_available(game))
+                self._sync_virtual_rows()
+            elif row is not None:
+                row.show(game, self._update_available(game))
+            else:
+                self._build_game_row(index, game)
+        except Exception as e:
+            debug_log(f"Failed rebuilding row for {game.name}: {e}")
+            return
+        self._thumb_loader.invalidate(game)
+        self._schedule_viewport_update()
+
+    def _schedule_snapshot_save(self):
+        """Persist newly resolved artwork to the scan snapshot, at most once per
+        burst of thumbnail updates."""
+        if self._snapshot_save_after_id is not None:
+            return
+        try:
+            self._snapshot_save_after_id = self.after(2000, self._save_snapshot)
+        except Exception:
+            pass
+
+    def _save_snapshot(self):
+        self._snapshot_save_after_id = None
+        try:
+            self._executor.submit(self.game_scanner.save_snapshot)
+        except Exception as e:
+            debug_log(f"Snapshot save schedule error: {e}")
+
     def _get_update_info(self):
         """Get update information with caching to avoid multiple API calls"""
         # import time  # hoisted to module top
@@ -219,12 +441,17 @@ class GameListFrame(ctk.CTkScrollableFrame):
         debug_log(f"_display_games: rendering {len(self.games)} games in chunks of {self._RENDER_CHUNK_SIZE}")
         # One shared placeholder CTkImage for every row instead of a fresh
         # PIL image + CTkImage per game (item 9 of the perf audit)
-        target_height = 80
+        target_height = THUMBNAIL_HEIGHT
+        # Physical thumbnail height, read here since workers must not query Tk
+        self._thumb_px = self._thumbnail_px_height
         placeholder_width = int(target_height * 16 / 9)
         placeholder_img = self._create_placeholder_pil_image(placeholder_width, target_height)
         self._shared_placeholder_image = ctk.CTkImage(light_image=placeholder_img, dark_image=placeholder_img,
                                                       size=(placeholder_width, target_height))
-        self._render_chunk(0)
+        if self._virtual:
+            self._layout_virtual_rows()
+        else:
+            self._render_chunk(0)
 
     def _render_chunk(self, start):
         """Build one chunk of game rows, then yield to the event loop."""
@@ -235,8 +462,9 @@ class GameListFrame(ctk.CTkScrollableFrame):
                 self._build_game_row(i, self.games[i])
             except Exception as e:
                 debug_log(f"Failed building row for {self.games[i].name}: {e}")
-        # Fetch artwork for just-rendered rows so thumbnails appear with them
-        self._schedule_fetch_game_images(self.games[start:end])
+        self._rendered_count = end
+        # Queue artwork for the new rows that are in (or near) the viewport
+        self._schedule_viewport_update()
         if end < len(self.games):
             try:
                 self._render_after_id = self.after(1, lambda: self._render_chunk(end))
@@ -246,99 +474,147 @@ class GameListFrame(ctk.CTkScrollableFrame):
             debug_log(f"_display_games: done rendering {len(self.games)} games")
 
     def _build_game_row(self, i, game):
-            game_frame = ctk.CTkFrame(self)
-            game_frame.grid(row=i, column=0, padx=5, pady=5, sticky="ew")
-            game_frame.grid_columnconfigure(0, weight=0)
-            game_frame.grid_columnconfigure(1, weight=1)
-
-            # Shared placeholder image — replaced in background by _schedule_fetch_game_images
-            placeholder_label = ctk.CTkLabel(game_frame, image=self._shared_placeholder_image, text='')
-            placeholder_label.grid(row=0, column=0, sticky="w")
-            self._image_label_map[game.path] = placeholder_label
-
-            # Info frame
-            info_frame = ctk.CTkFrame(game_frame)
-            info_frame.grid(row=0, column=1, padx=(10, 15), pady=5, sticky="ew")
-            info_frame.grid_columnconfigure(0, weight=1)
-
-            name_label = ctk.CTkLabel(info_frame, text=game.name, font=("Arial", 14, "bold"))
-            name_label.grid(row=0, column=0, sticky="w")
-
-            if hasattr(game, 'platform') and game.platform:
-                tag_label = ctk.CTkLabel(info_frame, text=game.platform, font=("Arial", 10, "italic"),
-                                         fg_color="#444", text_color="#fff", corner_radius=6, padx=6, pady=2)
-                tag_label.grid(row=0, column=1, padx=(10, 0), sticky="w")
-
-            if getattr(game, 'community_verified', False):
-                verified_label = ctk.CTkLabel(info_frame, text=t('ui.community_verified', 'Verified'),
-                                              font=("Arial", 10), fg_color="#2e7d32", text_color="#fff",
-                                              corner_radius=6, padx=6, pady=2)
-                verified_label.grid(row=0, column=2, padx=(10, 0), sticky="w")
-            elif getattr(game, 'anti_cheat_list', None):
-                ac_text = ", ".join(game.anti_cheat_list)
-                ac_label = ctk.CTkLabel(info_frame, text=f"{t('ui.anti_cheat', 'Anti-cheat')}: {ac_text}",
-                                        font=("Arial", 10), fg_color="#ffa000", text_color="#000",
-                                        corner_radius=6, padx=6, pady=2)
-                ac_label.grid(row=0, column=2, padx=(10, 0), sticky="w")
-
-            engine = getattr(game, 'engine', None)
-            engine_supported = getattr(game, 'engine_supported', True)
-            if engine and not engine_supported:
-                engine_label = ctk.CTkLabel(info_frame, text=f"{engine} ({t('ui.engine_unsupported')})",
-                                             font=("Arial", 10), fg_color="#d32f2f", text_color="#fff",
-                                             corner_radius=6, padx=6, pady=2)
-                engine_label.grid(row=0, column=3, padx=(10, 0), sticky="w")
-            elif engine:
-                engine_label = ctk.CTkLabel(info_frame, text=f"{engine}", font=("Arial", 10),
-                                             fg_color="#666", text_color="#fff", corner_radius=6, padx=6, pady=2)
-                engine_label.grid(row=0, column=3, padx=(10, 0), sticky="w")
-
-            path_label = ctk.CTkLabel(info_frame, text=game.path, font=("Arial", 10))
-            path_label.grid(row=1, column=0, columnspan=4, sticky="w")
-
-            # Buttons
-            buttons_frame = ctk.CTkFrame(game_frame, fg_color="transparent")
-            buttons_frame.grid(row=0, column=2, padx=5, pady=5, sticky="e")
-            buttons_frame.grid_columnconfigure(0, weight=1)
-
-            is_installed = getattr(game, 'optiscaler_installed', False)
-
-            button_row = 0
-            if is_installed:
-                action_button = ctk.CTkButton(
-                    buttons_frame, text=t("ui.uninstall") + " OptiScaler",
-                    fg_color="#d32f2f", hover_color="#b71c1c",
-                    command=lambda g=game: self._uninstall_optiscaler_for_game(g))
-            else:
-                action_button = ctk.CTkButton(
-                    buttons_frame, text=t("ui.install_optiscaler"),
-                    command=lambda g=game: self._install_optiscaler_for_game(g))
-            action_button.grid(row=button_row, column=0, padx=5, pady=2, sticky="e")
-            button_row += 1
+        row = self._row_frames.get(game.path)
+        if row is not None and row.game is game:
+            # Built before and hidden by a search: show it again (the game may
+            # have changed while its row was hidden)
+            row.grid(row=i, column=0, padx=5, pady=ROW_PADY, sticky="ew")
+            row.show(game, self._update_available(game))
+            return
+        row = self._new_row()
+        row.grid(row=i, column=0, padx=5, pady=ROW_PADY, sticky="ew")
+        # Starts on the shared placeholder image — replaced in background by _fetch_thumbnail
+        row.show(game, self._update_available(game))
+        self._row_frames[game.path] = row
 
-            if is_installed:
-                try:
-                    update_info = self._get_update_info()
-                    if update_info.get("available", False):
-                        update_button = ctk.CTkButton(
-                            buttons_frame, text=t("ui.update") + " OptiScaler",
-                            fg_color="#ff9800", hover_color="#f57c00",
-                            command=lambda g=game: self._update_optiscaler_for_game(g))
-                        update_button.grid(row=button_row, column=0, padx=5, pady=2, sticky="e")
-                        button_row += 1
-                except Exception as e:
-                    debug_log(f"Update check failed for {game.name}: {e}")
+    def _new_row(self):
+        row = GameRow(self, self._shared_placeholder_image,
+                      on_install=self._install_optiscaler_for_game,
+                      on_uninstall=self._uninstall_optiscaler_for_game,
+                      on_update=self._update_optiscaler_for_game,
+                      on_edit_settings=self.on_edit_settings,
+                      on_open_folder=self._open_game_folder)
+        if self._virtual:
+            # Pool rows get their height from the layout, not their contents
+            row.grid_propagate(False)
+            self._row_pool.append(row)
+        return row
+
+    def _update_available(self, game):
+        """Whether game's row offers an OptiScaler update."""
+        if not getattr(game, 'optiscaler_installed', False):
+            return False
+        try:
+            return bool(self._get_update_info().get("available", False))
+        except Exception as e:
+            debug_log(f"Update check failed for {game.name}: {e}")
+            return False
+
+    def _row_height(self, game):
+        return row_height(game, self._update_available(game)) + 2 * ROW_PADY
+
+    # Rows bound above and below the viewport so small scrolls need no re-binding
+    _VIRTUAL_OVERSCAN = 2
+    # Thumbnails kept for rows that scrolled out (virtualized layout)
+    _THUMB_CACHE_SIZE = 200
+
+    def _virtual_internals_ok(self):
+        """True if this CTkScrollableFrame exposes the canvas internals the
+        virtualized layout drives (see CTK_INTERNALS_CHECKED)."""
+        canvas = getattr(self, '_parent_canvas', None)
+        window_id = getattr(self, '_create_window_id', None)
+        if canvas is None or window_id is None or not hasattr(self, '_scrollbar'):
+            return False
+        try:
+            return canvas.type(window_id) == "window"
+        except Exception:
+            return False
+
+    def _on_virtual_frame_configure(self, event=None):
+        # CTk just set the scrollregion to the frame's bbox: force ours again
+        self._scrollregion = None
+        self._sync_virtual_rows()
 
-                edit_settings_button = ctk.CTkButton(
-                    buttons_frame, text=t("ui.edit_settings"),
-                    command=lambda g_path=game.path: self.on_edit_settings(g_path))
-                edit_settings_button.grid(row=button_row, column=0, padx=5, pady=2, sticky="e")
-                button_row += 1
+    def _layout_virtual_rows(self, rebind=True):
+        """Virtualized layout: lay out every game's row and re-bind the pool to
+        the rows in view. Nothing is created or destroyed beyond the pool.
+        Without rebind, rows already showing a game in view are kept as they are."""
+        self._layout.reset(self._row_height(g) for g in self.games)
+        self._rendered_count = len(self.games)
+        if rebind:
+            # Every pool row is re-bound from the games' current state
+            self._row_frames = {}
+        self._sync_virtual_rows()
+        self._schedule_viewport_update()
+        debug_log(f"_display_games: laid out {len(self.games)} games over {len(self._row_pool)} row widgets")
 
-            open_folder_button = ctk.CTkButton(
-                buttons_frame, text=t("ui.open_folder"),
-                command=lambda p=game.path: self._open_game_folder(p))
-            open_folder_button.grid(row=button_row, column=0, padx=5, pady=2, sticky="e")
+    def _sync_virtual_rows(self):
+        """Place pool rows over the rows in view, re-binding rows that scrolled
+        out to the games that scrolled in."""
+        if not self._virtual:
+            return
+        try:
+            canvas = self._parent_canvas
+            try:
+                scale = ctk.ScalingTracker.get_widget_scaling(self)
+            except Exception:
+                scale = 1.0
+            view_height = max(1, canvas.winfo_height())
+            region = (0, 0, canvas.winfo_width(), max(view_height, math.ceil(self._layout.total * scale)))
+            if region != self._scrollregion:
+                self._scrollregion = region
+                canvas.configure(scrollregion=region)
+            top = canvas.canvasy(0)
+            canvas.coords(self._create_window_id, 0, top)
+            canvas.itemconfigure(self._create_window_id, height=view_height)
+        except Exception as e:
+            debug_log(f"Virtual list sync failed: {e}")
+            return
+
+        start, end = self._layout.rows_between(top / scale, (top + view_height) / scale)
+        self._visible_range = (start, end)
+        first = max(0, start - self._VIRTUAL_OVERSCAN)
+        shown = self.games[first:min(len(self.games), end + self._VIRTUAL_OVERSCAN)]
+        bound = {}
+        for game in shown:
+            row = self._row_frames.get(game.path)
+            if row is not None and row.game is game:
+                bound[game.path] = row
+        in_use = {id(row) for row in bound.values()}
+        free = [row for row in self._row_pool if id(row) not in in_use]
+        for i, game in enumerate(shown, first):
+            try:
+                row = bound.get(game.path)
+                if row is None:
+                    row = free.pop() if free else self._new_row()
+                    row.show(game, self._update_available(game), image=self._cached_thumbnail(game))
+                    bound[game.path] = row
+                height = self._layout.height(i) - 2 * ROW_PADY
+                if row.cget("height") != height:
+                    row.configure(height=height)
+                row.place(x=0, y=self._layout.offset(i) + ROW_PADY - top / scale, relwidth=1.0)
+            except Exception as e:
+                debug_log(f"Failed binding row for {game.name}: {e}")
+        for row in free:
+            if row.game is not None:
+                row.place_forget()
+                row.game = None
+        self._row_frames = bound
+
+    def _cached_thumbnail(self, game):
+        entry = self._thumb_images.get(game.path)
+        if entry is None or entry[0] is not game:
+            return self._shared_placeholder_image
+        self._thumb_images.move_to_end(game.path)
+        return entry[1]
+
+    def _remember_thumbnail(self, game, image):
+        self._thumb_images[game.path] = (game, image)
+        self._thumb_images.move_to_end(game.path)
+        while len(self._thumb_images) > self._THUMB_CACHE_SIZE:
+            _, (old_game, _) = self._thumb_images.popitem(last=False)
+            # Loaded again (from the thumbnail disk cache) when it scrolls back in
+            self._thumb_loader.invalidate(old_game)
 
     def _create_placeholder_pil_image(self, width, height, text=None):
         """Return a plain PIL image used as a placeholder before the real thumbnail loads."""
@@ -366,138 +642,148 @@ class GameListFrame(ctk.CTkScrollableFrame):
             except Exception:
                 return Image.new('RGB', (1, 1), color='gray')
 
-    def _schedule_fetch_game_images(self, games=None):
-        """Schedule background tasks to fetch images for the given games
-        (defaults to all games)."""
-        target_height = 80
+    def _on_yscroll(self, first, last):
+        """Canvas yscrollcommand: keep the scrollbar in sync and re-target
+        thumbnail loading at the new viewport (debounced while scrolling)."""
+        try:
+            self._scrollbar.set(first, last)
+        except Exception:
+            pass
+        self._viewport = (float(first), float(last))
+        self._sync_virtual_rows()
+        self._schedule_viewport_update()
 
-        def fetch_and_update(game):
-            try:
-                image_path = self.game_scanner.fetch_game_image(game.name, game.appid)
-                if image_path:
-                    game.image_path = image_path
-                    # If the game scanner returned the configured placeholder, log for diagnostics
-                    try:
-                        if image_path == str(self.game_scanner.no_image_path):
-                            debug_log(f"No image available for {game.name}; using configured placeholder.")
-                    except Exception:
-                        pass
+    def _schedule_viewport_update(self, delay=40):
+        if self._viewport_after_id is not None:
+            return
+        try:
+            self._viewport_after_id = self.after(delay, self._update_viewport)
+        except Exception:
+            pass
 
-                    def _update():
-                        img_label = self._image_label_map.get(game.path)
-                        if not img_label or not Path(image_path).exists():
-                            return
-                        try:
-                            img = Image.open(image_path)
-                            original_width, original_height = img.size
-                            # protect against dividing by zero or unexpected sizes
-                            if not original_height or not original_width:
-                                raise ValueError("Invalid image dimensions")
-                            new_width = int(original_width * (target_height / original_height))
-                            if new_width <= 0:
-                                new_width = target_height
-                            resampler = getattr(Image, 'Resampling', None)
-                            if resampler is not None:
-                                lanczos = resampler.LANCZOS
-                            else:
-                                lanczos = LANCZOS
-                            img = img.resize((new_width, target_height), lanczos)
-                            ctk_image = ctk.CTkImage(light_image=img, dark_image=img, size=(new_width, target_height))
-                            img_label.configure(image=ctk_image, text='')
-                            setattr(img_label, '_ctk_image_ref', ctk_image)
-                        except Exception as e:
-                            debug_log(f"Failed to update game image for {game.path}: {e}")
-                            # On failure, keep fallback placeholder but ensure it's sized correctly
-                            try:
-                                img_label = self._image_label_map.get(game.path)
-                                if img_label:
-                                    placeholder_img = self._create_placeholder_pil_image(int(target_height * (16/9)), target_height)
-                                    ctk_placeholder = ctk.CTkImage(light_image=placeholder_img, dark_image=placeholder_img, size=(int(target_height * (16/9)), target_height))
-                                    img_label.configure(image=ctk_placeholder, text='')
-                                    setattr(img_label, '_ctk_image_ref', ctk_placeholder)
-                            except Exception:
-                                pass
-
-                    self.after(0, _update)
-            except Exception as e:
-                debug_log(f"Error fetching image for {game.name}: {e}")
-                # If fetching fails, ensure we set a consistent placeholder image on the UI
-                def _set_placeholder():
-                    try:
-                        img_label = self._image_label_map.get(game.path)
-                        if img_label:
-                            placeholder_img = self._create_placeholder_pil_image(int(target_height * (16/9)), target_height)
-                            ctk_placeholder = ctk.CTkImage(light_image=placeholder_img, dark_image=placeholder_img, size=(int(target_height * (16/9)), target_height))
-                            img_label.configure(image=ctk_placeholder, text='')
-                            setattr(img_label, '_ctk_image_ref', ctk_placeholder)
-                    except Exception:
-                        pass
-                try:
-                    self.after(0, _set_placeholder)
-                except Exception:
-                    _set_placeholder()
+    def _update_viewport(self):
+        """Queue thumbnails for the visible rows and the look-ahead around them;
+        cancel queued ones that scrolled far away."""
+        self._viewport_after_id = None
+        rendered = self.games[:self._rendered_count]
+        if self._virtual:
+            start, end = self._visible_range
+        else:
+            start, end = visible_rows(*self._viewport, len(rendered))
+        try:
+            self._thumb_loader.update(rendered, start, end)
+        except Exception as e:
+            debug_log(f"Thumbnail viewport update failed: {e}")
 
-        for game in (games if games is not None else self.games):
-            # Always schedule image load/optimize in background to avoid main-thread workload
+    def _fetch_thumbnail(self, game):
+        """Worker: resolve game's artwork and hand its row thumbnail to the UI thread."""
+        no_img = str(self.game_scanner.no_image_path)
+        try:
+            previous = game.image_path
+            if previous and previous != no_img and Path(previous).exists():
+                # Artwork resolved in an earlier session (scan snapshot)
+                image_path = previous
+            else:
+                image_path = self.game_scanner.fetch_game_image(game.name, game.appid, game=game)
+            if image_path:
+                game.image_path = image_path
+                if image_path != previous:
+                    self.after(0, self._schedule_snapshot_save)
+                # If the game scanner returned the configured placeholder, log for diagnostics
+                if image_path == no_img:
+                    debug_log(f"No image available for {game.name}; using configured placeholder.")
+                # Decode and resize here, on the worker; the main thread only wraps the pixels
+                thumb = load_thumbnail(image_path, self._thumb_px)
+                self.after(0, lambda: self._apply_thumbnail(game, thumb))
+        except Exception as e:
+            debug_log(f"Error fetching image for {game.name}: {e}")
+            # If fetching fails, ensure we set a consistent placeholder image on the UI
             try:
-                self._executor.submit(fetch_and_update, game)
+                self.after(0, lambda: self._apply_thumbnail(game, None))
             except Exception:
-                # If executor fails, continue without blocking
-                continue
+                pass
+
+    @property
+    def _thumbnail_px_height(self):
+        """Row thumbnail height in physical pixels. CTkImage scales its logical
+        size by the widget scaling, so thumbnails rendered at this height are
+        shown without another resize on the main thread."""
+        try:
+            scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        except Exception:
+            scaling = 1.0
+        return max(1, round(THUMBNAIL_HEIGHT * scaling))
+
+    def _apply_thumbnail(self, game, thumb):
+        """Main thread: show a ready thumbnail (or the placeholder when None) in the game's row."""
+        try:
+            if thumb is None:
+                ctk_image = self._shared_placeholder_image
+            else:
+                scale = thumb.height / THUMBNAIL_HEIGHT
+                size = (max(1, round(thumb.width / scale)), THUMBNAIL_HEIGHT)
+                ctk_image = ctk.CTkImage(light_image=thumb, dark_image=thumb, size=size)
+                if self._virtual:
+                    self._remember_thumbnail(game, ctk_image)
+            row = self._row_frames.get(game.path)
+            if row is not None and row.game is game:
+                row.set_image(ctk_image)
+        except Exception as e:
+            debug_log(f"Failed to update game image for {game.path}: {e}")
 
     def _retry_missing_images(self):
-        """Re-fetch thumbnails for games that still have no resolved image.
+        """Re-fetch thumbnails for games that still have no resolved image, and
+        for games whose AppID was matched against a partial app index.
         Called after the SteamSpy app list finishes downloading so games that
-        previously got only the placeholder now get a real Steam CDN image."""
+        previously got only the placeholder (or a guess from part of the
+        catalogue) now get a real Steam CDN image."""
         no_img = str(self.game_scanner.no_image_path)
+        provisional_names = self.game_scanner.take_provisional_appids()
+
+        def provisional(g):
+            # Steam games carry their manifest AppID, never a name match
+            return g.platform != 'Steam' and (g.name or '').lower().strip() in provisional_names
+
         retry_games = [
-            g for g in self.games
-            if not g.image_path or g.image_path == no_img or not Path(g.image_path).exists()
+            g for g in self._all_games
+            if not g.image_path or g.image_path == no_img or not Path(g.image_path).exists() or provisional(g)
         ]
-        debug_log(f"Thumbnail retry: {len(retry_games)} games without images")
+        debug_log(f"Thumbnail retry: {len(retry_games)} games without images "
+                  f"or with AppIDs from a partial app list")
         if not retry_games:
             return
 
-        target_height = 80
-
-        def fetch_and_update_retry(game):
+        def resolve_then_fetch():
+            # Resolve AppIDs for the whole retry set in one batch (the app list
+            # just changed) instead of once per thumbnail task
             try:
-                # Clear cached image_path so fetch_game_image tries again
-                game.image_path = None
-                image_path = self.game_scanner.fetch_game_image(game.name, game.appid)
-                if not image_path or image_path == no_img:
-                    return
-                game.image_path = image_path
-
-                def _update():
-                    img_label = self._image_label_map.get(game.path)
-                    if not img_label or not Path(image_path).exists():
-                        return
-                    try:
-                        img = Image.open(image_path)
-                        ow, oh = img.size
-                        if not oh or not ow:
-                            return
-                        nw = max(1, int(ow * target_height / oh))
-                        resampler = getattr(Image, 'Resampling', None)
-                        lanczos = resampler.LANCZOS if resampler else LANCZOS
-                        img = img.resize((nw, target_height), lanczos)
-                        ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=(nw, target_height))
-                        img_label.configure(image=ctk_img, text='')
-                        setattr(img_label, '_ctk_image_ref', ctk_img)
-                        debug_log(f"Retry thumbnail updated: {game.name}")
-                    except Exception as e:
-                        debug_log(f"Retry thumbnail update failed for {game.name}: {e}")
-
-                self.after(0, _update)
+                unresolved = [g for g in retry_games if not g.appid or provisional(g)]
+                if unresolved:
+                    appids = self.game_scanner.resolve_appids([g.name for g in unresolved])
+                    for g in unresolved:
+                        appid = appids.get(g.name)
+                        if appid != g.appid:
+                            g.appid = appid
+                            # Art found through the old guess is fetched again
+                            g.image_path = None
             except Exception as e:
-                debug_log(f"Retry fetch failed for {game.name}: {e}")
-
-        for game in retry_games:
+                debug_log(f"Batch AppID resolution failed: {e}")
             try:
-                self._executor.submit(fetch_and_update_retry, game)
+                self.after(0, requeue)
             except Exception:
-                continue
+                pass
+
+        def requeue():
+            # Placeholder rows load again when next in view; rows far away
+            # wait until the user scrolls to them
+            for game in retry_games:
+                self._thumb_loader.invalidate(game)
+            self._update_viewport()
+
+        try:
+            self._executor.submit(resolve_then_fetch)
+        except Exception:
+            pass
 
     def _install_optiscaler_for_game(self, game):
         """Install OptiScaler for the selected game with enhanced error handling"""
@@ -571,7 +857,7 @@ class GameListFrame(ctk.CTkScrollableFrame):
                 debug_log(f"Installation successful for {game.name}")
                 message = data.get("message", "Installation completed successfully") if data else "Installation completed successfully"
                 CTkMessagebox(title=t("ui.success"), message=f"{t('ui.optiscaler_installed')} {game.name}!\n\n{message}")
-                self._refresh_display()
+                self._refresh_games([game])
             elif stage == "install_error":
                 # Installation failed - report to compatibility checker
                 progress_manager.hide_progress("main")
@@ -788,9 +1074,9 @@ class GameListFrame(ctk.CTkScrollableFrame):
                        f"{t('ui.update_version')}: {version}\n"
                        f"{t('ui.details')}: {message}"
             )
-            # Refresh the game list to update button states
+            # The update check result changed; installed rows may lose their update button
             debug_log("Refreshing game list display after update...")
-            self._refresh_display()
+            self._refresh_games([game], recheck_updates=True)
         else:
             debug_log(f"Update failed for {game.name}: {message}")
             CTkMessagebox(
@@ -851,66 +1137,48 @@ class GameListFrame(ctk.CTkScrollableFrame):
         if success:
             debug_log(f"Uninstallation successful for {game.name}")
             CTkMessagebox(title=t("ui.success"), message=f"{t('ui.optiscaler_uninstalled')}\n\n{message}")
-            # Refresh the game list to update button states
+            # Patch the game's row to update button states
             debug_log("Refreshing game list display after uninstall...")
-            self._refresh_display()
+            self._refresh_games([game])
         else:
             debug_log(f"Uninstallation failed for {game.name}: {message}")
             CTkMessagebox(title=t("ui.error"), message=f"{t('ui.failed_to_uninstall')}: {message}")
 
     def _refresh_display(self):
-        """Refresh the game list display to update button states.
-        OptiScaler re-detection (file I/O per game) runs on a worker thread;
-        only the widget rebuild happens on the UI thread."""
-        # Clear update cache to force fresh check
-        self._update_check_cache = None
-        self._cache_timestamp = None
-        # Warm it again off-thread before rows need it
-        try:
-            self._executor.submit(self._get_update_info)
-        except Exception:
-            pass
+        """Refresh button states for the whole list: re-check for updates and
+        re-detect OptiScaler only in game folders that changed on disk."""
+        self._refresh_games(list(self._all_games), recheck_updates=True)
 
-        def _detect_then_rebuild():
-            # Update OptiScaler status for all games to get current state
-            for game in self.games:
-                try:
-                    game.optiscaler_installed = self.game_scanner._detect_optiscaler(game.path)
-                    debug_log(f"Updated OptiScaler status for {game.name}: {game.optiscaler_installed}")
-                except Exception as e:
-                    debug_log(f"Failed to update OptiScaler status for {game.name}: {e}")
-                    game.optiscaler_installed = False
+    def _refresh_games(self, games, recheck_updates=False):
+        """Re-detect OptiScaler for games on a worker thread. The scanner reports
+        games whose status changed (on_games_changed) and only their rows are
+        patched; with recheck_updates, installed rows follow a changed update check."""
+        def _refresh():
+            was_available = None
+            if recheck_updates:
+                was_available = bool((self._update_check_cache or {}).get("available", False))
+                # Clear update cache to force fresh check
+                self._update_check_cache = None
+                self._cache_timestamp = None
+                self._get_update_info()
             try:
-                self.after(0, _rebuild)
-            except Exception:
-                pass
-
-        def _rebuild():
-            # Cancel any in-flight chunked render before rebuilding
-            if self._render_after_id is not None:
+                changed = self.game_scanner.refresh_install_status(games)
+            except Exception as e:
+                debug_log(f"Failed to refresh OptiScaler status: {e}")
+                changed = []
+            if recheck_updates and was_available != bool((self._update_check_cache or {}).get("available", False)):
+                refreshed = {id(g) for g in changed}
+                stale = [g for g in self._all_games if g.optiscaler_installed and id(g) not in refreshed]
                 try:
-                    self.after_cancel(self._render_after_id)
+                    self.after(0, lambda: [self._rebuild_game_row(g) for g in stale])
                 except Exception:
                     pass
-                self._render_after_id = None
-            # Clear current display; schedule destruction to avoid mid-draw Tcl errors
-            for widget in self.winfo_children():
-                try:
-                    self.after(0, lambda w=widget: w.destroy())
-                except Exception:
-                    try:
-                        widget.destroy()
-                    except Exception:
-                        pass
-            self._image_label_map = {}
-            # Recreate the display (chunks schedule their own image fetches)
-            self._display_games()
 
         try:
-            self._executor.submit(_detect_then_rebuild)
+            self._executor.submit(_refresh)
         except Exception:
             # Fallback: run synchronously rather than not at all
-            _detect_then_rebuild()
+            _refresh()
 
     def _open_game_folder(self, path):
         # import subprocess  # hoisted to module top
@@ -927,6 +1195,20 @@ class GameListFrame(ctk.CTkScrollableFrame):
             except Exception:
                 pass
             self._render_after_id = None
+        if getattr(self, '_snapshot_save_after_id', None) is not None:
+            try:
+                self.after_cancel(self._snapshot_save_after_id)
+            except Exception:
+                pass
+            self._snapshot_save_after_id = None
+        if getattr(self, '_viewport_after_id', None) is not None:
+            try:
+                self.after_cancel(self._viewport_after_id)
+            except Exception:
+                pass
+            self._viewport_after_id = None
+        if getattr(self, '_thumb_loader', None) is not None:
+            self._thumb_loader.reset()
         try:
             if hasattr(self, '_executor') and self._executor:
                 self._executor.shutdown(wait=False)
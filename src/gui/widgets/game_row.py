@@ -0,0 +1,133 @@
+"""
+One game list row for OptiScaler-GUI.
+
+A GameRow owns the full widget set a game row can need (thumbnail, name,
+platform / verified / anti-cheat / engine tags, path and the action buttons)
+and shows a Game by reconfiguring and hiding them rather than by creating
+widgets. The game list builds one per game in the chunked layout, and keeps
+a small pool that is re-bound to whichever games are on screen in the
+virtualized layout.
+"""
+import customtkinter as ctk
+from utils.thumbnails import THUMBNAIL_HEIGHT
+from utils.translation_manager import t
+
+# Vertical padding above and below each row
+ROW_PADY = 5
+# Height taken by one action button (28 px button + 2 px padding on both sides)
+_BUTTON_SLOT = 32
+# Name + path labels and the info frame padding
+_INFO_HEIGHT = 2 * 28 + 10
+
+
+def button_count(game, update_available=False):
+    """Number of action buttons shown for game."""
+    if getattr(game, 'optiscaler_installed', False):
+        return 4 if update_available else 3
+    return 2
+
+
+def row_height(game, update_available=False):
+    """Logical height of game's row (without ROW_PADY), used by the virtualized
+    list to lay out rows it has not built."""
+    buttons = 2 * ROW_PADY + _BUTTON_SLOT * button_count(game, update_available)
+    return max(THUMBNAIL_HEIGHT, _INFO_HEIGHT, buttons)
+
+
+class GameRow(ctk.CTkFrame):
+    """Row widgets for one game; show() re-binds them to another game."""
+
+    def __init__(self, master, placeholder_image, on_install, on_uninstall, on_update,
+                 on_edit_settings, on_open_folder, **kwargs):
+        super().__init__(master, **kwargs)
+        self.game = None
+        self.grid_columnconfigure(0, weight=0)
+        self.grid_columnconfigure(1, weight=1)
+
+        self.image_label = ctk.CTkLabel(self, image=placeholder_image, text='')
+        self.image_label.grid(row=0, column=0, sticky="w")
+
+        info_frame = ctk.CTkFrame(self)
+        info_frame.grid(row=0, column=1, padx=(10, 15), pady=5, sticky="ew")
+        info_frame.grid_columnconfigure(0, weight=1)
+
+        self.name_label = ctk.CTkLabel(info_frame, text='', font=("Arial", 14, "bold"))
+        self.name_label.grid(row=0, column=0, sticky="w")
+        self.platform_tag = ctk.CTkLabel(info_frame, text='', font=("Arial", 10, "italic"),
+                                         fg_color="#444", text_color="#fff", corner_radius=6, padx=6, pady=2)
+        self.verified_tag = ctk.CTkLabel(info_frame, text=t('ui.community_verified', 'Verified'),
+                                         font=("Arial", 10), fg_color="#2e7d32", text_color="#fff",
+                                         corner_radius=6, padx=6, pady=2)
+        self.anti_cheat_tag = ctk.CTkLabel(info_frame, text='', font=("Arial", 10), fg_color="#ffa000",
+                                           text_color="#000", corner_radius=6, padx=6, pady=2)
+        self.engine_tag = ctk.CTkLabel(info_frame, text='', font=("Arial", 10), fg_color="#666",
+                                       text_color="#fff", corner_radius=6, padx=6, pady=2)
+        self.path_label = ctk.CTkLabel(info_frame, text='', font=("Arial", 10))
+        self.path_label.grid(row=1, column=0, columnspan=4, sticky="w")
+
+        buttons_frame = ctk.CTkFrame(self, fg_color="transparent")
+        buttons_frame.grid(row=0, column=2, padx=5, pady=5, sticky="e")
+        buttons_frame.grid_columnconfigure(0, weight=1)
+        self.install_button = ctk.CTkButton(buttons_frame, text=t("ui.install_optiscaler"),
+                                            command=lambda: on_install(self.game))
+        self.uninstall_button = ctk.CTkButton(buttons_frame, text=t("ui.uninstall") + " OptiScaler",
+                                              fg_color="#d32f2f", hover_color="#b71c1c",
+                                              command=lambda: on_uninstall(self.game))
+        self.update_button = ctk.CTkButton(buttons_frame, text=t("ui.update") + " OptiScaler",
+                                           fg_color="#ff9800", hover_color="#f57c00",
+                                           command=lambda: on_update(self.game))
+        self.settings_button = ctk.CTkButton(buttons_frame, text=t("ui.edit_settings"),
+                                             command=lambda: on_edit_settings(self.game.path))
+        self.folder_button = ctk.CTkButton(buttons_frame, text=t("ui.open_folder"),
+                                           command=lambda: on_open_folder(self.game.path))
+
+    def show(self, game, update_available=False, image=None):
+        """Bind the row to game: texts, tags and buttons follow its current state.
+        image replaces the thumbnail when given."""
+        self.game = game
+        if image is not None:
+            self.set_image(image)
+        self.name_label.configure(text=game.name)
+        self.path_label.configure(text=game.path)
+
+        platform = getattr(game, 'platform', None)
+        self._toggle(self.platform_tag, bool(platform), column=1, text=platform or '')
+        anti_cheat = getattr(game, 'anti_cheat_list', None)
+        verified = getattr(game, 'community_verified', False)
+        self._toggle(self.verified_tag, verified, column=2)
+        self._toggle(self.anti_cheat_tag, not verified and bool(anti_cheat), column=2,
+                     text=f"{t('ui.anti_cheat', 'Anti-cheat')}: {', '.join(anti_cheat or [])}")
+        engine = getattr(game, 'engine', None)
+        if engine and not getattr(game, 'engine_supported', True):
+            self._toggle(self.engine_tag, True, column=3, text=f"{engine} ({t('ui.engine_unsupported')})",
+                         fg_color="#d32f2f")
+        else:
+            self._toggle(self.engine_tag, bool(engine), column=3, text=f"{engine}", fg_color="#666")
+
+        installed = getattr(game, 'optiscaler_installed', False)
+        buttons = [self.uninstall_button if installed else self.install_button]
+        if installed:
+            if update_available:
+                buttons.append(self.update_button)
+            buttons.append(self.settings_button)
+        buttons.append(self.folder_button)
+        for button in (self.install_button, self.uninstall_button, self.update_button,
+                       self.settings_button, self.folder_button):
+            if button not in buttons:
+                button.grid_remove()
+        for row, button in enumerate(buttons):
+            button.grid(row=row, column=0, padx=5, pady=2, sticky="e")
+
+    def set_image(self, image):
+        self.image_label.configure(image=image, text='')
+        # Keep a reference so the CTkImage is not garbage-collected while shown
+        self.image_label._ctk_image_ref = image
+
+    @staticmethod
+    def _toggle(tag, visible, column, **options):
+        if not visible:
+            tag.grid_remove()
+            return
+        if options:
+            tag.configure(**options)
+        tag.grid(row=0, column=column, padx=(10, 0), sticky="w")
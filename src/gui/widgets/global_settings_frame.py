@@ -5,6 +5,7 @@ from utils.translation_manager import t, get_translation_manager, get_languages,
 from utils.debug import debug_log
 from utils.config import get_config_value, set_config_value
 from utils.archive_extractor import archive_extractor
+from utils.image_cache_index import image_cache_index
 import webbrowser
 
 class GlobalSettingsFrame(ctk.CTkScrollableFrame):
@@ -458,6 +459,7 @@ class GlobalSettingsFrame(ctk.CTkScrollableFrame):
                     for file_path in cache_dir.rglob("*"):
                         if file_path.is_file() and file_path.name != ".gitkeep":
                             file_path.unlink()
+                    image_cache_index.clear()
                 
                 CTkMessagebox(title=t("ui.success"), message=t("ui.cache_cleared"))
                 # Refresh cache info
@@ -466,6 +468,9 @@ class GlobalSettingsFrame(ctk.CTkScrollableFrame):
                 try:
                     if self.main_window and hasattr(self.main_window, 'scanner') and hasattr(self.main_window.scanner, 'clear_cached_games'):
                         self.main_window.scanner.clear_cached_games()
+                        self.main_window.scanner.clear_scan_index()
+                        self.main_window.scanner.clear_snapshot()
+                        self.main_window.scanner.artwork_misses.reset()
                 except Exception:
                     pass
             except Exception as e:
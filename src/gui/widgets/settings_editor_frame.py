@@ -1,27 +1,28 @@
 ﻿import customtkinter as ctk
 import os
 from optiscaler.manager import OptiScalerManager
+from optiscaler.settings_model import BOOL_VALUES, load_settings_model
 import customtkinter as ctk
 from pathlib import Path
-from utils.translation_manager import t, get_translation_manager, reload_translations
+from utils.translation_manager import t, get_translation_manager
 from utils.debug import debug_log
 
 class SettingsEditorFrame(ctk.CTkScrollableFrame):
-    def __init__(self, master, game_path, on_back=None, **kwargs):
+    def __init__(self, master, game_path, on_back=None, model=None, **kwargs):
+        """model is a SettingsModel for game_path prepared off the UI thread
+        (see load_settings_model); without one the settings are loaded here."""
         import time
         start_time = time.time()
         debug_log(f"Creating SettingsEditorFrame for path: {game_path}")
         super().__init__(master, **kwargs)
         
-        # Reload translations to ensure we have the latest section titles
-        reload_translations()
-        
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
         self.game_path = game_path
         self.on_back = on_back  # Callback function for going back
         self.optiscaler_manager = OptiScalerManager()
         self.ini_path = os.path.join(self.game_path, "OptiScaler.ini")
+        self.model = model
         self.settings = {}
         self.widgets = {}
 
@@ -30,20 +31,17 @@ class SettingsEditorFrame(ctk.CTkScrollableFrame):
         debug_log(f"Settings loaded, creating widgets...")
         self._create_widgets()
         end_time = time.time()
-        debug_log(f"SettingsEditorFrame created successfully in {end_time - start_time:.3f} seconds")
+        total = sum(len(keys) for keys in self.settings.values())
+        debug_log(f"SettingsEditorFrame created successfully in {end_time - start_time:.3f} seconds "
+                  f"({len(self.widgets)} of {total} settings built)")
 
     def _load_settings(self):
-        if os.path.exists(self.ini_path):
-            try:
-                self.settings = self.optiscaler_manager.read_optiscaler_ini(self.ini_path)
-                debug_log(f"Loaded settings: {len(self.settings)} sections")
-            except Exception as e:
-                print(f"ERROR: Failed to read ini file: {e}")
-                self.settings = {}
-        else:
-            debug_log(f"OptiScaler.ini not found at {self.ini_path}")
+        if self.model is None:
+            # Also reloads translations to ensure we have the latest section titles
+            self.model = load_settings_model(self.ini_path, self.optiscaler_manager)
+        self.settings = self.model.settings
+        if not self.settings:
             debug_log(f"You need to install OptiScaler first")
-            self.settings = {}
 
     def _create_widgets(self):
         if not self.settings:
@@ -72,7 +70,9 @@ class SettingsEditorFrame(ctk.CTkScrollableFrame):
         back_button.grid(row=2, column=0, columnspan=2, padx=20, pady=20, sticky="ew")
         
     def _create_settings_view(self):
-        """Create the main settings view with improved layout"""
+        """Create the main settings view: one collapsible header per section.
+        A section's setting widgets are built the first time it is expanded,
+        so opening the editor only builds the headers and the first section."""
         row = 0
         
         # Title
@@ -81,70 +81,95 @@ class SettingsEditorFrame(ctk.CTkScrollableFrame):
         title_label.grid(row=row, column=0, columnspan=2, padx=10, pady=(10, 20), sticky="ew")
         row += 1
         
-        for section, keys in self.settings.items():
-            # Section header with translated title
-            section_frame = ctk.CTkFrame(self, fg_color=("gray85", "gray25"))
+        self._section_headers = {}
+        self._section_titles = {}
+        self._section_bodies = {}
+        for section in self.settings:
+            section_frame = ctk.CTkFrame(self, fg_color="transparent")
             section_frame.grid(row=row, column=0, columnspan=2, padx=10, pady=(20, 10), sticky="ew")
             section_frame.grid_columnconfigure(0, weight=1)
-            
-            # Get translated section title
-            tm = get_translation_manager()
-            section_title = tm.get_section_title(section)
-            section_label = ctk.CTkLabel(section_frame, text=section_title, 
-                                       font=("Arial", 18, "bold"))
-            section_label.grid(row=0, column=0, padx=15, pady=10, sticky="w")
-            row += 1
-
-            for key, data in keys.items():
-                # Create frame for each setting
-                setting_frame = ctk.CTkFrame(self, fg_color=("gray90", "gray20"))
-                setting_frame.grid(row=row, column=0, columnspan=2, padx=15, pady=5, sticky="ew")
-                setting_frame.grid_columnconfigure(0, weight=1)
-                
-                # Setting name
-                key_label = ctk.CTkLabel(setting_frame, text=key, 
-                                       font=("Arial", 14, "bold"))
-                key_label.grid(row=0, column=0, padx=15, pady=(10, 5), sticky="w")
 
-                # Setting description
-                description = self._get_setting_description(section, key)
-                if description:
-                    desc_text = description
-                else:
-                    desc_text = t("no_description_available")
-                
-                desc_label = ctk.CTkLabel(setting_frame, text=desc_text, 
-                                        wraplength=400, justify="left", 
-                                        font=("Arial", 12))
-                desc_label.grid(row=1, column=0, padx=15, pady=(0, 5), sticky="w")
+            # Section header with translated title; clicking it expands/collapses the section
+            header = ctk.CTkButton(section_frame, text='', font=("Arial", 18, "bold"), anchor="w", height=44,
+                                   fg_color=("gray85", "gray25"), hover_color=("gray80", "gray30"),
+                                   text_color=("gray10", "gray90"),
+                                   command=lambda s=section: self._toggle_section(s))
+            header.grid(row=0, column=0, sticky="ew")
+            self._section_titles[section] = self.model.section_title(section)
+            self._section_headers[section] = header
+            self._update_section_header(section, expanded=False)
+            row += 1
 
-                # Setting widget
-                widget = self._create_setting_widget(setting_frame, data)
-                widget.grid(row=2, column=0, padx=15, pady=(5, 15), sticky="ew")
-                
-                # Store widget reference
-                self.widgets[f"{section}.{key}"] = widget
-                row += 1
-        
         # Buttons section
         self._create_buttons(row)
-        
-    def _get_setting_description(self, section, key):
-        """Get user-friendly description for a setting using new translation system"""
-        tm = get_translation_manager()
-        return tm.get_setting_description(section, key)
+
+        # Start with the first section open
+        first = next(iter(self.settings), None)
+        if first is not None:
+            self._toggle_section(first)
+
+    def _update_section_header(self, section, expanded):
+        self._section_headers[section].configure(
+            text=f"{'▾' if expanded else '▸'}  {self._section_titles[section]}")
+
+    def _toggle_section(self, section):
+        """Expand or collapse a section, building its widgets on first expand.
+        Collapsed sections keep their widgets (and any edits) for saving."""
+        body = self._section_bodies.get(section)
+        if body is None:
+            try:
+                body = self._create_section_body(section)
+            except Exception as e:
+                debug_log(f"Failed to build settings section {section}: {e}")
+                return
+            self._section_bodies[section] = body
+            expanded = True
+        elif body.winfo_manager():
+            body.grid_remove()
+            expanded = False
+        else:
+            body.grid()
+            expanded = True
+        self._update_section_header(section, expanded)
+
+    def _create_section_body(self, section):
+        """Build the setting rows of one section below its header."""
+        header = self._section_headers[section]
+        body = ctk.CTkFrame(header.master, fg_color="transparent")
+        body.grid(row=1, column=0, pady=(10, 0), sticky="ew")
+        body.grid_columnconfigure(0, weight=1)
+
+        for row, (key, data) in enumerate(self.settings[section].items()):
+            # Create frame for each setting
+            setting_frame = ctk.CTkFrame(body, fg_color=("gray90", "gray20"))
+            setting_frame.grid(row=row, column=0, padx=5, pady=5, sticky="ew")
+            setting_frame.grid_columnconfigure(0, weight=1)
+
+            # Setting name
+            key_label = ctk.CTkLabel(setting_frame, text=key, 
+                                   font=("Arial", 14, "bold"))
+            key_label.grid(row=0, column=0, padx=15, pady=(10, 5), sticky="w")
+
+            # Setting description
+            desc_label = ctk.CTkLabel(setting_frame, text=self.model.description(section, key), 
+                                    wraplength=400, justify="left", 
+                                    font=("Arial", 12))
+            desc_label.grid(row=1, column=0, padx=15, pady=(0, 5), sticky="w")
+
+            # Setting widget
+            widget = self._create_setting_widget(setting_frame, data)
+            widget.grid(row=2, column=0, padx=15, pady=(5, 15), sticky="ew")
+
+            # Store widget reference
+            self.widgets[f"{section}.{key}"] = widget
+        return body
         
     def _create_setting_widget(self, parent, data):
         """Create appropriate widget for setting data"""
         if data["type"] == "bool_options":
             # Create user-friendly labels for true/false/auto using translation system
-            tm = get_translation_manager()
-            friendly_options = [
-                tm.get_setting_value_label("true"),    # Enabled
-                tm.get_setting_value_label("false"),   # Disabled  
-                tm.get_setting_value_label("auto")     # Auto
-            ]
-            raw_values = ["true", "false", "auto"]
+            friendly_options = list(self.model.bool_labels)  # Enabled / Disabled / Auto
+            raw_values = list(BOOL_VALUES)
             
             widget = ctk.CTkOptionMenu(parent, values=friendly_options)
             
@@ -341,19 +366,7 @@ class SettingsEditorFrame(ctk.CTkScrollableFrame):
                 vram_note = "• FP16 deaktiveret (begrænset VRAM)"
             
             # Apply settings to widgets
-            changes_made = 0
-            for setting_key, recommended_value in optimal_settings.items():
-                if setting_key in self.widgets:
-                    widget = self.widgets[setting_key]
-                    
-                    # Set recommended value
-                    if hasattr(widget, 'set'):  # OptionMenu
-                        widget.set(recommended_value)
-                        changes_made += 1
-                    elif hasattr(widget, 'delete') and hasattr(widget, 'insert'):  # Entry
-                        widget.delete(0, 'end')
-                        widget.insert(0, recommended_value)
-                        changes_made += 1
+            changes_made = self._apply_recommended(optimal_settings)
             
             # Show results
             if changes_made > 0:
@@ -422,30 +435,68 @@ class SettingsEditorFrame(ctk.CTkScrollableFrame):
             except:
                 pass
 
+    def _display_value(self, data, raw):
+        """Text a setting's widget shows for a raw INI value."""
+        if data["type"] == "bool_options":
+            raw = raw.lower()
+            return self.model.bool_labels[BOOL_VALUES.index(raw)] if raw in BOOL_VALUES else raw
+        if data["type"] == "options":
+            return data["options"].get(raw, raw)
+        return raw
+
+    def _apply_recommended(self, recommended):
+        """Apply {"Section.Key": raw value}; returns the number of settings changed.
+        Built widgets show the new value; keys of sections that were never
+        expanded get it in self.settings, which their widgets start from."""
+        changes_made = 0
+        for setting_key, recommended_value in recommended.items():
+            section, _, key = setting_key.partition('.')
+            data = self.settings.get(section, {}).get(key)
+            widget = self.widgets.get(setting_key)
+            if widget is None:
+                if data is None:
+                    continue
+                data["value"] = recommended_value
+            elif hasattr(widget, 'set'):  # OptionMenu
+                widget.set(self._display_value(data, recommended_value) if data else recommended_value)
+            elif hasattr(widget, 'delete') and hasattr(widget, 'insert'):  # Entry
+                widget.delete(0, 'end')
+                widget.insert(0, recommended_value)
+            else:
+                continue
+            changes_made += 1
+        return changes_made
+
+    def _collect_widget_values(self):
+        """Copy the built widgets' values into self.settings as raw INI values."""
+        for section, keys in self.settings.items():
+            for key, data in keys.items():
+                widget = self.widgets.get(f"{section}.{key}")
+                if widget is None:
+                    # Section never expanded: keep the value read from the file
+                    continue
+                if data["type"] == "bool_options":
+                    # Map friendly labels back to raw values using translation system
+                    selected_friendly = widget.get()
+                    tm = get_translation_manager()
+                    raw_value = tm.get_raw_value_from_label(selected_friendly)
+                    self.settings[section][key]["value"] = raw_value
+                elif data["type"] == "options":
+                    selected_option_text = widget.get()
+                    found_key = False
+                    for k, v in data["options"].items():
+                        if v == selected_option_text:
+                            self.settings[section][key]["value"] = k
+                            found_key = True
+                            break
+                    if not found_key and selected_option_text.lower() == "auto":
+                        self.settings[section][key]["value"] = "auto"
+                else:
+                    self.settings[section][key]["value"] = widget.get()
+
     def _save_settings(self):
         try:
-            for section, keys in self.settings.items():
-                for key, data in keys.items():
-                    widget = self.widgets[f"{section}.{key}"]
-                    if data["type"] == "bool_options":
-                        # Map friendly labels back to raw values using translation system
-                        selected_friendly = widget.get()
-                        tm = get_translation_manager()
-                        raw_value = tm.get_raw_value_from_label(selected_friendly)
-                        self.settings[section][key]["value"] = raw_value
-                    elif data["type"] == "options":
-                        selected_option_text = widget.get()
-                        found_key = False
-                        for k, v in data["options"].items():
-                            if v == selected_option_text:
-                                self.settings[section][key]["value"] = k
-                                found_key = True
-                                break
-                        if not found_key and selected_option_text.lower() == "auto":
-                            self.settings[section][key]["value"] = "auto"
-                    else:
-                        self.settings[section][key]["value"] = widget.get()
-            
+            self._collect_widget_values()
             self.optiscaler_manager.write_optiscaler_ini(self.ini_path, self.settings)
             
             try:
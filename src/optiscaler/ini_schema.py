@@ -0,0 +1,179 @@
+"""
+Cached OptiScaler.ini schema for OptiScaler-GUI.
+
+A setting's widget type and option map are inferred from the comment block
+above it, and those comments are identical in every game that has the same
+OptiScaler release. IniSchema keeps the inferred type, options and release
+default per setting, keyed by a hash of its section, key and comment block,
+and is persisted as JSON under config.cache_dir. It is filled once per
+release from the extracted release's OptiScaler.ini; per-game reads then only
+read values, and run type inference just for comment blocks they have not
+seen before (which are remembered, and written out a few seconds later).
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from utils.config import config
+from utils.debug import debug_log
+
+# Bump when OptiScalerManager._infer_type changes so stale schemas are dropped
+SCHEMA_VERSION = 1
+# Coalesce writes when a bulk read learns many comment blocks at once
+_SAVE_DELAY = 5.0
+
+_BOOL_VALUES = ("true", "false", "auto")
+
+
+def comment_hash(section, key, comment):
+    """Schema key of a setting: its section, key and comment block."""
+    return hashlib.sha1(f"{section}\n{key}\n{comment}".encode('utf-8')).hexdigest()
+
+
+def _is_number(value, kind):
+    try:
+        kind(value)
+        return True
+    except ValueError:
+        return False
+
+
+def fits(setting_type, options, value):
+    """True if type inference on value with the same comment block would give
+    setting_type again (the type only depends on the value in these ways)."""
+    lowered = value.lower()
+    if setting_type == "bool_options":
+        return lowered in _BOOL_VALUES
+    if setting_type == "options":
+        return value in (options or {}) and lowered not in _BOOL_VALUES
+    if setting_type == "int":
+        return _is_number(value, int)
+    if setting_type == "float":
+        return not _is_number(value, int) and _is_number(value, float)
+    return not _is_number(value, float)
+
+
+class IniSchema:
+    """Thread-safe comment hash → {type, options, default} store, plus the
+    release tags whose OptiScaler.ini has been added."""
+
+    def __init__(self, schema_path=None):
+        self.schema_path = Path(schema_path or config.optiscaler_ini_schema_path)
+        self._lock = threading.Lock()
+        # Serializes writers of the tmp file (save() may run on the timer and a worker at once)
+        self._save_lock = threading.Lock()
+        self._save_timer = None
+        self._entries = {}
+        self._releases = set()
+        self._loaded = False
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                if not self.schema_path.exists():
+                    return
+                with open(self.schema_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') != SCHEMA_VERSION:
+                    debug_log("OptiScaler.ini schema format changed; starting fresh")
+                    return
+                self._entries = dict(data.get('entries') or {})
+                self._releases = set(data.get('releases') or [])
+                debug_log(f"Loaded OptiScaler.ini schema: {len(self._entries)} settings, "
+                          f"{len(self._releases)} releases")
+            except Exception as e:
+                debug_log(f"Failed to read OptiScaler.ini schema {self.schema_path}: {e}")
+
+    def lookup(self, section, key, comment, value):
+        """(type, options) for the setting if its comment block is known and
+        value fits the cached type, else None."""
+        self._ensure_loaded()
+        entry = self._entries.get(comment_hash(section, key, comment))
+        if entry is not None and fits(entry['type'], entry['options'], value):
+            with self._lock:
+                self.hits += 1
+            options = entry['options']
+            return entry['type'], options.copy() if options else options
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def learn(self, section, key, comment, setting_type, options, default=None):
+        """Remember a setting's inferred type; an existing release default is kept."""
+        self._ensure_loaded()
+        digest = comment_hash(section, key, comment)
+        with self._lock:
+            previous = self._entries.get(digest)
+            if default is None and previous is not None:
+                default = previous.get('default')
+            self._entries[digest] = {'type': setting_type, 'options': options.copy() if options else options,
+                                     'default': default}
+            self._dirty = True
+            self._schedule_save()
+
+    def has_release(self, tag):
+        self._ensure_loaded()
+        return tag in self._releases
+
+    def add_release(self, tag, settings):
+        """Add every setting of a release's OptiScaler.ini (as read_optiscaler_ini
+        returns it), with its value as the release default."""
+        for section, keys in settings.items():
+            for key, data in keys.items():
+                self.learn(section, key, data.get('comment', ''), data['type'], data['options'],
+                           default=data['value'])
+        if tag:
+            with self._lock:
+                self._releases.add(tag)
+                self._dirty = True
+
+    def _schedule_save(self):
+        # Caller holds the lock
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(_SAVE_DELAY, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def save(self):
+        """Persist the schema if anything was learned since it was loaded or saved."""
+        self._ensure_loaded()
+        with self._save_lock:
+            with self._lock:
+                if self._save_timer is not None:
+                    self._save_timer.cancel()
+                    self._save_timer = None
+                if not self._dirty:
+                    return True
+                data = {'version': SCHEMA_VERSION, 'saved_at': int(time.time()),
+                        'releases': sorted(self._releases), 'entries': dict(self._entries)}
+                self._dirty = False
+            return self._write(data)
+
+    def _write(self, data):
+        try:
+            self.schema_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.schema_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.schema_path)
+            debug_log(f"Saved OptiScaler.ini schema: {len(data['entries'])} settings "
+                      f"({self.hits} reused, {self.misses} inferred)")
+            return True
+        except Exception as e:
+            debug_log(f"Failed to save OptiScaler.ini schema {self.schema_path}: {e}")
+            return False
+
+
+# Global instance
+ini_schema = IniSchema()
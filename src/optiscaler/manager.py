@@ -15,6 +15,7 @@ from utils.debug import debug_log
 from utils.config import config
 from utils.performance import timed
 from utils.archive_extractor import archive_extractor
+from optiscaler.ini_schema import ini_schema as shared_ini_schema
 
 # Configuration constants - moved to top for easier maintenance
 class OptiScalerConfig:
@@ -121,7 +122,7 @@ class OptiScalerManager:
     - v0.9.3: Bugfix release, archive layout identical to v0.9.2a — no installer changes needed.
       Adds LateAsiPluginsDelay INI option (picked up dynamically by the settings editor).
     """
-    def __init__(self, download_dir=None):
+    def __init__(self, download_dir=None, ini_schema=None):
         self.github_release_url = OptiScalerConfig.GITHUB_API_URL
         
         # Use configurable download directory
@@ -136,6 +137,8 @@ class OptiScalerManager:
         self._seven_zip_path = self._find_seven_zip()
         self._last_extract_error = None
         self._last_release_info = None
+        # Shared OptiScaler.ini schema cache unless the caller brings its own
+        self.ini_schema = ini_schema if ini_schema is not None else shared_ini_schema
         
         debug_log(f"OptiScalerManager initialized with download_dir: {self.download_dir}")
     
@@ -348,6 +351,7 @@ class OptiScalerManager:
         
         if success:
             debug_log(f"Extraction successful: {message}")
+            self._learn_ini_schema(extracted_path)
             return extracted_path
         else:
             self._last_extract_error = message
@@ -356,6 +360,25 @@ class OptiScalerManager:
                 progress_callback(f"Extraction failed: {message}")
             return None
     
+    def _learn_ini_schema(self, extracted_path):
+        """Add the extracted release's OptiScaler.ini to the schema cache (once per release tag)"""
+        try:
+            release_info = self._last_release_info or {}
+            tag = release_info.get("tag_name") or release_info.get("name")
+            if tag and self.ini_schema.has_release(tag):
+                return
+            extracted_path = Path(extracted_path)
+            ini_path = extracted_path / "OptiScaler.ini"
+            if not ini_path.exists():
+                ini_path = next(extracted_path.rglob("OptiScaler.ini"), None)
+            if ini_path is None:
+                debug_log("No OptiScaler.ini in extracted release; schema not updated")
+                return
+            self.ini_schema.add_release(tag, self.read_optiscaler_ini(ini_path))
+            self.ini_schema.save()
+        except Exception as e:
+            debug_log(f"Failed to update OptiScaler.ini schema: {e}")
+
     def _extract_7z(self, archive_path, extract_path, progress_callback=None):
         """Extract 7z archive using 7-Zip"""
         if not self._seven_zip_path:
@@ -1030,14 +1053,18 @@ ToggleOverlay=VK_INSERT
                         # Remove inline comments from value
                         value_without_inline_comment = value.split(';', 1)[0].strip()
                         
-                        inferred_type, options = self._infer_type(
-                            value_without_inline_comment, 
-                            "\n".join(current_comments)
-                        )
+                        comment = "\n".join(current_comments)
+                        # Same comment block as a known release: reuse its type instead of re-inferring
+                        cached = self.ini_schema.lookup(current_section, key, comment, value_without_inline_comment)
+                        if cached:
+                            inferred_type, options = cached
+                        else:
+                            inferred_type, options = self._infer_type(value_without_inline_comment, comment)
+                            self.ini_schema.learn(current_section, key, comment, inferred_type, options)
 
                         settings[current_section][key] = {
                             "value": value_without_inline_comment,
-                            "comment": "\n".join(current_comments),
+                            "comment": comment,
                             "type": inferred_type,
                             "options": options
                         }
@@ -0,0 +1,65 @@
+"""
+Ready-to-render settings model for the OptiScaler settings editor.
+
+Loading the editor means re-reading the translation files, parsing
+OptiScaler.ini, inferring each key's type from its comments and resolving
+section titles, descriptions and value labels. load_settings_model() does all
+of that without touching Tk, so it can run on a worker thread while the
+progress overlay animates; the editor then only builds widgets from the
+model on the UI thread.
+"""
+import os
+from utils.debug import debug_log
+from utils.translation_manager import get_translation_manager, reload_translations, t
+
+# Raw values of bool_options settings, in the order they are offered
+BOOL_VALUES = ("true", "false", "auto")
+
+
+class SettingsModel:
+    """Parsed settings plus every translated string the editor shows for them."""
+
+    def __init__(self, ini_path, settings=None, section_titles=None, descriptions=None, bool_labels=None):
+        self.ini_path = ini_path
+        # section → key → {"value", "comment", "type", "options"} as read_optiscaler_ini returns it
+        self.settings = settings or {}
+        self.section_titles = section_titles or {}
+        # "section.key" → description text
+        self.descriptions = descriptions or {}
+        # Friendly labels for BOOL_VALUES, in the same order
+        self.bool_labels = bool_labels or list(BOOL_VALUES)
+
+    def section_title(self, section):
+        return self.section_titles.get(section, section)
+
+    def description(self, section, key):
+        return self.descriptions.get(f"{section}.{key}", "")
+
+
+def load_settings_model(ini_path, manager=None):
+    """Build the SettingsModel for ini_path (an empty model when OptiScaler is
+    not installed there). Safe to call off the UI thread."""
+    # Pick up translation edits made since startup
+    reload_translations()
+    tm = get_translation_manager()
+    model = SettingsModel(ini_path, bool_labels=[tm.get_setting_value_label(v) for v in BOOL_VALUES])
+
+    if not os.path.exists(ini_path):
+        debug_log(f"OptiScaler.ini not found at {ini_path}")
+        return model
+    try:
+        if manager is None:
+            from optiscaler.manager import OptiScalerManager
+            manager = OptiScalerManager()
+        model.settings = manager.read_optiscaler_ini(ini_path)
+    except Exception as e:
+        debug_log(f"ERROR: Failed to read ini file: {e}")
+        return model
+
+    no_description = t("no_description_available")
+    for section, keys in model.settings.items():
+        model.section_titles[section] = tm.get_section_title(section)
+        for key in keys:
+            model.descriptions[f"{section}.{key}"] = tm.get_setting_description(section, key) or no_description
+    debug_log(f"Loaded settings model: {len(model.settings)} sections")
+    return model
@@ -0,0 +1,361 @@
+"""
+Local artwork providers for OptiScaler-GUI.
+
+A provider finds artwork a launcher already keeps on disk for a game and
+returns the source image path (or None). GameScanner.fetch_game_image asks
+the providers before any network lookup and stores what they find in the
+game image cache, so installed games get thumbnails without HTTP round trips.
+Providers marked after_network only stand in when the network lookup finds
+nothing.
+
+Providers declare which game platforms they serve (None = any) and whether
+they need a Steam AppID; the chain is tried in order by find_local_artwork.
+- SteamLibraryCacheProvider: <steam>/appcache/librarycache (needs an AppID)
+- HeroicArtworkProvider:     art cached by Heroic under its config root
+- XboxManifestProvider:      logo assets named in the package AppxManifest.xml
+- GogIconProvider:           icons shipped next to goggame-*.info (after_network)
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+from utils.debug import debug_log
+
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.bmp', '.ico')
+
+
+class _ArtworkProvider:
+    """Base class: name for logging, platforms served (None = all), AppID
+    requirement, and whether it is only a fallback for missing store art."""
+
+    name = "local"
+    platforms = None
+    needs_appid = False
+    after_network = False
+
+    def handles(self, game, appid):
+        if self.needs_appid and not appid:
+            return False
+        if self.platforms is None:
+            return True
+        return game is not None and getattr(game, 'platform', None) in self.platforms
+
+    def find(self, game_name, appid=None, game=None):
+        raise NotImplementedError
+
+
+class SteamLibraryCacheProvider(_ArtworkProvider):
+    """Steam's own artwork cache: <steam>/appcache/librarycache.
+
+    Older clients store flat files ({appid}_header.jpg, {appid}_library_600x900.jpg);
+    newer ones use a folder per app ({appid}/header.jpg, sometimes one hashed
+    subfolder deeper). The directory holds art for every owned app, so it is
+    listed once (refreshed every few minutes) instead of probing files per game."""
+
+    name = "steam-librarycache"
+    needs_appid = True
+    # Preferred images, landscape first: list rows show a wide thumbnail
+    _IMAGES = ("header.jpg", "capsule_616x353.jpg", "library_hero.jpg", "capsule_231x87.jpg",
+               "library_600x900.jpg")
+    _LISTING_TTL = 300
+
+    def __init__(self, steam_paths):
+        self._steam_paths = steam_paths  # callable returning the Steam install dirs
+        self._listings = {}              # librarycache dir → (listed_at, set of entry names)
+        self._lock = threading.Lock()
+
+    def _listing(self, cache_dir):
+        with self._lock:
+            cached = self._listings.get(cache_dir)
+            if cached and time.monotonic() - cached[0] < self._LISTING_TTL:
+                return cached[1]
+        try:
+            names = set(os.listdir(cache_dir))
+        except OSError:
+            names = set()
+        with self._lock:
+            self._listings[cache_dir] = (time.monotonic(), names)
+        return names
+
+    def find(self, game_name, appid=None, game=None):
+        if not appid:
+            return None
+        appid = str(appid)
+        for steam_path in self._steam_paths() or ():
+            cache_dir = os.path.join(steam_path, 'appcache', 'librarycache')
+            names = self._listing(cache_dir)
+            if not names:
+                continue
+            for image in self._IMAGES:
+                if f"{appid}_{image}" in names:
+                    return os.path.join(cache_dir, f"{appid}_{image}")
+            if appid in names:
+                found = self._find_in_app_dir(Path(cache_dir) / appid)
+                if found:
+                    return found
+        return None
+
+    def _find_in_app_dir(self, app_dir):
+        try:
+            entries = list(os.scandir(app_dir))
+        except OSError:
+            return None
+        files = {e.name for e in entries if e.is_file()}
+        for image in self._IMAGES:
+            if image in files:
+                return str(app_dir / image)
+        for entry in entries:
+            if entry.is_dir():
+                try:
+                    sub_files = set(os.listdir(entry.path))
+                except OSError:
+                    continue
+                for image in self._IMAGES:
+                    if image in sub_files:
+                        return os.path.join(entry.path, image)
+        return None
+
+
+class HeroicArtworkProvider(_ArtworkProvider):
+    """Art Heroic Games Launcher already downloaded for its library.
+
+    Heroic's store caches (store_cache/*_library.json, sideload_apps/library.json)
+    list art_cover/art_square/... URLs per title, and the images it has shown are
+    kept in <root>/images-cache named by the SHA-256 of the URL. Sideloaded apps
+    may point straight at a local file."""
+
+    name = "heroic"
+    platforms = ("Heroic",)
+    _ART_KEYS = ("art_cover", "art_background", "art_square", "art_logo")
+    _LIBRARY_FILES = (
+        Path("store_cache") / "legendary_library.json",
+        Path("store_cache") / "gog_library.json",
+        Path("store_cache") / "nile_library.json",
+        Path("gog_store") / "library.json",
+        Path("sideload_apps") / "library.json",
+    )
+    _INDEX_TTL = 300
+
+    def __init__(self, config_roots):
+        self._config_roots = config_roots  # callable returning Heroic config roots
+        self._index = None                 # (built_at, {title or path key: [(root, art url)]})
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entries(data):
+        if isinstance(data, list):
+            return data
+        if isinstance(data, dict):
+            for key in ("library", "games"):
+                if isinstance(data.get(key), list):
+                    return data[key]
+        return []
+
+    def _build_index(self):
+        index = {}
+        for root in self._config_roots() or ():
+            root = Path(root)
+            for rel in self._LIBRARY_FILES:
+                try:
+                    with open(root / rel, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, ValueError):
+                    continue
+                for entry in self._entries(data):
+                    if not isinstance(entry, dict):
+                        continue
+                    urls = [entry[k] for k in self._ART_KEYS if isinstance(entry.get(k), str) and entry[k]]
+                    if not urls:
+                        continue
+                    keys = []
+                    if entry.get("title"):
+                        keys.append(_title_key(entry["title"]))
+                    install = entry.get("install") if isinstance(entry.get("install"), dict) else {}
+                    for folder in (install.get("install_path"), entry.get("folder_name")):
+                        if folder:
+                            keys.append(_path_key(folder))
+                    for key in keys:
+                        index.setdefault(key, []).extend((root, url) for url in urls)
+        return index
+
+    def _lookup(self, keys):
+        with self._lock:
+            if self._index is None or time.monotonic() - self._index[0] >= self._INDEX_TTL:
+                self._index = (time.monotonic(), self._build_index())
+            index = self._index[1]
+        for key in keys:
+            if key in index:
+                return index[key]
+        return []
+
+    def find(self, game_name, appid=None, game=None):
+        keys = []
+        if game is not None and getattr(game, 'path', None):
+            keys.append(_path_key(game.path))
+        keys.append(_title_key(game_name))
+        for root, url in self._lookup(keys):
+            local = _local_file(url)
+            if local:
+                return local
+            cached = root / "images-cache" / hashlib.sha256(url.encode('utf-8')).hexdigest()
+            for candidate in (cached, *(cached.with_suffix(ext) for ext in _IMAGE_EXTENSIONS)):
+                if candidate.is_file():
+                    return str(candidate)
+        return None
+
+
+class XboxManifestProvider(_ArtworkProvider):
+    """Logo assets shipped inside Xbox / Microsoft Store packages.
+
+    AppxManifest.xml (in the package folder, or Content/ under C:\\XboxGames)
+    names the tile and splash images; the files on disk usually carry MRT
+    qualifiers (Logo.scale-200.png), so the largest matching variant is used."""
+
+    name = "xbox-manifest"
+    platforms = ("Xbox",)
+    # Landscape art first: list rows show a wide thumbnail
+    _ATTRIBUTES = ("Wide310x150Logo", "Square310x310Logo", "Square150x150Logo", "Image", "Square44x44Logo")
+    _QUALIFIER = re.compile(r'\.(?:[a-z]+-[\w-]+)(?:_[a-z]+-[\w-]+)*$', re.IGNORECASE)
+
+    def find(self, game_name, appid=None, game=None):
+        if game is None or not getattr(game, 'path', None):
+            return None
+        folder = Path(game.path)
+        for package_dir in (folder, folder / "Content"):
+            manifest = self._manifest(package_dir)
+            if manifest is None:
+                continue
+            for relative in self._asset_names(manifest):
+                found = self._resolve_asset(package_dir, relative)
+                if found:
+                    return found
+        return None
+
+    @staticmethod
+    def _manifest(package_dir):
+        try:
+            for entry in os.scandir(package_dir):
+                if entry.name.lower() == 'appxmanifest.xml' and entry.is_file():
+                    return entry.path
+        except OSError:
+            pass
+        return None
+
+    def _asset_names(self, manifest):
+        try:
+            root = ET.parse(manifest).getroot()
+        except (OSError, ET.ParseError) as e:
+            debug_log(f"Unreadable AppxManifest {manifest}: {e}")
+            return []
+        found = {}
+        logo = None
+        for element in root.iter():
+            tag = element.tag.rsplit('}', 1)[-1]
+            if tag == 'Logo' and element.text and logo is None:
+                logo = element.text.strip()
+            for attr in self._ATTRIBUTES:
+                value = element.get(attr)
+                if value and attr not in found:
+                    found[attr] = value
+        names = [found[attr] for attr in self._ATTRIBUTES if attr in found]
+        if logo:
+            names.append(logo)
+        return names
+
+    def _resolve_asset(self, package_dir, relative):
+        path = package_dir / Path(relative.replace('\\', '/'))
+        if path.is_file():
+            return str(path)
+        # Assets\Logo.png is stored as Assets\Logo.scale-200.png (and friends)
+        try:
+            entries = list(os.scandir(path.parent))
+        except OSError:
+            return None
+        stem, suffix = path.stem.lower(), path.suffix.lower()
+        best, best_size = None, -1
+        for entry in entries:
+            base, ext = os.path.splitext(entry.name)
+            if ext.lower() != suffix or self._QUALIFIER.sub('', base).lower() != stem:
+                continue
+            try:
+                size = entry.stat().st_size
+            except OSError:
+                continue
+            if size > best_size:
+                best, best_size = entry.path, size
+        return best
+
+
+class GogIconProvider(_ArtworkProvider):
+    """Icons GOG installers place in the game folder (goggame-<id>.ico and
+    friends). They are small, so they only stand in for missing store art."""
+
+    name = "gog-icon"
+    platforms = ("GOG",)
+    after_network = True
+    _NAMES = ("support/icon.png", "icon.png", "gfw_high.ico", "goggame.ico")
+
+    def find(self, game_name, appid=None, game=None):
+        if game is None or not getattr(game, 'path', None):
+            return None
+        folder = Path(game.path)
+        try:
+            names = os.listdir(folder)
+        except OSError:
+            return None
+        info_ids = [n[len('goggame-'):-len('.info')] for n in names
+                    if n.lower().startswith('goggame-') and n.lower().endswith('.info')]
+        lowered = {n.lower(): n for n in names}
+        for game_id in info_ids:
+            for ext in ('.png', '.ico'):
+                name = lowered.get(f"goggame-{game_id}{ext}".lower())
+                if name:
+                    return str(folder / name)
+        for relative in self._NAMES:
+            candidate = folder / relative
+            if candidate.is_file():
+                return str(candidate)
+        return None
+
+
+def _title_key(title):
+    return ' '.join(re.sub(r'[^\w]+', ' ', str(title).lower()).split())
+
+
+def _path_key(path):
+    return 'path:' + os.path.normpath(str(path)).lower()
+
+
+def _local_file(url):
+    """A local image path from a file:// URL or plain path, or None for web URLs."""
+    parsed = urlparse(url)
+    if parsed.scheme == 'file':
+        path = unquote(parsed.path)
+        if re.match(r'^/[A-Za-z]:', path):
+            path = path[1:]
+    elif len(parsed.scheme) <= 1:
+        path = url  # plain path (a single-letter "scheme" is a Windows drive)
+    else:
+        return None
+    return path if os.path.isfile(path) else None
+
+
+def find_local_artwork(providers, game_name, appid=None, game=None):
+    """Ask each provider that handles this game in order; returns
+    (provider name, image path) or (None, None)."""
+    for provider in providers:
+        if not provider.handles(game, appid):
+            continue
+        try:
+            path = provider.find(game_name, appid, game)
+        except Exception as e:
+            debug_log(f"Artwork provider {provider.name} failed for {game_name}: {e}")
+            continue
+        if path:
+            return provider.name, path
+    return None, None
@@ -0,0 +1,114 @@
+"""
+Data-driven detection rules for OptiScaler-GUI.
+
+Engine, anti-cheat and OptiScaler indicators live in data/detection_rules.json
+and are compiled once into combined regular expressions, so detecting a game
+is one regex pass over each FolderFacts name list however many rules exist.
+Adding an engine or anti-cheat is a data change.
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from utils.debug import debug_log
+
+RULES_PATH = Path(__file__).parent.parent / 'data' / 'detection_rules.json'
+
+# FolderFacts name lists an engine rule may match against
+ENGINE_FIELDS = ('top_files', 'top_dirs', 'probe_dirs')
+
+
+class DetectionRules:
+    """Compiled form of detection_rules.json.
+
+    Engine rules are ordered regexes matched against whole lowercase names (so
+    patterns are written in lowercase); the first rule matching any name wins.
+    Anti-cheat rules are case-insensitive substrings; every rule with a pattern
+    occurring in any name is reported, in rule order. Rules with "alias_of" are
+    alternate display names for another rule and are skipped by shallow detection.
+    """
+
+    def __init__(self, data):
+        data = data or {}
+        self.version = data.get('version', 0)
+        self.fingerprint = hashlib.sha1(
+            json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+
+        self.engine_names = [rule['name'] for rule in data.get('engines', [])]
+        self._engine_regex = {}
+        self._engine_groups = {}
+        for field in ENGINE_FIELDS:
+            alternatives = []
+            for index, rule in enumerate(data.get('engines', [])):
+                for k, pattern in enumerate(rule.get(field, [])):
+                    group = f"e{index}_{k}"
+                    self._engine_groups[group] = index
+                    alternatives.append(f"(?P<{group}>{pattern})")
+            if alternatives:
+                # One name per line; ordered alternation + $ picks the first
+                # rule that matches the whole name
+                self._engine_regex[field] = re.compile(
+                    "^(?:" + "|".join(alternatives) + ")$", re.MULTILINE)
+
+        ac_rules = data.get('anti_cheat', [])
+        self.anti_cheat_names = [rule['name'] for rule in ac_rules]
+        self._ac_is_alias = [bool(rule.get('alias_of')) for rule in ac_rules]
+        pattern_rules = {}
+        for index, rule in enumerate(ac_rules):
+            for pattern in rule.get('patterns', []):
+                pattern_rules.setdefault(pattern.lower(), set()).add(index)
+        patterns = sorted(pattern_rules, key=len, reverse=True)
+        # Longest-first lookahead reports the longest pattern starting at each
+        # position; every shorter pattern starting there is one of its prefixes,
+        # so each pattern's rules include those of all patterns it contains.
+        self._ac_rules_by_match = {
+            p: set().union(*(pattern_rules[q] for q in patterns if q in p)) for p in patterns
+        }
+        self._ac_regex = re.compile(
+            "(?=(" + "|".join(re.escape(p) for p in patterns) + "))") if patterns else None
+
+        optiscaler = data.get('optiscaler', {})
+        self.optiscaler_files = list(optiscaler.get('indicator_files', []))
+        self.optiscaler_subdirs = list(optiscaler.get('subdirs', []))
+
+    @classmethod
+    def load(cls, path=None):
+        """Load and compile the rules file; empty rules (logged) if it can't be read."""
+        path = Path(path or RULES_PATH)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f))
+        except Exception as e:
+            debug_log(f"Failed to load detection rules from {path}: {e}")
+            return cls({})
+
+    def match_engine(self, names_by_field):
+        """Return the first engine whose rules match, or None.
+        names_by_field maps ENGINE_FIELDS keys to lowercase name lists."""
+        best = None
+        for field, regex in self._engine_regex.items():
+            names = names_by_field.get(field)
+            if not names:
+                continue
+            for m in regex.finditer("\n".join(names)):
+                index = self._engine_groups[m.lastgroup]
+                if best is None or index < best:
+                    best = index
+                    if best == 0:
+                        return self.engine_names[0]
+        return self.engine_names[best] if best is not None else None
+
+    def match_anti_cheat(self, names, include_aliases=True):
+        """Return anti-cheat rule names whose patterns occur in any of the
+        lowercase names, in rule order."""
+        if self._ac_regex is None or not names:
+            return []
+        hit = set()
+        for m in self._ac_regex.finditer("\n".join(names)):
+            hit |= self._ac_rules_by_match[m.group(1)]
+        return [name for index, name in enumerate(self.anti_cheat_names)
+                if index in hit and (include_aliases or not self._ac_is_alias[index])]
+
+
+# Global rules instance, compiled once at import
+detection_rules = DetectionRules.load()
@@ -1,5 +1,7 @@
 import concurrent.futures
+import functools
 import os
+import queue
 import threading
 import vdf
 import requests
@@ -11,7 +13,19 @@ import time
 from pathlib import Path
 from utils.config import config
 from scanner.library_discovery import get_game_libraries, compute_library_summary
+from scanner.scan_index import ScanIndex, walk_signature
+from scanner import scan_snapshot
+from scanner.scan_scheduler import ScanScheduler, drive_key
+from scanner.detection_rules import detection_rules
+from scanner.steam_app_index import SteamAppIndex, normalize_name, name_tokens, open_index, write_index
+from scanner.steamspy_catalogue import SteamSpyCatalogue
+from scanner.artwork_providers import (SteamLibraryCacheProvider, HeroicArtworkProvider, XboxManifestProvider,
+                                       GogIconProvider, find_local_artwork)
 from utils.cache_manager import cache_manager
+from utils.image_cache_index import image_index_for
+from utils.negative_cache import NegativeCache
+from utils.download_scheduler import DownloadScheduler, configure_session
+from utils.single_flight import SingleFlight
 from utils.performance import timed
 from utils.debug import debug_log
 from utils.compatibility_checker import compatibility_checker
@@ -30,26 +44,107 @@ class Game:
         self.anti_cheat_list = anti_cheat_list or []
         self.community_verified = community_verified
 
+    # Fields persisted in the scan snapshot (see scanner.scan_snapshot)
+    _PERSISTED = ("name", "path", "appid", "image_path", "optiscaler_installed", "engine",
+                  "anti_cheat_list", "community_verified", "engine_supported", "platform")
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self._PERSISTED}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls._PERSISTED if name in data})
+
+def apply_game_updates(changed):
+    """Apply the (game, {field: value}) updates from GameScanner.revalidate_snapshot
+    on the thread that renders the games. Returns the updated games."""
+    for game, updates in changed:
+        for name, value in updates.items():
+            setattr(game, name, value)
+    return [game for game, _ in changed]
+
 class FolderFacts:
     """Facts gathered in one bounded directory walk, shared by all per-game detectors
     (game-folder check, engine detection, anti-cheat detection, OptiScaler detection)
-    so each game folder is traversed exactly once per scan."""
-    __slots__ = ("root", "top_files", "top_dirs", "depth1_files", "file_count",
-                 "found_exe", "found_game_content")
+    so each game folder is traversed exactly once per scan.
+    Persisted in the scan index (see scanner.scan_index) together with the
+    directory signature they were derived from and the detector results."""
+    __slots__ = ("root", "top_files", "top_dirs", "depth1_files", "probe_files", "file_count",
+                 "found_exe", "found_game_content", "signature", "recorded_at", "detected")
+
+    # Fields round-tripped through the scan index (root is the index key)
+    _PERSISTED = ("top_files", "top_dirs", "depth1_files", "probe_files", "file_count",
+                  "found_exe", "found_game_content", "signature", "recorded_at", "detected")
 
     def __init__(self, root):
         self.root = Path(root)
         self.top_files = []      # lowercase file names directly in the folder
         self.top_dirs = []       # lowercase directory names directly in the folder
         self.depth1_files = []   # lowercase file names in direct child directories
+        self.probe_files = {}    # existing probe dir ('engine/binaries/win64', 'mods', ...) → lowercase file names
         self.file_count = 0
         self.found_exe = False
         self.found_game_content = False
+        self.signature = None    # [['.', mtime_ns, inode], [rel_dir, mtime_ns], ...] the facts were derived from
+        self.recorded_at = 0     # time.time_ns() when the walk started
+        self.detected = {}       # memoized detector results: optiscaler / engine / anti_cheat
+
+    def to_dict(self):
+        data = {name: getattr(self, name) for name in self._PERSISTED}
+        data["root"] = str(self.root)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        facts = cls(data["root"])
+        for name in cls._PERSISTED:
+            if name in data:
+                setattr(facts, name, data[name])
+        facts.detected = dict(facts.detected or {})
+        return facts
 
 
 # File suffixes that indicate significant game content (see _is_game_folder)
 _GAME_CONTENT_SUFFIXES = (".pak", ".uasset", ".dll", ".bin", ".unity3d")
 
+# Unreal Engine binaries directory relative to the game root, in FolderFacts.probe_files form
+_UNREAL_BINARIES_DIR = "engine/binaries/win64"
+
+
+def _list_dir(path):
+    """One os.scandir pass: (file names, child directory DirEntries).
+    Classification uses the DirEntry type cache, so no per-entry stat."""
+    files, dirs = [], []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                dirs.append(entry)
+            else:
+                files.append(entry.name)
+    return files, dirs
+
+
+class _ScanPass:
+    """State of one scan pass, handed to its sources: the Steam common/ roots
+    already claimed (normalized paths), so overlapping discovery sources never
+    scan the same library twice."""
+
+    def __init__(self):
+        self._steam_roots = set()
+        self._lock = threading.Lock()
+
+    def claim_steam_root(self, key):
+        """True for the first source to claim key in this pass."""
+        with self._lock:
+            if key in self._steam_roots:
+                return False
+            self._steam_roots.add(key)
+            return True
+
 
 class GameScanner:
     def __init__(self):
@@ -73,31 +168,50 @@ class GameScanner:
         except Exception as e:
             debug_log(f"Failed to load community-verified game list: {e}")
         self.no_image_path = config.no_image_path
+        # Games known to have no downloadable artwork (checked before any image request)
+        self.artwork_misses = NegativeCache(config.artwork_miss_cache_path)
+        # De-duplicate concurrent downloads per AppID and lookups per name
+        self._image_flights = SingleFlight()
+        self._appid_flights = SingleFlight()
+        # Launcher artwork already on disk, consulted before any image download
+        self.artwork_providers = [
+            SteamLibraryCacheProvider(lambda: self.steam_paths),
+            HeroicArtworkProvider(self._find_heroic_config_roots),
+            XboxManifestProvider(),
+            GogIconProvider(),
+        ]
         # session for requests to enable keep-alive and connection pooling
         self._requests_session = requests.Session()
+        # Artwork downloads: own prioritized pool with per-host request caps
+        # (see utils.download_scheduler); the connection pool is sized so each
+        # concurrent request to a host (or SteamSpy page worker) keeps a connection
+        self.download_scheduler = DownloadScheduler(config.concurrent_downloads, config.downloads_per_host)
+        configure_session(self._requests_session, max(config.downloads_per_host, config.steamspy_workers))
         # Callback invoked after the background Steam app list load completes.
         # Set by game_list_frame to schedule a thumbnail retry pass.
         self.on_app_list_ready = None
-        # Token index over steam_app_list for _get_appid_from_name subset matching.
-        # Built lazily on first lookup (off the main thread) and rebuilt when the
-        # app list changes (dirty flag).
-        self._steam_index_lock = threading.Lock()
-        self._steam_index_dirty = True
-        self._steam_token_index = {}
-        self._steam_key_token_counts = {}
-        self._appid_lookup_cache = {}
-        # App list starts empty and is filled by a background thread so app
-        # startup never blocks on manifest parsing or the 50k-entry disk cache.
-        # Image lookups before it's ready get placeholders; the on_app_list_ready
-        # retry pass fills them in.
-        self.steam_app_list = {}
-        self._normalized_steam_app_map = {}
+        # Callback invoked with the games whose OptiScaler status changed after
+        # refresh_install_status. Set by game_list_frame to patch those rows.
+        self.on_games_changed = None
+        # Name→AppID index (exact names, normalized names and name tokens; see
+        # scanner.steam_app_index). Starts empty and is filled by a background
+        # thread: normally it just maps the on-disk index. Image lookups before
+        # it's ready get placeholders; the on_app_list_ready retry pass fills them in.
+        self.steam_app_index = SteamAppIndex.from_mapping({})
+        # Lowercase names matched against an index that wasn't the whole
+        # catalogue (local manifests, a download in progress or cut short);
+        # the retry pass resolves them again once the full catalogue is in
+        self._provisional_appids = set()
+        self._provisional_lock = threading.Lock()
         threading.Thread(target=self._init_app_list_async, daemon=True).start()
         # Summary and timing info for last library discovery
         self.last_library_summary = None
         self.last_library_scan_seconds = None
         # Cached results from the last scan (to avoid unnecessary rescans)
         self._cached_games = None
+        # Games from the persisted snapshot of the previous session (load_snapshot)
+        self._snapshot_games = None
+        self._snapshot_path = config.scan_snapshot_path
 
         # Common non-game folder names to exclude
         self.exclude_folders = [
@@ -113,9 +227,14 @@ class GameScanner:
             r".*launcher\.exe$",
             r".*\d+\.exe$",  # e.g., game_1.exe
         ]
-        # Steam common/ roots already scanned this scan pass (normalized paths),
-        # so overlapping discovery sources never scan the same library twice
-        self._scanned_steam_roots = set()
+        # One scan pass at a time: the startup revalidation and a manual refresh
+        # share the scan index, the cached result and the snapshot
+        self._scan_pass_lock = threading.Lock()
+        # Persistent folder → FolderFacts index; unchanged folders skip the walk
+        self._scan_index = ScanIndex(factory=FolderFacts.from_dict)
+        # Shared bounded worker pool for per-folder scan work (created on first use)
+        self._scan_scheduler = None
+        self._scan_scheduler_lock = threading.Lock()
 
     def _find_steam_paths(self):
         """Find Steam installation paths using Path objects"""
@@ -283,7 +402,9 @@ class GameScanner:
         """Scan Heroic Launcher configs for installed Epic/GOG/Amazon/sideloaded games."""
         games = []
         seen_paths = set()
+        futures = []
         try:
+            scheduler = self._get_scan_scheduler()
             for root in self._find_heroic_config_roots():
                 for title, install_path in self._heroic_installed_entries(root):
                     try:
@@ -291,64 +412,94 @@ class GameScanner:
                         normalized = os.path.normpath(str(p)).lower()
                         if normalized in seen_paths:
                             continue
-                        if not p.is_dir():
-                            continue
-                        facts = self._collect_folder_facts(p)
-                        if not self._is_game_folder(p, facts):
-                            continue
                         seen_paths.add(normalized)
-                        game_name = title or p.name.replace("_", " ").replace("-", " ")
-                        optiscaler_installed = self._detect_optiscaler(p, facts)
-                        safety = self.analyze_game_safety(Game(game_name, str(p)), facts)
-                        games.append(Game(
-                            name=game_name,
-                            path=str(p),
-                            image_path=None,
-                            optiscaler_installed=optiscaler_installed,
-                            engine=safety["engine"],
-                            anti_cheat_list=safety["anti_cheat_list"],
-                            community_verified=safety["community_verified"],
-                            engine_supported=safety.get("engine_supported", True),
-                            platform="Heroic"
-                        ))
-                        debug_log(f"Heroic: found '{game_name}' at {p}")
+                        futures.append(scheduler.submit(drive_key(p), self._process_heroic_entry, title, p))
                     except Exception as e:
                         debug_log(f"Heroic: failed processing entry {install_path}: {e}")
+            games = self._collect_results(futures)
         except Exception as e:
             debug_log(f"Heroic scan failed: {e}")
         return games
 
-    # OptiScaler indicator files checked by _detect_optiscaler
-    OPTISCALER_INDICATOR_FILES = [
-        'nvngx_dlss.dll',     # Common OptiScaler DLL
-        'nvngx_dlssg.dll',    # DLSS-G version
-        'OptiScaler.dll',     # Direct OptiScaler
-        'nvngx.dll',          # NVIDIA proxy
-        'dxgi.dll',           # DirectX proxy
-        'winmm.dll',          # Windows multimedia proxy
-    ]
-    OPTISCALER_SUBDIRS = ["D3D12_Optiscaler", "OptiScaler", "mods", "plugins"]
+    def _process_heroic_entry(self, title, p):
+        """Build a Game for one Heroic install path, or None if it isn't a game folder."""
+        try:
+            if not p.is_dir():
+                return None
+            facts = self._collect_folder_facts(p)
+            if not self._is_game_folder(p, facts):
+                return None
+            game_name = title or p.name.replace("_", " ").replace("-", " ")
+            optiscaler_installed = self._detect_optiscaler(p, facts)
+            safety = self.analyze_game_safety(Game(game_name, str(p)), facts)
+            debug_log(f"Heroic: found '{game_name}' at {p}")
+            return Game(
+                name=game_name,
+                path=str(p),
+                image_path=None,
+                optiscaler_installed=optiscaler_installed,
+                engine=safety["engine"],
+                anti_cheat_list=safety["anti_cheat_list"],
+                community_verified=safety["community_verified"],
+                engine_supported=safety.get("engine_supported", True),
+                platform="Heroic"
+            )
+        except Exception as e:
+            debug_log(f"Heroic: failed processing entry {p}: {e}")
+            return None
+
+    # OptiScaler indicator files and subdirectories checked by _detect_optiscaler
+    # (defined in data/detection_rules.json)
+    OPTISCALER_INDICATOR_FILES = detection_rules.optiscaler_files
+    OPTISCALER_SUBDIRS = detection_rules.optiscaler_subdirs
+
+    def _probe_dirs(self):
+        """Directories the detectors look inside, in FolderFacts.probe_files form:
+        the OptiScaler subdirs, the Unreal binaries dir and its OptiScaler subdirs."""
+        subdirs = [s.lower() for s in self.OPTISCALER_SUBDIRS]
+        return subdirs + [_UNREAL_BINARIES_DIR] + [f"{_UNREAL_BINARIES_DIR}/{s}" for s in subdirs]
+
+    @staticmethod
+    def _memo_detection(facts, key, detect):
+        """Run detect() once per FolderFacts; the result is persisted with the
+        facts in the scan index, so unchanged folders skip detection entirely."""
+        if facts is None:
+            return detect()
+        if key not in facts.detected:
+            facts.detected[key] = detect()
+        return facts.detected[key]
 
     def _detect_optiscaler(self, game_path, facts=None):
         """Detect if OptiScaler is installed in a game directory.
         When FolderFacts are provided, root-level checks use the already-collected
-        file listing instead of per-file exists() probes."""
+        file listing instead of per-file exists() probes, and the result is
+        memoized on the facts."""
+        return self._memo_detection(facts, 'optiscaler',
+                                    lambda: self._probe_optiscaler(game_path, facts))
+
+    def _probe_optiscaler(self, game_path, facts=None):
+        """OptiScaler detection without memoization (see _detect_optiscaler)."""
         try:
             game_path = Path(game_path)
             optiscaler_files = self.OPTISCALER_INDICATOR_FILES
 
-            # Root-level indicator files (from facts when available)
             if facts is not None:
-                if any(f.lower() in facts.top_files for f in optiscaler_files):
-                    debug_log(f"Found OptiScaler indicator file in {game_path}")
-                    return True
-                subdirs_present = [s for s in self.OPTISCALER_SUBDIRS if s.lower() in facts.top_dirs]
-            else:
-                for file_name in optiscaler_files:
-                    if (game_path / file_name).exists():
-                        debug_log(f"Found OptiScaler indicator file: {file_name} in {game_path}")
+                # The folder walk captured the root, OptiScaler subdir and Unreal
+                # binaries listings, so this needs no filesystem access at all
+                indicators = [f.lower() for f in optiscaler_files]
+                for rel in [''] + self._probe_dirs():
+                    names = facts.top_files if rel == '' else facts.probe_files.get(rel)
+                    if names and any(f in names for f in indicators):
+                        debug_log(f"Found OptiScaler indicator file in {game_path}/{rel}")
                         return True
-                subdirs_present = self.OPTISCALER_SUBDIRS
+                return False
+
+            # Root-level indicator files
+            for file_name in optiscaler_files:
+                if (game_path / file_name).exists():
+                    debug_log(f"Found OptiScaler indicator file: {file_name} in {game_path}")
+                    return True
+            subdirs_present = self.OPTISCALER_SUBDIRS
 
             # Check common OptiScaler subdirectories in the game root
             for subdir in subdirs_present:
@@ -383,34 +534,30 @@ class GameScanner:
     def _detect_engine_type(self, game_path: Path, facts=None) -> str:
         """Detect common engine types for a game folder (Unreal, Unity, Custom).
         Reuses a FolderFacts walk when the caller has one."""
+        if facts is None:
+            facts = self._collect_folder_facts(Path(game_path))
+        if facts is None:
+            # Unreadable folder: the Unreal probe is still meaningful
+            return self._probe_engine_type(game_path, None)
+        return self._memo_detection(facts, 'engine',
+                                    lambda: self._probe_engine_type(game_path, facts))
+
+    def _probe_engine_type(self, game_path, facts):
+        """Engine detection without memoization (see _detect_engine_type)."""
         try:
             game_path = Path(game_path)
-            # Unreal Engine detection
-            if (game_path / 'Engine' / 'Binaries' / 'Win64').exists():
-                return 'Unreal'
-            if facts is None:
-                facts = self._collect_folder_facts(game_path)
             if facts is None:
+                # Unreadable folder: only the Unreal probe is meaningful
+                if (game_path / 'Engine' / 'Binaries' / 'Win64').exists():
+                    return 'Unreal'
                 return 'Unknown'
-            # Unity detection: presence of UnityPlayer.dll or Assets folder
-            if 'unityplayer.dll' in facts.top_files or 'assets' in facts.top_dirs:
-                return 'Unity'
-            # Godot detection: project file or .import folder
-            if any(f.endswith('.godot') for f in facts.top_files) or '.import' in facts.top_dirs:
-                return 'Godot'
-            # Prism3D detection: check top-level exes, dlls and known SCS/EU/ATS patterns
-            for name in facts.top_files:
-                if name.endswith('.exe'):
-                    if 'prism' in name or ('euro' in name and 'truck' in name) or 'ats' in name or 'eurotruck' in name.replace(' ', ''):
-                        return 'Prism3D'
-                elif name.endswith('.dll'):
-                    if 'prism' in name or 'prism3d' in name or 'scs' in name:
-                        return 'Prism3D'
-            # Check for common SCS files or engine config names in top-level
-            for cfg in ('prismengine.ini', 'engine.ini', 'scs_game.ini', 'scs_game.txt'):
-                if cfg in facts.top_files:
-                    return 'Prism3D'
-            return 'Unknown'
+            # One pass of the compiled engine rules over the walked names
+            engine = detection_rules.match_engine({
+                'top_files': facts.top_files,
+                'top_dirs': facts.top_dirs,
+                'probe_dirs': list(facts.probe_files),
+            })
+            return engine or 'Unknown'
         except Exception as e:
             debug_log(f"Engine detection failed for {game_path}: {e}")
             return 'Unknown'
@@ -420,47 +567,29 @@ class GameScanner:
         Returns a list of detected anti-cheat names. Checks top-level file and
         folder names plus files in direct child directories, from FolderFacts.
         """
+        if facts is None:
+            facts = self._collect_folder_facts(Path(game_path))
+        if facts is None:
+            return []
+        return list(self._memo_detection(facts, 'anti_cheat',
+                                         lambda: self._probe_anti_cheat(game_path, facts)))
+
+    def _probe_anti_cheat(self, game_path, facts):
+        """Anti-cheat detection over FolderFacts names without memoization."""
         try:
-            if facts is None:
-                facts = self._collect_folder_facts(Path(game_path))
-            if facts is None:
-                return []
             candidate_names = facts.top_files + facts.top_dirs + facts.depth1_files
-            indicators = {
-                'EasyAntiCheat': ['EasyAntiCheat.sys', 'EasyAntiCheat.exe', 'EasyAntiCheat'],
-                'BattlEye': ['beclient.dll', 'BEService.exe', 'BattleEye'],
-                'Vanguard': ['vgc.sys', 'vgtray.exe', 'Vanguard'],
-                'Easy Anti-Cheat': ['EasyAntiCheat'],
-                'BattleEye (BE)': ['BEService.exe', 'BattleEye']
-            }
-            ac_list = []
-            for name, patterns in indicators.items():
-                if any(pattern.lower() in candidate for pattern in patterns for candidate in candidate_names):
-                    ac_list.append(name)
-            # Filter duplicates
-            return list(dict.fromkeys(ac_list))
+            return detection_rules.match_anti_cheat(candidate_names)
         except Exception as e:
             debug_log(f"Anti-cheat detection failed for {game_path}: {e}")
             return []
 
     def _detect_anti_cheat_shallow(self, game_path: Path) -> list:
-        """Shallow anti-cheat detection for registry/appx scans to avoid expensive recursive scans."""
-        ac_list = []
+        """Shallow anti-cheat detection for registry/appx scans to avoid expensive recursive scans.
+        Only top-level names are checked, and alias rules are not reported."""
         try:
-                indicators = {
-                    'EasyAntiCheat': ['EasyAntiCheat.sys', 'EasyAntiCheat.exe', 'EasyAntiCheat'],
-                    'BattlEye': ['beclient.dll', 'BEService.exe', 'BattleEye'],
-                    'Vanguard': ['vgc.sys', 'vgtray.exe', 'Vanguard']
-                }
-                # List only top-level files and folders (avoid recursion)
-                for p in Path(game_path).iterdir():
-                    name = p.name.lower()
-                    for ac_name, patterns in indicators.items():
-                        for pattern in patterns:
-                            if pattern.lower() in name:
-                                ac_list.append(ac_name)
-                                break
-                return list(dict.fromkeys(ac_list))
+            # List only top-level files and folders (avoid recursion)
+            names = [p.name.lower() for p in Path(game_path).iterdir()]
+            return detection_rules.match_anti_cheat(names, include_aliases=False)
         except Exception as e:
             debug_log(f"Shallow anti-cheat detection failed for {game_path}: {e}")
             return []
@@ -502,42 +631,99 @@ class GameScanner:
             return {'engine': 'Unknown', 'anti_cheat_list': [], 'community_verified': False}
 
     def _collect_folder_facts(self, path):
-        """Walk a game folder once (bounded by max_scan_depth / 1000 files) and
-        gather everything the per-game detectors need. Returns None on access errors."""
+        """Walk a game folder once with os.scandir (bounded by max_scan_depth /
+        1000 files) and gather everything the per-game detectors need, including
+        the listings of every probe directory (see _probe_dirs), so detectors
+        make no filesystem calls of their own. Returns None on access errors.
+        Folders whose directory signature is unchanged since the last walk are
+        served from the persistent scan index without walking at all."""
+        cached = self._scan_index.lookup(path)
+        if cached is not None:
+            return cached
         facts = FolderFacts(path)
+        facts.recorded_at = time.time_ns()
         max_files_to_check = 1000
+        probe_dirs = {tuple(rel.split('/')): rel for rel in self._probe_dirs()}
+        # Listings kept for the root and every directory on the way to a probe dir
+        wanted = {rel[:i] for rel in probe_dirs for i in range(len(rel) + 1)}
+        listings = {}
+        root = str(facts.root)
         try:
-            for root, dirs, files in os.walk(facts.root):
-                rel = os.path.relpath(root, facts.root)
-                at_top = rel == "."
-                current_depth = 0 if at_top else rel.count(os.sep)
-                if current_depth >= config.max_scan_depth:
-                    dirs[:] = []  # Don't recurse further
-                    continue
-                at_depth1 = not at_top and os.sep not in rel
+            root_stat = os.stat(root)
+            listings[()] = _list_dir(root)
+        except OSError as e:
+            debug_log(f"Access denied or error scanning {facts.root}: {e}")
+            return None
 
+        # Depth-first, parent before children, in listing order (same as os.walk)
+        stack = [((), root)]
+        while stack and facts.file_count <= max_files_to_check:
+            rel, dir_path = stack.pop()
+            if rel in listings:
+                files, dirs = listings[rel]
+            else:
+                try:
+                    files, dirs = _list_dir(dir_path)
+                except OSError:
+                    continue  # os.walk semantics: unreadable subdirectories are skipped
+                if rel in wanted:
+                    listings[rel] = (files, dirs)
+            at_top = not rel
+            if at_top:
+                facts.top_dirs = [d.name.lower() for d in dirs]
+            in_unreal_dir = "unrealengine" in dir_path.lower()
+            for file in files:
+                file_lower = file.lower()
                 if at_top:
-                    facts.top_dirs = [d.lower() for d in dirs]
-                in_unreal_dir = "unrealengine" in root.lower()
-                for file in files:
-                    facts.file_count += 1
-                    if facts.file_count > max_files_to_check:
-                        break
-                    file_lower = file.lower()
-                    if at_top:
-                        facts.top_files.append(file_lower)
-                    elif at_depth1:
-                        facts.depth1_files.append(file_lower)
-                    if file_lower.endswith(".exe"):
-                        facts.found_exe = True
-                    if file_lower.endswith(_GAME_CONTENT_SUFFIXES) or in_unreal_dir:
-                        facts.found_game_content = True
-
+                    # Root names are kept in full; only the counters honour the cap
+                    facts.top_files.append(file_lower)
                 if facts.file_count > max_files_to_check:
-                    break
-        except (PermissionError, OSError) as e:
-            debug_log(f"Access denied or error scanning {facts.root}: {e}")
-            return None
+                    continue
+                facts.file_count += 1
+                if facts.file_count > max_files_to_check:
+                    continue
+                if len(rel) == 1:
+                    facts.depth1_files.append(file_lower)
+                if file_lower.endswith(".exe"):
+                    facts.found_exe = True
+                if file_lower.endswith(_GAME_CONTENT_SUFFIXES) or in_unreal_dir:
+                    facts.found_game_content = True
+            # Children at depth (len(rel) - 1) >= max_scan_depth are never listed
+            if len(rel) < config.max_scan_depth:
+                for entry in reversed(dirs):
+                    if not entry.is_symlink():
+                        stack.append((rel + (entry.name.lower(),), entry.path))
+
+        def probe(rel):
+            """Listing of a probe-path directory, from the walk or (when the file
+            cap or depth bound stopped it first) from one extra scandir."""
+            if rel in listings:
+                return listings[rel]
+            parent = probe(rel[:-1])
+            entry = next((d for d in parent[1] if d.name.lower() == rel[-1]), None) if parent else None
+            listing = None
+            if entry is not None:
+                try:
+                    listing = _list_dir(entry.path)
+                except OSError:
+                    pass
+            listings[rel] = listing
+            return listing
+
+        # Top-level dirs' mtimes cover depth1_files and the root-level probe dirs;
+        # the Unreal binaries dir and its subdirs are signed explicitly
+        signature_entries = [(d.name, d) for d in listings[()][1]]
+        for rel, key in probe_dirs.items():
+            listing = probe(rel)
+            if listing is None:
+                continue
+            facts.probe_files[key] = [f.lower() for f in listing[0]]
+            if len(rel) > 1:
+                parent_dirs = listings[rel[:-1]][1]
+                entry = next(d for d in parent_dirs if d.name.lower() == rel[-1])
+                signature_entries.append((os.path.relpath(entry.path, root), entry))
+        facts.signature = walk_signature(root_stat, signature_entries)
+        self._scan_index.store(facts)
         return facts
 
     def _is_game_folder(self, path, facts=None):
@@ -676,25 +862,60 @@ class GameScanner:
             debug_log(f"Appx scan failed: {e}")
         return games
 
-    @timed("game_scan")
-    def scan_games(self, force_refresh: bool = False):
-        # Return cached games if available and a forced refresh was not requested
-        try:
-            if not force_refresh and self._cached_games is not None:
-                debug_log(f"Using cached game list ({len(self._cached_games)} games)")
-                return list(self._cached_games)
-        except Exception:
-            pass
-        # Fresh scan pass: forget which Steam libraries were covered last time
-        self._scanned_steam_roots = set()
-
-        all_games = []
-        all_games.extend(self._scan_steam_games())
-        all_games.extend(self._scan_epic_games())
-        all_games.extend(self._scan_gog_games())
-        all_games.extend(self._scan_xbox_games())
-        all_games.extend(self._scan_heroic_games())
-        # Add a fast discovery step on Windows that uses PowerShell to find library roots
+    # Game names that are launchers/runtimes rather than games
+    _LAUNCHER_KEYWORDS = ('launcher', 'redistributable', 'directx', 'vcredist',
+                          'dotnet', 'steamworks common')
+
+    def _launcher_sources(self, scan_pass=None):
+        """(label, scan function) for every launcher-specific scanner."""
+        return [
+            ('Steam', functools.partial(self._scan_steam_games, scan_pass)),
+            ('Epic', self._scan_epic_games),
+            ('GOG', self._scan_gog_games),
+            ('Xbox', self._scan_xbox_games),
+            ('Heroic', self._scan_heroic_games),
+        ]
+
+    def _scan_sources(self, force_refresh=False, scan_pass=None):
+        """Yield (source label, games) per launcher and per discovered library root,
+        in completion order. Each source enumerates on its own lightweight thread;
+        the per-folder work of all of them shares the bounded scan scheduler.
+        scan_pass is shared by the sources of this pass only."""
+        results = queue.Queue()
+        outstanding = 0
+
+        def run(label, fn, args):
+            try:
+                payload = fn(*args)
+            except Exception as e:
+                debug_log(f"Scan source {label} failed: {e}")
+                payload = []
+            results.put((label, payload))
+
+        def start(label, fn, *args):
+            nonlocal outstanding
+            outstanding += 1
+            threading.Thread(target=run, args=(label, fn, args), daemon=True,
+                             name=f"scan-source-{label}").start()
+
+        for label, fn in self._launcher_sources(scan_pass):
+            start(label, fn)
+        # Library discovery returns more sources (one per root) instead of games
+        start(None, self._discover_library_sources, force_refresh)
+
+        while outstanding:
+            label, payload = results.get()
+            outstanding -= 1
+            if label is None:
+                for source_label, fn, *args in payload:
+                    start(source_label, functools.partial(fn, scan_pass=scan_pass), *args)
+                continue
+            yield label, payload
+
+    def _discover_library_sources(self, force_refresh=False):
+        """Run the fast library-root discovery step (PowerShell on Windows,
+        registry/drive heuristics otherwise) and return one
+        (label, _scan_library_root, launcher, path) source per usable root."""
         try:
             start_lib = time.time()
             libraries = get_game_libraries(use_powershell=True, force_refresh=force_refresh)
@@ -704,145 +925,141 @@ class GameScanner:
             from utils.config import get_config_value
             excluded = get_config_value('excluded_drives', '') or ''
             excluded_list = [e.strip().upper() for e in str(excluded).split(',') if e.strip()]
-            for lib in libraries:
-                try:
-                    launcher = lib.get('Launcher')
-                    lib_path = lib.get('Path')
-                    if not lib_path:
-                        continue
-                    drive_letter = (lib.get('Drive') or lib_path[0]).upper().strip() if lib.get('Drive') or lib_path else None
-                    if drive_letter and drive_letter.replace(':','').upper() in excluded_list:
-                        debug_log(f"Skipping library root on excluded drive: {lib_path}")
-                        continue
-                    p = Path(lib_path)
-                    if launcher == 'Steam' and (p.exists() and p.is_dir()):
-                        # Steam library root discovered as .../steamapps/common.
-                        # _scan_steam_library skips it if _scan_steam_games already
-                        # covered this library, and gets manifest names right by
-                        # passing the true library root (not steamapps).
-                        try:
-                            all_games.extend(self._scan_steam_library(p.parent.parent))
-                        except Exception as e:
-                            debug_log(f"Failed scanning Steam library {p}: {e}")
-                    elif launcher == 'Epic' and p.exists() and p.is_dir():
-                        # Adapt the Epic scanning: process directories under the root
-                        try:
-                            for gf in p.iterdir():
-                                if not gf.is_dir():
-                                    continue
-                                facts = self._collect_folder_facts(gf)
-                                if self._is_game_folder(gf, facts):
-                                    game_name = self._read_epic_game_name(gf)
-                                    if not game_name:
-                                        raw = gf.name.replace("_", " ").replace("-", " ")
-                                        game_name = self._split_camel_case(raw).title()
-                                    optiscaler_installed = self._detect_optiscaler(gf, facts)
-                                    safety = self.analyze_game_safety(Game(game_name, str(gf)), facts)
-                                    all_games.append(Game(name=game_name, path=str(gf), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Epic'))
-                        except Exception as e:
-                            debug_log(f"Failed scanning Epic root {p}: {e}")
-                    elif launcher == 'GOG' and p.exists() and p.is_dir():
-                        try:
-                            for gf in p.iterdir():
-                                if not gf.is_dir():
-                                    continue
-                                facts = self._collect_folder_facts(gf)
-                                if self._is_game_folder(gf, facts):
-                                    # Use GOG metadata for proper name
-                                    game_name = gf.name.replace("_", " ").replace("-", " ").title()
-                                    info_files = list(gf.glob("goggame-*.info"))
-                                    if info_files:
-                                        try:
-                                            with open(info_files[0], 'r', encoding='utf-8') as _f:
-                                                _gi = json.load(_f)
-                                            game_name = _gi.get("gameTitle", game_name)
-                                        except Exception:
-                                            pass
-                                    optiscaler_installed = self._detect_optiscaler(gf, facts)
-                                    safety = self.analyze_game_safety(Game(game_name, str(gf)), facts)
-                                    all_games.append(Game(name=game_name, path=str(gf), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='GOG'))
-                        except Exception as e:
-                            debug_log(f"Failed scanning GOG root {p}: {e}")
-                    elif launcher == 'Xbox' and p.exists() and p.is_dir():
-                        try:
-                            is_xbx = p.name.lower() == 'xboxgames'
-                            is_wapps = p.name.lower() == 'windowsapps'
-                            for gf in p.iterdir():
-                                if not gf.is_dir():
-                                    continue
-                                if is_wapps and not self._is_appx_game_candidate(gf.name):
-                                    # Cheap name filter first — don't walk non-game packages
-                                    continue
-                                facts = self._collect_folder_facts(gf)
-                                if is_xbx:
-                                    is_game = self._is_game_folder(gf, facts) or self._is_xbox_game_folder(gf)
-                                    if not is_game:
-                                        continue
-                                    game_name = gf.name.replace("_", " ").replace("-", " ").title()
-                                elif is_wapps:
-                                    if not self._is_game_folder(gf, facts):
-                                        continue
-                                    game_name = self._parse_appx_package_name(gf.name).title()
-                                    if not game_name or len(game_name) < 2:
-                                        continue
-                                else:
-                                    if not self._is_game_folder(gf, facts):
-                                        continue
-                                    game_name = gf.name.replace("_", " ").replace("-", " ").title()
-                                optiscaler_installed = self._detect_optiscaler(gf, facts)
-                                safety = self.analyze_game_safety(Game(game_name, str(gf)), facts)
-                                all_games.append(Game(name=game_name, path=str(gf), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Xbox'))
-                        except Exception as e:
-                            debug_log(f"Failed scanning Xbox root {p}: {e}")
-                except Exception as e:
-                    debug_log(f"Failed processing library entry {lib}: {e}")
         except Exception as e:
             debug_log(f"Library root discovery failed: {e}")
+            return []
+        sources = []
+        for lib in libraries:
+            try:
+                launcher = lib.get('Launcher')
+                lib_path = lib.get('Path')
+                if not lib_path or launcher not in ('Steam', 'Epic', 'GOG', 'Xbox'):
+                    continue
+                drive_letter = (lib.get('Drive') or lib_path[0]).upper().strip() if lib.get('Drive') or lib_path else None
+                if drive_letter and drive_letter.replace(':','').upper() in excluded_list:
+                    debug_log(f"Skipping library root on excluded drive: {lib_path}")
+                    continue
+                sources.append((f"{launcher} library {lib_path}", self._scan_library_root, launcher, Path(lib_path)))
+            except Exception as e:
+                debug_log(f"Failed processing library entry {lib}: {e}")
+        return sources
 
-        # Filter out launchers and pure demo entries
-        _launcher_keywords = ('launcher', 'redistributable', 'directx', 'vcredist',
-                               'dotnet', 'steamworks common')
-        all_games = [
-            g for g in all_games
-            if not any(kw in g.name.lower() for kw in _launcher_keywords)
-        ]
+    def _scan_library_root(self, launcher, p, scan_pass=None):
+        """Scan one discovered library root with the matching launcher's folder processor."""
+        if not (p.exists() and p.is_dir()):
+            return []
+        try:
+            if launcher == 'Steam':
+                # Steam library root discovered as .../steamapps/common.
+                # _scan_steam_library skips it if _scan_steam_games already
+                # covered this library, and gets manifest names right by
+                # passing the true library root (not steamapps).
+                return self._scan_steam_library(p.parent.parent, scan_pass)
+            if launcher == 'Epic':
+                # Discovered roots hold plain game folders, no .egstore required
+                return self._scan_folders(p, self._process_epic_folder, False)
+            if launcher == 'GOG':
+                return self._scan_folders(p, self._process_gog_folder)
+            if launcher == 'Xbox':
+                return self._scan_folders(p, self._process_xbox_folder,
+                                          p.name.lower() == 'xboxgames', p.name.lower() == 'windowsapps')
+        except Exception as e:
+            debug_log(f"Failed scanning {launcher} root {p}: {e}")
+        return []
 
-        # Deduplicate: prefer the entry that already has an image.
-        # Primary key: (name, path). Secondary: (name, platform) so the same
-        # game detected from both C:\XboxGames and WindowsApps isn't shown twice.
-        unique_games = {}
-        name_platform_seen = {}
-        for game in all_games:
-            normalized_name = game.name.lower().strip()
-            normalized_path = os.path.normpath(game.path).lower()
-            path_key = (normalized_name, normalized_path)
-            plat_key = (normalized_name, (game.platform or '').lower())
+    def _get_scan_scheduler(self):
+        """Shared scan scheduler (one bounded pool, per-drive limits), created on first use."""
+        with self._scan_scheduler_lock:
+            if self._scan_scheduler is None:
+                self._scan_scheduler = ScanScheduler()
+            return self._scan_scheduler
 
-            if path_key in unique_games:
-                # Keep whichever entry has a real image
-                existing = unique_games[path_key]
-                no_img = str(self.no_image_path)
-                if (not existing.image_path or existing.image_path == no_img) and game.image_path and game.image_path != no_img:
-                    unique_games[path_key] = game
+    @staticmethod
+    def _collect_results(futures):
+        """Wait for scheduler futures and return their non-None results."""
+        results = []
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                debug_log(f"Scan task failed: {e}")
                 continue
-
-            if plat_key in name_platform_seen:
-                # Same name+platform from a different path — skip the duplicate
+            if result:
+                results.append(result)
+        return results
+
+    def _scan_folders(self, root, process, *args):
+        """Run process(folder, *args) for every entry of root on the scan scheduler
+        and return the games it produced."""
+        return self._collect_results(self._get_scan_scheduler().map_folder(root, process, *args))
+
+    def _dedupe_batch(self, games, seen_paths, seen_name_platforms):
+        """Filter launcher entries and drop games already emitted this pass.
+        Primary key: (name, path). Secondary: (name, platform) so the same
+        game detected from both C:\\XboxGames and WindowsApps isn't shown twice.
+        The first occurrence wins (scan results carry no images to prefer)."""
+        batch = []
+        for game in games:
+            normalized_name = game.name.lower().strip()
+            if any(kw in normalized_name for kw in self._LAUNCHER_KEYWORDS):
                 continue
-
-            unique_games[path_key] = game
-            name_platform_seen[plat_key] = True
-        
-        debug_log(f"Scan complete: Found {len(unique_games)} unique games")
-        result = list(unique_games.values())
+            path_key = (normalized_name, os.path.normpath(game.path).lower())
+            plat_key = (normalized_name, (game.platform or '').lower())
+            if path_key in seen_paths or plat_key in seen_name_platforms:
+                continue
+            seen_paths.add(path_key)
+            seen_name_platforms.add(plat_key)
+            batch.append(game)
+        return batch
+
+    def scan_games_iter(self, force_refresh: bool = False):
+        """Streaming scan: yield lists of deduplicated games as each launcher or
+        library root finishes, so the UI can show rows before the slowest source
+        is done. Exhausting the generator caches the full result like scan_games.
+        Passes run one at a time: a second caller waits for the running pass
+        (and, without force_refresh, then gets its result)."""
+        # Return cached games if available and a forced refresh was not requested
+        if not force_refresh and self._cached_games is not None:
+            debug_log(f"Using cached game list ({len(self._cached_games)} games)")
+            yield list(self._cached_games)
+            return
+        with self._scan_pass_lock:
+            if not force_refresh and self._cached_games is not None:
+                debug_log(f"Using game list of the pass just finished ({len(self._cached_games)} games)")
+                yield list(self._cached_games)
+                return
+            yield from self._scan_pass(force_refresh)
+
+    def _scan_pass(self, force_refresh):
+        """One full scan pass; the caller holds _scan_pass_lock."""
+        scan_pass = _ScanPass()
+        self._scan_index.begin_pass()
+
+        result = []
+        seen_paths, seen_name_platforms = set(), set()
+        known = self._previously_resolved()
+        for source, games in self._scan_sources(force_refresh, scan_pass):
+            batch = self._dedupe_batch(games, seen_paths, seen_name_platforms)
+            debug_log(f"Scan source {source}: {len(games)} found, {len(batch)} new")
+            if batch:
+                self._stamp_resolved(batch, known)
+                result.extend(batch)
+                yield batch
+
+        debug_log(f"Scan complete: Found {len(result)} unique games")
         # Cache scan result for subsequent calls
-        try:
-            self._cached_games = list(result)
-        except Exception:
-            self._cached_games = None
+        self._cached_games = list(result)
+        # Persist folder facts so the next scan only re-walks changed folders
+        self._scan_index.save(prune=True)
+        # Persist the result so the next launch can paint it before scanning
+        self.save_snapshot(result)
         # Enforce the cache size limit once per session, off the scan path
         threading.Thread(target=cache_manager.cleanup_large_cache_once, daemon=True).start()
-        return result
+
+    @timed("game_scan")
+    def scan_games(self, force_refresh: bool = False):
+        """Scan every launcher and return the full deduplicated game list."""
+        return [game for batch in self.scan_games_iter(force_refresh) for game in batch]
 
     def clear_cached_games(self):
         """Clear cached game scan results (used when forcing UI refresh or cache invalidation)."""
@@ -851,13 +1068,129 @@ class GameScanner:
         except Exception:
             pass
 
-    def get_cached_games(self):
-        """Return the cached games list or None if not cached."""
-        return list(self._cached_games) if self._cached_games is not None else None
+    def clear_scan_index(self):
+        """Forget persisted folder facts so the next scan re-walks every game folder."""
+        self._scan_index.clear()
 
-    def _scan_steam_games(self):
+    def get_cached_games(self):
+        """Return the cached games list, else the last session's snapshot if it
+        was loaded, or None if neither is available."""
+        if self._cached_games is not None:
+            return list(self._cached_games)
+        return list(self._snapshot_games) if self._snapshot_games is not None else None
+
+    def load_snapshot(self):
+        """Read the persisted scan snapshot (no game folder is touched).
+        Returns the games of the last completed scan, or None."""
+        games = scan_snapshot.load_snapshot(Game.from_dict, self._snapshot_path)
+        self._snapshot_games = games
+        return list(games) if games is not None else None
+
+    def save_snapshot(self, games=None):
+        """Persist games (default: the cached scan result) as the startup snapshot."""
+        if games is None:
+            games = self._cached_games if self._cached_games is not None else self._snapshot_games
+        if games is None:
+            return False
+        return scan_snapshot.save_snapshot(list(games), self._snapshot_path)
+
+    def revalidate_snapshot(self):
+        """Rescan after the snapshot was shown and work out how the snapshot's
+        Game objects (the ones on screen) must change, keeping their artwork.
+        The snapshot games are not modified here, since this runs on a worker
+        thread while the UI reads them: the caller applies the updates on the
+        UI thread with apply_game_updates().
+        Returns (added, removed, changed): fresh games that are new, snapshot
+        games that are gone, and (snapshot game, {field: new value}) updates."""
+        shown = self._snapshot_games or []
+        fresh = self.scan_games(force_refresh=True)
+        added, removed, _ = scan_snapshot.diff_games(shown, fresh)
+        shown_by_key = {scan_snapshot.game_key(g): g for g in shown}
+        merged, changed = [], []
+        for game in fresh:
+            old = shown_by_key.get(scan_snapshot.game_key(game))
+            if old is None:
+                merged.append(game)
+                continue
+            # Keep the row's path key and any artwork resolved meanwhile
+            game.path = old.path
+            if not game.image_path:
+                game.image_path = old.image_path
+            updates = {name: getattr(game, name) for name in Game._PERSISTED
+                       if getattr(old, name) != getattr(game, name)}
+            if updates:
+                changed.append((old, updates))
+            merged.append(old)
+        self._cached_games = merged
+        self._snapshot_games = None
+        # The fresh games already hold the merged values
+        self.save_snapshot(fresh)
+        debug_log(f"Snapshot revalidated: {len(added)} added, {len(removed)} removed, {len(changed)} changed")
+        return added, removed, changed
+
+    def refresh_install_status(self, games):
+        """Re-detect OptiScaler for just these games (after an install, uninstall
+        or update) instead of rescanning. Folders whose directory signature is
+        unchanged are answered from the scan index without touching them; only
+        changed ones are re-walked. Updates the games in place, persists the
+        result and reports the games whose status changed to on_games_changed.
+        Returns those games."""
+        changed = []
+        for game in games:
+            try:
+                facts = self._collect_folder_facts(game.path)
+                installed = bool(self._detect_optiscaler(game.path, facts))
+            except Exception as e:
+                debug_log(f"Failed to refresh OptiScaler status for {game.name}: {e}")
+                continue
+            if installed != bool(game.optiscaler_installed):
+                debug_log(f"OptiScaler status changed for {game.name}: {installed}")
+                game.optiscaler_installed = installed
+                changed.append(game)
+        if not changed:
+            return changed
+        self._scan_index.save()
+        self.save_snapshot()
+        if self.on_games_changed:
+            try:
+                self.on_games_changed(changed)
+            except Exception as e:
+                debug_log(f"Games changed callback error: {e}")
+        return changed
+
+    def clear_snapshot(self):
+        """Forget the persisted scan snapshot."""
+        self._snapshot_games = None
+        scan_snapshot.delete_snapshot(self._snapshot_path)
+
+    def _previously_resolved(self):
+        """{folder key: (name, appid, image_path)} from the previous scan or snapshot."""
+        known = {}
+        for previous in (self._snapshot_games, self._cached_games):
+            for game in previous or ():
+                known[scan_snapshot.game_key(game)] = (game.name, game.appid, game.image_path)
+        return known
+
+    def _stamp_resolved(self, games, known):
+        """Fill in what a row needs before it renders: artwork already resolved
+        for the same folder, and Steam AppIDs for games without one (non-Steam
+        launchers), resolved for the whole batch at once."""
+        for game in games:
+            name, appid, image_path = known.get(scan_snapshot.game_key(game), (None, None, None))
+            if not game.image_path:
+                game.image_path = image_path
+            if not game.appid and name == game.name:
+                game.appid = appid
+        missing = [game for game in games if not game.appid]
+        if missing and len(self.steam_app_index):
+            appids = self.resolve_appids([game.name for game in missing])
+            for game in missing:
+                game.appid = appids.get(game.name)
+
+    def _scan_steam_games(self, scan_pass=None):
         """Enhanced Steam game scanning with Path objects and improved error handling.
         Each Steam library is scanned exactly once per scan pass (see _scan_steam_library)."""
+        scan_pass = scan_pass if scan_pass is not None else _ScanPass()
         steam_games = []
         for steam_path_str in self.steam_paths:
             steam_path = Path(steam_path_str)
@@ -869,31 +1202,32 @@ class GameScanner:
 
             try:
                 # Main library
-                steam_games.extend(self._scan_steam_library(steam_path))
+                steam_games.extend(self._scan_steam_library(steam_path, scan_pass))
 
                 # Additional library folders from libraryfolders.vdf
                 library_folders_file = steamapps_path / "libraryfolders.vdf"
                 if library_folders_file.exists():
-                    steam_games.extend(self._scan_steam_library_folders(library_folders_file))
+                    steam_games.extend(self._scan_steam_library_folders(library_folders_file, scan_pass))
 
             except Exception as e:
                 debug_log(f"Error scanning Steam path {steam_path}: {e}")
 
         return steam_games
 
-    def _scan_steam_library(self, library_path):
+    def _scan_steam_library(self, library_path, scan_pass=None):
         """Scan one Steam library root exactly once per scan pass.
         Overlapping sources (main path, libraryfolders.vdf, PowerShell discovery)
-        all funnel through here, guarded by _scanned_steam_roots."""
+        all funnel through here and claim the root in scan_pass (without one,
+        the library is always scanned)."""
         library_path = Path(library_path)
         common_path = library_path / "steamapps" / "common"
         if not common_path.exists():
             return []
         key = os.path.normpath(str(common_path)).lower()
-        if key in self._scanned_steam_roots:
+        # Launcher and discovery sources run concurrently; claim the root atomically
+        if scan_pass is not None and not scan_pass.claim_steam_root(key):
             debug_log(f"Skipping already-scanned Steam library: {common_path}")
             return []
-        self._scanned_steam_roots.add(key)
         return self._scan_steam_common_folder(common_path, library_path)
 
     def _parse_steam_acf(self, acf_file, steamapps_path):
@@ -928,7 +1262,7 @@ class GameScanner:
         
         return None
 
-    def _scan_steam_library_folders(self, library_folders_file):
+    def _scan_steam_library_folders(self, library_folders_file, scan_pass=None):
         """Scan additional Steam library folders"""
         games = []
         try:
@@ -943,7 +1277,7 @@ class GameScanner:
                 if not library_path.exists():
                     continue
 
-                games.extend(self._scan_steam_library(library_path))
+                games.extend(self._scan_steam_library(library_path, scan_pass))
 
         except Exception as e:
             debug_log(f"Error scanning Steam library folders: {e}")
@@ -957,8 +1291,6 @@ class GameScanner:
         steamapps_path = library_path / "steamapps"
         # Parse every appmanifest once for this library (O(N) instead of O(N²))
         manifest_map = self._build_steam_manifest_map(steamapps_path)
-        # Process game folders concurrently to utilize multiple cores for I/O-bound operations
-        max_workers = getattr(config, 'max_workers', min(8, (os.cpu_count() or 1) * 4))
 
         def process_game_folder(game_folder):
             try:
@@ -980,13 +1312,8 @@ class GameScanner:
                 debug_log(f"Error processing game folder {game_folder}: {e}")
                 return None
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [executor.submit(process_game_folder, gf) for gf in common_path.iterdir()]
-            for future in concurrent.futures.as_completed(futures):
-                game = future.result()
-                if game:
-                    games.append(game)
-
+        # Folders run on the shared scan scheduler alongside the other launchers
+        games.extend(self._scan_folders(common_path, process_game_folder))
         return games
 
     def _build_steam_manifest_map(self, steamapps_path):
@@ -1025,46 +1352,40 @@ class GameScanner:
                 epic_path = Path(epic_path_str)
                 if not epic_path.exists():
                     continue
-
-                max_workers = getattr(config, 'max_workers', min(8, (os.cpu_count() or 1) * 4))
-
-                def process_epic_folder(game_folder):
-                    try:
-                        if not game_folder.is_dir():
-                            return None
-                        facts = self._collect_folder_facts(game_folder)
-                        if not self._is_game_folder(game_folder, facts):
-                            return None
-                        has_egstore = (game_folder / ".egstore").exists()
-                        has_manifest = any(f.suffix == ".mancfg" for f in game_folder.glob("*.mancfg"))
-                        if has_egstore or has_manifest:
-                            # First try to read the actual game title from Epic metadata
-                            game_name = self._read_epic_game_name(game_folder)
-                            if not game_name:
-                                # Fallback: split CamelCase folder name then title-case it
-                                raw = game_folder.name.replace("_", " ").replace("-", " ")
-                                game_name = self._split_camel_case(raw).title()
-                            optiscaler_installed = self._detect_optiscaler(game_folder, facts)
-                            safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
-                            return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Epic')
-                        return None
-                    except Exception as e:
-                        debug_log(f"Error processing Epic folder {game_folder}: {e}")
-                        return None
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(process_epic_folder, gf) for gf in epic_path.iterdir()]
-                for future in concurrent.futures.as_completed(futures):
-                    game = future.result()
-                    if game:
-                        epic_games.append(game)
-                        
+                epic_games.extend(self._scan_folders(epic_path, self._process_epic_folder))
             except (OSError, PermissionError) as e:
                 debug_log(f"Error scanning Epic Games path {epic_path}: {e}")
                 continue
                 
         return epic_games
 
+    def _process_epic_folder(self, game_folder, require_marker=True):
+        """Build a Game for one Epic install folder. Launcher paths require Epic's
+        .egstore/.mancfg marker; discovered library roots don't."""
+        try:
+            if not game_folder.is_dir():
+                return None
+            facts = self._collect_folder_facts(game_folder)
+            if not self._is_game_folder(game_folder, facts):
+                return None
+            if require_marker:
+                has_egstore = ".egstore" in facts.top_dirs or ".egstore" in facts.top_files
+                has_manifest = any(f.endswith(".mancfg") for f in facts.top_files)
+                if not (has_egstore or has_manifest):
+                    return None
+            # First try to read the actual game title from Epic metadata
+            game_name = self._read_epic_game_name(game_folder)
+            if not game_name:
+                # Fallback: split CamelCase folder name then title-case it
+                raw = game_folder.name.replace("_", " ").replace("-", " ")
+                game_name = self._split_camel_case(raw).title()
+            optiscaler_installed = self._detect_optiscaler(game_folder, facts)
+            safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
+            return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Epic')
+        except Exception as e:
+            debug_log(f"Error processing Epic folder {game_folder}: {e}")
+            return None
+
     @timed("scan_gog_games")
     def _scan_gog_games(self):
         """Scan GOG installations with Path objects"""
@@ -1074,61 +1395,58 @@ class GameScanner:
                 gog_path = Path(gog_path_str)
                 if not gog_path.exists():
                     continue
-                    
-                # Parallelize GOG folder scanning
-                max_workers = getattr(config, 'max_workers', min(8, (os.cpu_count() or 1) * 4))
-
-                def process_gog_folder(game_folder):
-                    try:
-                        if not game_folder.is_dir():
-                            return None
-                        facts = self._collect_folder_facts(game_folder)
-                        if not self._is_game_folder(game_folder, facts):
-                            return None
-
-                        optiscaler_installed = self._detect_optiscaler(game_folder, facts)
-
-                        # Look for goggame-*.info files
-                        info_files = list(game_folder.glob("goggame-*.info"))
-                        if info_files:
-                            try:
-                                with open(info_files[0], 'r', encoding='utf-8') as f:
-                                    game_info = json.load(f)
-                                    game_name = game_info.get("gameTitle", game_folder.name.replace("_", " ").replace("-", " ").title())
-                                    safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
-                                    return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='GOG')
-                            except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as e:
-                                debug_log(f"Error parsing GOG info file {info_files[0].name}: {e}")
-
-                        # Fallback: use folder name
-                        # (platform was mistakenly 'Epic' here before — copy-paste bug)
-                        game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
-                        safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
-                        return Game(name=game_name, path=str(game_folder), optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='GOG')
-                    except Exception as e:
-                        debug_log(f"Error processing GOG folder {game_folder}: {e}")
-                        return None
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(process_gog_folder, gf) for gf in gog_path.iterdir()]
-                    for future in concurrent.futures.as_completed(futures):
-                        game = future.result()
-                        if game:
-                            gog_games.append(game)
-                    
+                gog_games.extend(self._scan_folders(gog_path, self._process_gog_folder))
             except (OSError, PermissionError) as e:
                 debug_log(f"Error scanning GOG path {gog_path}: {e}")
                 continue
                 
         return gog_games
 
+    def _process_gog_folder(self, game_folder):
+        """Build a Game for one GOG install folder, named from goggame-*.info when present."""
+        try:
+            if not game_folder.is_dir():
+                return None
+            facts = self._collect_folder_facts(game_folder)
+            if not self._is_game_folder(game_folder, facts):
+                return None
+
+            optiscaler_installed = self._detect_optiscaler(game_folder, facts)
+
+            # Look for goggame-*.info files
+            info_files = list(game_folder.glob("goggame-*.info"))
+            if info_files:
+                try:
+                    with open(info_files[0], 'r', encoding='utf-8') as f:
+                        game_info = json.load(f)
+                        game_name = game_info.get("gameTitle", game_folder.name.replace("_", " ").replace("-", " ").title())
+                        safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
+                        return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='GOG')
+                except (json.JSONDecodeError, UnicodeDecodeError, KeyError) as e:
+                    debug_log(f"Error parsing GOG info file {info_files[0].name}: {e}")
+
+            # Fallback: use folder name
+            # (platform was mistakenly 'Epic' here before — copy-paste bug)
+            game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
+            safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
+            return Game(name=game_name, path=str(game_folder), optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='GOG')
+        except Exception as e:
+            debug_log(f"Error processing GOG folder {game_folder}: {e}")
+            return None
+
     # Xbox streaming/packaging file extensions that identify a Game Pass title in C:\XboxGames
     _XBOX_GAME_EXTENSIONS = {'.xsp', '.smd', '.xct', '.xvi'}
 
-    def _is_xbox_game_folder(self, game_folder: Path) -> bool:
+    def _is_xbox_game_folder(self, game_folder: Path, facts=None) -> bool:
         """Return True if the folder looks like an Xbox Game Pass title.
         Xbox games in C:\\XboxGames store packaging files (.xsp, .smd, .xct, .xvi)
-        and/or a gamelaunchhelper.exe at the top level, not traditional game binaries."""
+        and/or a gamelaunchhelper.exe at the top level, not traditional game binaries.
+        Uses the FolderFacts top-level listing when the caller has one."""
+        if facts is not None:
+            return ('gamelaunchhelper.exe' in facts.top_files
+                    or 'content' in facts.top_dirs
+                    or any(os.path.splitext(name)[1] in self._XBOX_GAME_EXTENSIONS
+                           for name in facts.top_files + facts.top_dirs))
         try:
             for item in game_folder.iterdir():
                 if item.suffix.lower() in self._XBOX_GAME_EXTENSIONS:
@@ -1151,137 +1469,240 @@ class GameScanner:
                 xbox_path = Path(xbox_path_str)
                 if not xbox_path.exists():
                     continue
-
-                max_workers = getattr(config, 'max_workers', min(8, (os.cpu_count() or 1) * 4))
                 is_xboxgames_root = xbox_path.name.lower() == 'xboxgames'
                 is_windowsapps = xbox_path.name.lower() == 'windowsapps'
-
-                def process_xbox_folder(game_folder, _is_xbx=is_xboxgames_root, _is_wapps=is_windowsapps):
-                    try:
-                        if not game_folder.is_dir():
-                            return None
-                        if _is_wapps and not self._is_appx_game_candidate(game_folder.name):
-                            # Skip known non-game packages before walking the folder
-                            return None
-
-                        facts = self._collect_folder_facts(game_folder)
-                        if _is_xbx:
-                            # C:\XboxGames — accept folders that pass standard check OR Xbox packaging check
-                            is_game = self._is_game_folder(game_folder, facts) or self._is_xbox_game_folder(game_folder)
-                            if not is_game:
-                                return None
-                            game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
-                        elif _is_wapps:
-                            # C:\Program Files\WindowsApps — Appx package folder names
-                            if not self._is_game_folder(game_folder, facts):
-                                return None
-                            # Parse readable name from Publisher.AppName_Version_Arch_Hash
-                            game_name = self._parse_appx_package_name(game_folder.name).title()
-                            if not game_name or len(game_name) < 2:
-                                return None
-                        else:
-                            if not self._is_game_folder(game_folder, facts):
-                                return None
-                            game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
-
-                        optiscaler_installed = self._detect_optiscaler(game_folder, facts)
-                        safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
-                        return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Xbox')
-                    except Exception as e:
-                        debug_log(f"Error processing Xbox folder {game_folder}: {e}")
-                        return None
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-                    futures = [executor.submit(process_xbox_folder, gf) for gf in xbox_path.iterdir()]
-                    for future in concurrent.futures.as_completed(futures):
-                        game = future.result()
-                        if game:
-                            xbox_games.append(game)
-
+                xbox_games.extend(self._scan_folders(xbox_path, self._process_xbox_folder,
+                                                     is_xboxgames_root, is_windowsapps))
             except (OSError, PermissionError) as e:
                 debug_log(f"Error scanning Xbox Games path {xbox_path}: {e}")
                 continue
 
         return xbox_games
 
+    def _process_xbox_folder(self, game_folder, is_xbx=False, is_wapps=False):
+        """Build a Game for one folder under C:\\XboxGames, WindowsApps or another Xbox root."""
+        try:
+            if not game_folder.is_dir():
+                return None
+            if is_wapps and not self._is_appx_game_candidate(game_folder.name):
+                # Skip known non-game packages before walking the folder
+                return None
+
+            facts = self._collect_folder_facts(game_folder)
+            if is_xbx:
+                # C:\XboxGames — accept folders that pass standard check OR Xbox packaging check
+                is_game = self._is_game_folder(game_folder, facts) or self._is_xbox_game_folder(game_folder, facts)
+                if not is_game:
+                    return None
+                game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
+            elif is_wapps:
+                # C:\Program Files\WindowsApps — Appx package folder names
+                if not self._is_game_folder(game_folder, facts):
+                    return None
+                # Parse readable name from Publisher.AppName_Version_Arch_Hash
+                game_name = self._parse_appx_package_name(game_folder.name).title()
+                if not game_name or len(game_name) < 2:
+                    return None
+            else:
+                if not self._is_game_folder(game_folder, facts):
+                    return None
+                game_name = game_folder.name.replace("_", " ").replace("-", " ").title()
+
+            optiscaler_installed = self._detect_optiscaler(game_folder, facts)
+            safety = self.analyze_game_safety(Game(game_name, str(game_folder)), facts)
+            return Game(name=game_name, path=str(game_folder), image_path=None, optiscaler_installed=optiscaler_installed, engine=safety['engine'], anti_cheat_list=safety['anti_cheat_list'], community_verified=safety['community_verified'], engine_supported=safety.get('engine_supported', True), platform='Xbox')
+        except Exception as e:
+            debug_log(f"Error processing Xbox folder {game_folder}: {e}")
+            return None
+
+    def _save_cache_image(self, image, out_path):
+        """Shrink an image to the list thumbnail size and store it as JPEG in the image cache."""
+        image.thumbnail(config.max_image_size, Image.Resampling.LANCZOS)
+        if image.mode in ('RGBA', 'LA', 'P'):
+            if image.mode == 'P':
+                image = image.convert('RGBA')
+            rgb_image = Image.new('RGB', image.size, (255, 255, 255))
+            rgb_image.paste(image, mask=image.split()[-1])
+            image = rgb_image
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        image.save(out_path, 'JPEG', quality=config.image_quality, optimize=True)
+        image_index_for(Path(out_path).parent).record(out_path)
+        return out_path
+
+    def _http_get(self, url, **kwargs):
+        """GET through the shared session within the download scheduler's per-host cap."""
+        with self.download_scheduler.host_slot(url):
+            resp = self._requests_session.get(url, **kwargs)
+            resp.content  # read streamed bodies while the slot (and connection) is held
+            return resp
+
+    def _cache_local_artwork(self, providers, game_name, appid, game, out_path):
+        """Copy the first local launcher artwork found by providers into the image cache."""
+        provider, local_image = find_local_artwork(providers, game_name, appid, game)
+        if not local_image:
+            return None
+        try:
+            with Image.open(local_image) as image:
+                self._save_cache_image(image, out_path)
+            debug_log(f"Cached local artwork for {game_name} (AppID: {appid}) via {provider} -> {out_path}")
+            return str(out_path)
+        except (OSError, ValueError, Image.UnidentifiedImageError) as e:
+            debug_log(f"Local artwork {local_image} unreadable for {game_name}: {e}")
+            return None
+
     @timed("image_fetch")
-    def fetch_game_image(self, game_name, appid=None):
-        """Fetch game image with Path objects and improved error handling"""
+    def fetch_game_image(self, game_name, appid=None, game=None):
+        """Fetch game image with Path objects and improved error handling.
+
+        Local launcher artwork (see scanner.artwork_providers) is tried before
+        any network lookup; passing the Game lets the per-platform providers
+        (Heroic, Xbox, GOG) find art without a Steam AppID match. Their art is
+        cached under the game's platform and name, never under its AppID (which
+        for these platforms may come from a fuzzy match). Fallback providers
+        (GOG icons) are only asked when the network lookup finds nothing."""
+        cache_dir = Path(self.game_cache_dir)
+        safe_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
+        platform = getattr(game, 'platform', None) if game is not None else None
+        local_stem = f"{platform.lower()}_{safe_name}" if platform else None
+        local_providers = [p for p in self.artwork_providers
+                           if not p.needs_appid and not p.after_network and p.handles(game, appid)]
+
+        found = self._fetch_primary_artwork(game_name, appid, game, cache_dir, safe_name,
+                                            local_stem if local_providers else None, local_providers)
+        if found != str(self.no_image_path) or not local_stem:
+            return found
+
+        fallback_providers = [p for p in self.artwork_providers if p.after_network and p.handles(game, appid)]
+        if not fallback_providers:
+            return found
+        return (image_index_for(cache_dir).lookup([local_stem])
+                or self._cache_local_artwork(fallback_providers, game_name, appid, game,
+                                             cache_dir / f"{local_stem}.jpg")
+                or found)
+
+    def _fetch_primary_artwork(self, game_name, appid, game, cache_dir, safe_name, local_stem, local_providers):
+        """Cached image, platform launcher art, then Steam artwork by AppID."""
+        image_index = image_index_for(cache_dir)
+
+        def _cached(stems):
+            # One index lookup per stem instead of an exists() probe per extension
+            return image_index.lookup(stems)
+
+        # The game's own launcher art first, then the appid-keyed file (accurate),
+        # then the name-keyed file (legacy)
+        found = _cached(([local_stem] if local_stem else []) + ([f"appid_{appid}"] if appid else []) + [safe_name])
+        if found:
+            return found
+
+        # Local launcher artwork (no network, no AppID matching needed)
+        if local_stem:
+            found = self._cache_local_artwork(local_providers, game_name, appid, game,
+                                              cache_dir / f"{local_stem}.jpg")
+            if found:
+                return found
+
         # If appid is not provided, try to get it from the cached list
         if not appid:
+            # A name that matched nothing is retried once the catalogue changes
+            name_key = f"name:{normalize_name(game_name)}"
+            catalogue = len(self.steam_app_index)
+            if self.artwork_misses.blocked(name_key, catalogue):
+                return str(self.no_image_path)
             appid = self._get_appid_from_name(game_name)
             if not appid:
                 # If still no appid, return placeholder and log for diagnostics
                 debug_log(f"No Steam AppID for '{game_name}'; using placeholder image")
+                if catalogue:  # an empty index (still loading) proves nothing
+                    self.artwork_misses.record_miss(name_key, catalogue)
                 return str(self.no_image_path)
-
-        # Check if image already exists in cache.
-        # Prefer appid-keyed file (accurate) then fall back to name-keyed file (legacy).
-        cache_dir = Path(self.game_cache_dir)
-        cache_stems = [f"appid_{appid}"] if appid else []
-        safe_name = re.sub(r'[<>:"/\\|?*]', '_', game_name)
-        cache_stems.append(safe_name)
-
-        for stem in cache_stems:
-            for ext in ['jpg', 'png', 'jpeg', 'webp']:
-                cached_path = cache_dir / f"{stem}.{ext}"
-                if cached_path.exists():
-                    return str(cached_path)
+            found = _cached([f"appid_{appid}"])
+            if found:
+                return found
+
+        # Concurrent requests for one AppID (two games resolving to it, a row
+        # rebuild racing the first pass, the retry pass) share one download
+        return self._image_flights.do(appid, self._fetch_steam_artwork, game_name, appid, game, cache_dir)
+
+    def _fetch_steam_artwork(self, game_name, appid, game, cache_dir):
+        """Steam artwork for a resolved AppID: local librarycache, then CDN, then Store API.
+        Runs once per AppID at a time (see fetch_game_image)."""
+        # A flight that finished just before this one started may have cached it already
+        found = image_index_for(cache_dir).lookup([f"appid_{appid}"])
+        if found:
+            return found
 
         def _download_and_cache_image(url, label):
-            """Download image from url, resize, save to cache. Returns path string or None."""
+            """Download image from url, resize, save to cache. Returns (path string or
+            None, True if the server answered that the image does not exist)."""
             try:
-                resp = self._requests_session.get(url, stream=True, timeout=config.image_download_timeout)
+                resp = self._http_get(url, stream=True, timeout=config.image_download_timeout)
+                if resp.status_code in (403, 404):
+                    debug_log(f"Image not found ({label}) for {game_name} (AppID: {appid}): {resp.status_code}")
+                    return None, True
                 resp.raise_for_status()
-                image = Image.open(BytesIO(resp.content))
-                image.thumbnail(config.max_image_size, Image.Resampling.LANCZOS)
-                if image.mode in ('RGBA', 'LA', 'P'):
-                    rgb_image = Image.new('RGB', image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                    image = rgb_image
-                out_path = cache_dir / f"appid_{appid}.jpg"
-                image.save(out_path, 'JPEG', quality=config.image_quality, optimize=True)
+                out_path = self._save_cache_image(Image.open(BytesIO(resp.content)), cache_dir / f"appid_{appid}.jpg")
                 debug_log(f"Fetched Steam image for {game_name} (AppID: {appid}) via {label} -> {out_path}")
-                return str(out_path)
+                return str(out_path), False
             except Exception as e:
                 debug_log(f"Image download failed ({label}) for {game_name} (AppID: {appid}): {e}")
-                return None
+                return None, False
+
+        # AppID-keyed local artwork (Steam's librarycache for installed games)
+        found = self._cache_local_artwork([p for p in self.artwork_providers if p.needs_appid],
+                                          game_name, appid, game, cache_dir / f"appid_{appid}.jpg")
+        if found:
+            return found
+
+        # Known-missing art (demos, tools, delisted apps): no requests until the backoff expires
+        miss_key = f"appid:{appid}"
+        if self.artwork_misses.blocked(miss_key):
+            return str(self.no_image_path)
 
         try:
             # Primary: Steam CDN Akamai header.jpg
             steam_image_url = f"https://cdn.akamai.steamstatic.com/steam/apps/{appid}/header.jpg"
-            response = self._requests_session.get(steam_image_url, stream=True, timeout=config.image_download_timeout)
+            response = self._http_get(steam_image_url, stream=True, timeout=config.image_download_timeout)
             if response.status_code == 200:
-                image = Image.open(BytesIO(response.content))
-                image.thumbnail(config.max_image_size, Image.Resampling.LANCZOS)
-                if image.mode in ('RGBA', 'LA', 'P'):
-                    rgb_image = Image.new('RGB', image.size, (255, 255, 255))
-                    rgb_image.paste(image, mask=image.split()[-1] if image.mode == 'RGBA' else None)
-                    image = rgb_image
-                image_path = cache_dir / f"appid_{appid}.jpg"
-                image.save(image_path, 'JPEG', quality=config.image_quality, optimize=True)
+                image_path = self._save_cache_image(Image.open(BytesIO(response.content)), cache_dir / f"appid_{appid}.jpg")
                 debug_log(f"Fetched Steam image for {game_name} (AppID: {appid}) via CDN -> {image_path}")
+                self.artwork_misses.clear(miss_key)
                 return str(image_path)
 
             # Fallback: Steam Store API — gets the actual hosted image URL for demos/DLC/edge cases
             debug_log(f"CDN returned {response.status_code} for {game_name} (AppID: {appid}), trying Store API")
             store_url = f"https://store.steampowered.com/api/appdetails?appids={appid}&filters=basic"
-            store_resp = self._requests_session.get(store_url, timeout=config.image_download_timeout)
+            store_resp = self._http_get(store_url, timeout=config.image_download_timeout)
+            store_missing = False
             if store_resp.status_code == 200:
                 store_data = store_resp.json()
                 app_info = store_data.get(str(appid), {})
                 if app_info.get('success'):
-                    header_image = app_info.get('data', {}).get('header_image')
-                    if header_image:
-                        result = _download_and_cache_image(header_image, "Store API header_image")
-                        if result:
-                            return result
-                    # Also try capsule_image if header_image not found/failed
-                    capsule_image = app_info.get('data', {}).get('capsule_image')
-                    if capsule_image:
-                        result = _download_and_cache_image(capsule_image, "Store API capsule_image")
+                    data = app_info.get('data', {})
+                    # header_image first, then capsule_image if it is not found/failed
+                    gone = []
+                    for field in ('header_image', 'capsule_image'):
+                        if not data.get(field):
+                            continue
+                        result, missing = _download_and_cache_image(data[field], f"Store API {field}")
                         if result:
+                            self.artwork_misses.clear(miss_key)
                             return result
+                        gone.append(missing)
+                    # No artwork listed, or every listed image is gone
+                    store_missing = all(gone)
+                else:
+                    store_missing = True
+            elif 400 <= store_resp.status_code < 500 and store_resp.status_code != 429:
+                # Delisted or region-locked apps
+                store_missing = True
+            # Only definitive answers from both the CDN and the store count as
+            # missing art; throttling, server errors (5xx/429) and failed image
+            # downloads are retried on the next pass as before
+            if response.status_code in (403, 404) and store_missing:
+                ttl = self.artwork_misses.record_miss(miss_key)
+                debug_log(f"No Steam artwork for {game_name} (AppID: {appid}); not asking again for {ttl / 3600:.0f} h")
 
         except (requests.RequestException, OSError, Image.UnidentifiedImageError) as e:
             debug_log(f"Error fetching Steam image for {game_name} (AppID: {appid}): {e}")
@@ -1290,45 +1711,89 @@ class GameScanner:
         return str(self.no_image_path)
 
     def _init_app_list_async(self):
-        """Background thread: build the app list (local manifests / disk cache),
-        then top it up from SteamSpy, then let the UI retry missing thumbnails."""
+        """Background thread: map the Steam app index (or build a small one from
+        local manifests), then refresh the catalogue from SteamSpy if it is
+        stale, then let the UI retry missing thumbnails."""
         try:
-            self.steam_app_list = self._build_local_steam_app_list()
-            self._steam_index_dirty = True
-            self._load_steamspy_app_list_async()
+            index = self._open_steam_app_index()
+            if index is None:
+                self._set_steam_app_index(SteamAppIndex.from_mapping(self._build_local_steam_app_list()),
+                                          partial=True)
+                self._load_steamspy_app_list_async()
+            else:
+                self._set_steam_app_index(index)
         except Exception as e:
             debug_log(f"App list initialization failed: {e}")
         # Fire the retry callback on every path (fresh cache included), not just
         # after a SteamSpy download
+        self._notify_app_list_ready()
+
+    def _notify_app_list_ready(self):
         if callable(self.on_app_list_ready):
             try:
                 self.on_app_list_ready()
             except Exception as e:
                 debug_log(f"on_app_list_ready callback failed: {e}")
 
+    @property
+    def steam_app_index(self):
+        return self._app_index_state[0]
+
+    @steam_app_index.setter
+    def steam_app_index(self, index):
+        self._set_steam_app_index(index)
+
+    def _set_steam_app_index(self, index, partial=False):
+        """Swap in a new app index and forget lookups made against the old one.
+        The index, its lookup cache and whether it is only part of the
+        catalogue are published as one tuple, so a reader never pairs an
+        index with the other one's cached answers."""
+        self._app_index_state = (index, {}, partial)
+
+    def take_provisional_appids(self):
+        """Lowercase names whose AppID came from a partial app index, to be
+        resolved again; empty (and kept) while the index is still partial."""
+        if self._app_index_state[2]:
+            return set()
+        with self._provisional_lock:
+            names, self._provisional_appids = self._provisional_appids, set()
+        return names
+
+    @staticmethod
+    def _app_list_is_fresh(path):
+        try:
+            cache_age_days = (time.time() - path.stat().st_mtime) / (24 * 60 * 60)
+        except OSError:
+            return False
+        return cache_age_days < config.steam_app_list_cache_days
+
+    def _open_steam_app_index(self):
+        """Map the on-disk app index if the catalogue is fresh. A fresh
+        steam_app_list.json without a usable index (older versions) is
+        converted once. Returns None when the catalogue needs a refresh."""
+        app_list_cache_path = Path(config.steam_app_list_cache_path)
+        index_path = Path(config.steam_app_index_path)
+        if not self._app_list_is_fresh(app_list_cache_path):
+            return None
+        if index_path.exists() and index_path.stat().st_mtime >= app_list_cache_path.stat().st_mtime:
+            index = open_index(index_path)
+            if index is not None:
+                return index
+        try:
+            with open(app_list_cache_path, 'r', encoding='utf-8') as f:
+                apps = json.load(f)
+            write_index(index_path, apps)
+            debug_log(f"Built Steam app index from disk cache: {len(apps)} apps")
+        except Exception as e:
+            debug_log(f"Cache read error, falling back to local manifests: {e}")
+            return None
+        return open_index(index_path)
+
     def _build_local_steam_app_list(self):
         """Build a name→AppID map from locally installed Steam manifest files.
         This is instant (no network), covers all games the user has installed on Steam,
         and is used immediately on startup while the full SteamSpy list downloads."""
-        # Check disk cache first (populated by the SteamSpy background loader)
-        app_list_cache_path = Path(config.steam_app_list_cache_path)
-        if app_list_cache_path.exists():
-            cache_age_days = (time.time() - app_list_cache_path.stat().st_mtime) / (24 * 60 * 60)
-            if cache_age_days < config.steam_app_list_cache_days:
-                try:
-                    with open(app_list_cache_path, 'r', encoding='utf-8') as f:
-                        apps = json.load(f)
-                    self._normalized_steam_app_map = {
-                        re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9\s]', ' ', name)).strip(): appid
-                        for name, appid in apps.items()
-                    }
-                    debug_log(f"Loaded {len(apps)} Steam apps from disk cache")
-                    return apps
-                except Exception as e:
-                    debug_log(f"Cache read error, falling back to local manifests: {e}")
-
         apps = {}
-        normalized_apps = {}
         steam_dirs = []
 
         # Collect all Steam library paths from libraryfolders.vdf
@@ -1355,79 +1820,79 @@ class GameScanner:
                     name = (state.get('name') or '').strip()
                     appid = str(state.get('appid') or '')
                     if name and appid:
-                        key = name.lower()
-                        apps[key] = appid
-                        norm = re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9\s]', ' ', key)).strip()
-                        normalized_apps[norm] = appid
+                        apps[name.lower()] = appid
                 except Exception:
                     pass
 
-        self._normalized_steam_app_map = normalized_apps
         debug_log(f"Built local Steam app list from manifests: {len(apps)} games")
         return apps
 
+    # Seconds before the first live index rebuild while catalogue pages arrive;
+    # doubled after each one, since a rebuild re-indexes every name so far
+    _APP_INDEX_MERGE_INTERVAL = 3.0
+
     def _load_steamspy_app_list_async(self):
-        """Background thread: download the SteamSpy catalogue page by page and
-        merge it into steam_app_list.  Persists to disk so subsequent launches
-        are instant.  Calls self.on_app_list_ready() when done so the UI can
-        schedule a thumbnail retry for games that had no image."""
+        """Background thread: download the SteamSpy catalogue (a few pages at a
+        time, resuming from per-page checkpoints) and merge it into the app
+        index as pages arrive, at doubling intervals, so lookups made during
+        the download already see most of it.  A complete catalogue is
+        persisted as the JSON list and its binary index, so subsequent
+        launches only map the index; an incomplete one is kept in memory and
+        the next launch resumes the missing pages.  Names matched while the
+        index is partial are remembered (see take_provisional_appids); the
+        single on_app_list_ready() call after this returns lets the UI
+        resolve them again and retry thumbnails for games that had no image."""
         app_list_cache_path = Path(config.steam_app_list_cache_path)
         # Skip download if cache is fresh
-        if app_list_cache_path.exists():
-            cache_age_days = (time.time() - app_list_cache_path.stat().st_mtime) / (24 * 60 * 60)
-            if cache_age_days < config.steam_app_list_cache_days:
-                debug_log("SteamSpy cache is fresh, skipping download")
-                return
+        if self._app_list_is_fresh(app_list_cache_path):
+            debug_log("SteamSpy cache is fresh, skipping download")
+            return
 
         debug_log("Downloading SteamSpy app catalogue in background...")
-        apps = dict(self.steam_app_list)  # start from the local manifests
-        normalized_apps = dict(getattr(self, '_normalized_steam_app_map', {}))
-
+        local_apps = dict(self.steam_app_index.items())  # start from the local manifests
+        live = dict(local_apps)
+        last_merge = [time.monotonic()]
+        merge_interval = [self._APP_INDEX_MERGE_INTERVAL]
+
+        def on_page(page, page_apps):
+            live.update(page_apps)
+            if page_apps and time.monotonic() - last_merge[0] >= merge_interval[0]:
+                self._set_steam_app_index(SteamAppIndex.from_mapping(live), partial=True)
+                last_merge[0] = time.monotonic()
+                merge_interval[0] *= 2
+                debug_log(f"Steam app index updated mid-download: {len(live)} apps")
+
+        catalogue = SteamSpyCatalogue(self._requests_session, config.steamspy_pages_dir,
+                                      max_age_days=config.steam_app_list_cache_days,
+                                      workers=config.steamspy_workers,
+                                      interval=config.steamspy_request_interval)
         try:
-            page = 0
-            while True:
-                url = f"https://steamspy.com/api.php?request=all&page={page}"
-                try:
-                    resp = requests.get(url, timeout=15)
-                    resp.raise_for_status()
-                    data = resp.json()
-                except Exception as e:
-                    debug_log(f"SteamSpy page {page} failed: {e}")
-                    break
-                if not data:
-                    break
-                for appid_str, info in data.items():
-                    name = (info.get('name') or '').strip()
-                    if not name or len(name) < 2:
-                        continue
-                    if re.match(r'^(dlc|demo|beta|test)\b', name.lower()):
-                        continue
-                    key = name.lower()
-                    apps[key] = appid_str
-                    norm = re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9\s]', ' ', key)).strip()
-                    normalized_apps[norm] = appid_str
-                debug_log(f"SteamSpy page {page}: {len(data)} entries, total {len(apps)}")
-                page += 1
-                if page > 50:  # safety cap — 50 000 games is ample
-                    break
-                time.sleep(0.5)  # be polite to the API
-
+            pages, complete = catalogue.fetch(on_page)
         except Exception as e:
             debug_log(f"SteamSpy download aborted: {e}")
+            pages, complete = {}, False
+        apps = dict(local_apps)
+        apps.update(pages)
+
+        index = None
+        if complete:
+            # Persist to disk: the JSON list (shared with other tools) and the
+            # binary index the next launch maps
+            try:
+                app_list_cache_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(app_list_cache_path, 'w', encoding='utf-8') as f:
+                    json.dump(apps, f, separators=(',', ':'))
+                write_index(config.steam_app_index_path, apps)
+                index = open_index(config.steam_app_index_path)
+                debug_log(f"SteamSpy catalogue saved: {len(apps)} games")
+            except Exception as e:
+                debug_log(f"Failed to save SteamSpy cache: {e}")
+        else:
+            debug_log(f"SteamSpy catalogue incomplete ({len(pages)} apps); the next launch resumes it")
 
-        # Persist to disk
-        try:
-            app_list_cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(app_list_cache_path, 'w', encoding='utf-8') as f:
-                json.dump(apps, f, separators=(',', ':'))
-            debug_log(f"SteamSpy catalogue saved: {len(apps)} games")
-        except Exception as e:
-            debug_log(f"Failed to save SteamSpy cache: {e}")
-
-        # Update in-memory maps atomically
-        self.steam_app_list = apps
-        self._normalized_steam_app_map = normalized_apps
-        self._steam_index_dirty = True
+        # Swap the index in one step
+        self._set_steam_app_index(index if index is not None else SteamAppIndex.from_mapping(apps),
+                                  partial=not complete)
         debug_log("Steam app list ready — notifying UI for thumbnail retry")
 
         # (UI notification happens in _init_app_list_async so it fires on every
@@ -1551,48 +2016,15 @@ class GameScanner:
         re.IGNORECASE,
     )
 
-    def _ensure_steam_app_index(self):
-        """Build the token index for subset matching (lazily, thread-safe).
-        Maps each name token → set of app-list keys containing it, so a lookup
-        intersects a few small sets instead of regex-scanning 50k entries."""
-        if not self._steam_index_dirty:
-            return
-        with self._steam_index_lock:
-            if not self._steam_index_dirty:
-                return
-            token_index = {}
-            key_token_counts = {}
-            for name_key in (self.steam_app_list or {}):
-                key_norm = re.sub(r'[^a-z0-9\s]', ' ', name_key).strip()
-                key_tokens = set(key_norm.split())
-                if not key_tokens:
-                    continue
-                key_token_counts[name_key] = len(key_tokens)
-                for tok in key_tokens:
-                    token_index.setdefault(tok, set()).add(name_key)
-            self._steam_token_index = token_index
-            self._steam_key_token_counts = key_token_counts
-            self._appid_lookup_cache = {}
-            self._steam_index_dirty = False
-            debug_log(f"Steam app token index built: {len(key_token_counts)} names, {len(token_index)} tokens")
-
     def _get_appid_from_name(self, game_name):
-        """Get Steam AppID from game name (memoized per app-list generation)."""
-        normalized_game_name = (game_name or '').lower().strip()
-        if not normalized_game_name:
-            return None
-        self._ensure_steam_app_index()
-        cache = self._appid_lookup_cache
-        if normalized_game_name in cache:
-            return cache[normalized_game_name]
-        result = self._get_appid_from_name_uncached(game_name, normalized_game_name)
-        cache[normalized_game_name] = result
-        return result
-
-    def _get_appid_from_name_uncached(self, game_name, normalized_game_name):
-        """Get Steam AppID from game name with fallback handling"""
-
-        # Build the list of name variants to try (strip platform/edition suffixes progressively)
+        """Get Steam AppID from game name (memoized per app-list generation).
+        Concurrent lookups of one name against the same index run the staged
+        match once."""
+        key = (id(self.steam_app_index), (game_name or '').lower().strip())
+        return self._appid_flights.do(key, lambda: self.resolve_appids([game_name]).get(game_name))
+
+    def _name_variants(self, normalized_game_name):
+        """The lowercase name, then progressively stripped of platform/edition suffixes."""
         variants = [normalized_game_name]
         stripped = normalized_game_name
         while True:
@@ -1601,52 +2033,73 @@ class GameScanner:
                 break
             variants.append(new)
             stripped = new
-
-        for candidate in variants:
+        return variants
+
+    def resolve_appids(self, names):
+        """Resolve many game names to Steam AppIDs in one batch.
+
+        Names are lowercased and deduplicated once; unresolved ones then go
+        through the same stages as a single lookup, each stage run over the
+        whole batch: for every name variant (edition/platform suffixes
+        stripped) an exact, a normalized and a token-subset match, then a
+        fuzzy match for whatever is left. Returns {name: appid or None};
+        results are memoized per app-list generation."""
+        index, cache, partial = self._app_index_state
+        keys = {name: (name or '').lower().strip() for name in names}
+        pending = {key for key in keys.values() if key and key not in cache}
+        if pending:
+            found = self._resolve_appid_keys(index, pending)
+            for key in pending:
+                cache[key] = found.get(key)
+                if key not in found:
+                    debug_log(f"No Steam AppID found for '{key}'")
+        if partial:
+            with self._provisional_lock:
+                self._provisional_appids.update(key for key in keys.values() if key and cache.get(key))
+        return {name: cache.get(key) if key else None for name, key in keys.items()}
+
+    def _resolve_appid_keys(self, index, keys):
+        """Staged matching for resolve_appids: {lowercase name: appid} for the keys found."""
+        found = {}
+        variants = {key: self._name_variants(key) for key in keys}
+        depth = max(len(v) for v in variants.values())
+        for level in range(depth):
+            todo = [(key, v[level]) for key, v in variants.items() if level < len(v) and key not in found]
             # 1. Exact match
-            if candidate in self.steam_app_list:
-                return self.steam_app_list[candidate]
-
+            for key, candidate in todo:
+                appid = index.get(candidate)
+                if appid:
+                    found[key] = appid
             # 2. Normalized (punctuation-stripped) match
-            norm = re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9\s]', ' ', candidate)).strip()
-            if hasattr(self, '_normalized_steam_app_map') and norm in self._normalized_steam_app_map:
-                return self._normalized_steam_app_map[norm]
-
-            # 3. Token-subset match via the token index: all query tokens must
+            norms = {}
+            for key, candidate in todo:
+                if key in found:
+                    continue
+                norms[key] = normalize_name(candidate)
+                appid = index.get_normalized(norms[key])
+                if appid:
+                    found[key] = appid
+            # 3. Token-subset match via the token postings: all query tokens must
             # appear in the Steam name; prefer the name with fewest tokens.
-            tokens = set(norm.split())
-            if not tokens:
-                continue
-            candidate_keys = None
-            for tok in tokens:
-                keys = self._steam_token_index.get(tok)
-                if not keys:
-                    candidate_keys = set()
-                    break
-                candidate_keys = set(keys) if candidate_keys is None else (candidate_keys & keys)
-            best_match = None
-            best_score = 0
-            for name_key in (candidate_keys or ()):
-                score = self._steam_key_token_counts.get(name_key, 0)
-                if best_match is None or score < best_score:
-                    best_score = score
-                    best_match = self.steam_app_list.get(name_key)
-            if best_match:
-                return best_match
-
-        # 4. Last resort: difflib fuzzy match on the original normalized name
-        norm_orig = re.sub(r'\s+', ' ', re.sub(r'[^a-z0-9\s]', ' ', normalized_game_name)).strip()
-        if len(norm_orig) >= 4 and hasattr(self, '_normalized_steam_app_map') and self._normalized_steam_app_map:
-            try:
-                import difflib
-                candidates = list(self._normalized_steam_app_map.keys())
-                matches = difflib.get_close_matches(norm_orig, candidates, n=1, cutoff=0.82)
-                if matches:
-                    appid = self._normalized_steam_app_map[matches[0]]
-                    debug_log(f"Found appid via fuzzy match for '{game_name}' -> '{matches[0]}' -> {appid}")
-                    return appid
-            except Exception:
-                pass
-
-        debug_log(f"No Steam AppID found for '{game_name}'")
-        return None
\ No newline at end of file
+            for key, norm in norms.items():
+                tokens = name_tokens(norm) if key not in found else None
+                if tokens:
+                    appid = index.best_token_match(tokens)
+                    if appid:
+                        found[key] = appid
+
+        # 4. Last resort: fuzzy match on the original normalized name (difflib
+        # ratio >= 0.82 over trigram-ranked candidates)
+        if len(index):
+            for key in keys - found.keys():
+                norm_orig = normalize_name(key)
+                if len(norm_orig) < 4:
+                    continue
+                try:
+                    match = index.fuzzy_match(norm_orig, cutoff=0.82)
+                    if match:
+                        found[key] = index.get_normalized(match)
+                        debug_log(f"Found appid via fuzzy match for '{key}' -> '{match}' -> {found[key]}")
+                except Exception:
+                    pass
+        return found
@@ -0,0 +1,167 @@
+"""
+In-memory search index over the scanned games for OptiScaler-GUI.
+
+Each game is indexed under the tokens of its name, platform, engine and
+anti-cheat names, plus field terms (platform:steam, engine:unreal,
+anticheat:easyanticheat, installed:yes, verified:no, supported:yes). A query
+is a list of words that must all match; each word matches every indexed
+token it is a prefix of, so results narrow as the user types. Prefix lookups
+binary-search a sorted vocabulary, and the game sets of recent words are
+reused while a query is being typed.
+"""
+import re
+from bisect import bisect_left
+from scanner.steam_app_index import name_tokens
+
+# Field terms a query can use as field:value
+FIELDS = ("platform", "engine", "anticheat", "installed", "verified", "supported")
+_FIELD_ALIASES = {"ac": "anticheat", "anti-cheat": "anticheat"}
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def _flag(value):
+    return "yes" if value else "no"
+
+
+def game_terms(game):
+    """(plain tokens, field terms) a game is indexed under."""
+    platform = (getattr(game, 'platform', None) or '').lower()
+    engine = (getattr(game, 'engine', None) or '').lower()
+    anti_cheat = [ac.lower() for ac in (getattr(game, 'anti_cheat_list', None) or [])]
+
+    plain = name_tokens((getattr(game, 'name', None) or '').lower())
+    fields = {f"installed:{_flag(getattr(game, 'optiscaler_installed', False))}",
+              f"verified:{_flag(getattr(game, 'community_verified', False))}",
+              f"supported:{_flag(getattr(game, 'engine_supported', True))}",
+              f"anticheat:{_flag(anti_cheat)}"}
+    for field, values in (("platform", [platform]), ("engine", [engine]), ("anticheat", anti_cheat)):
+        for value in values:
+            tokens = name_tokens(value)
+            plain |= tokens
+            fields.update(f"{field}:{token}" for token in tokens)
+            squashed = _NON_ALNUM.sub('', value)
+            if squashed:
+                # "easy anti cheat" is also found as anticheat:easyanticheat
+                fields.add(f"{field}:{squashed}")
+    return plain, fields
+
+
+def parse_query(text):
+    """Query words as (vocabulary, prefix) pairs; vocabulary is 'plain' or 'field'."""
+    words = []
+    for word in (text or '').lower().split():
+        field, sep, value = word.partition(':')
+        field = _FIELD_ALIASES.get(field, field)
+        if sep and field in FIELDS:
+            words.append(('field', f"{field}:{_NON_ALNUM.sub('', value)}"))
+            continue
+        words.extend(('plain', token) for token in _NON_ALNUM.sub(' ', word).split())
+    return words
+
+
+class _Postings:
+    """term → set of game ids, with prefix lookup over a lazily sorted vocabulary."""
+
+    def __init__(self):
+        self.postings = {}
+        self._sorted = None
+
+    def add(self, term, game_id):
+        ids = self.postings.get(term)
+        if ids is None:
+            self.postings[term] = ids = set()
+            self._sorted = None
+        ids.add(game_id)
+
+    def discard(self, term, game_id):
+        ids = self.postings.get(term)
+        if ids is None:
+            return
+        ids.discard(game_id)
+        if not ids:
+            del self.postings[term]
+            self._sorted = None
+
+    def prefix(self, prefix):
+        if self._sorted is None:
+            self._sorted = sorted(self.postings)
+        terms = self._sorted
+        result = set()
+        for i in range(bisect_left(terms, prefix), len(terms)):
+            if not terms[i].startswith(prefix):
+                break
+            result |= self.postings[terms[i]]
+        return result
+
+
+class GameSearchIndex:
+    """Token and field postings over a set of Game objects (keyed by identity)."""
+
+    # Prefix results kept while a query is being typed
+    _CACHE_SIZE = 64
+
+    def __init__(self, games=()):
+        self._games = {}
+        self._terms = {}
+        self._vocab = {'plain': _Postings(), 'field': _Postings()}
+        self._cache = {}
+        self.add(games)
+
+    def __len__(self):
+        return len(self._games)
+
+    def add(self, games):
+        for game in games:
+            self._index(game)
+        self._cache.clear()
+
+    def remove(self, games):
+        for game in games:
+            self._unindex(id(game))
+        self._cache.clear()
+
+    def update(self, game):
+        """Re-index game after its fields changed (e.g. OptiScaler installed)."""
+        self._unindex(id(game))
+        self._index(game)
+        self._cache.clear()
+
+    def _index(self, game):
+        game_id = id(game)
+        if game_id in self._games:
+            self._unindex(game_id)
+        plain, fields = game_terms(game)
+        self._games[game_id] = game
+        self._terms[game_id] = (plain, fields)
+        for term in plain:
+            self._vocab['plain'].add(term, game_id)
+        for term in fields:
+            self._vocab['field'].add(term, game_id)
+
+    def _unindex(self, game_id):
+        if self._games.pop(game_id, None) is None:
+            return
+        plain, fields = self._terms.pop(game_id)
+        for term in plain:
+            self._vocab['plain'].discard(term, game_id)
+        for term in fields:
+            self._vocab['field'].discard(term, game_id)
+
+    def search(self, query):
+        """ids of the games matching every word of query (all games for a blank query)."""
+        result = None
+        for word in parse_query(query):
+            ids = self._cache.get(word)
+            if ids is None:
+                if len(self._cache) >= self._CACHE_SIZE:
+                    self._cache.clear()
+                ids = self._cache[word] = self._vocab[word[0]].prefix(word[1])
+            result = set(ids) if result is None else result & ids
+            if not result:
+                return set()
+        return set(self._games) if result is None else result
+
+    def filter(self, games, query):
+        """The games of the given sequence that match query, in order."""
+        ids = self.search(query)
+        return [game for game in games if id(game) in ids]
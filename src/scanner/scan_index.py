@@ -0,0 +1,195 @@
+"""
+Persistent incremental scan index for OptiScaler-GUI.
+
+Records each game folder's FolderFacts and detector results together with the
+directory signature (mtime/inode of every directory the facts were derived
+from), so a rescan only re-walks folders whose signature changed.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from scanner.detection_rules import detection_rules
+from utils.config import config
+from utils.debug import debug_log
+
+# Bump when FolderFacts fields or detector logic change so stale records are dropped
+INDEX_VERSION = 2
+
+# Directories modified within this window of the record time are "racy": the
+# mtime granularity can't prove nothing changed afterwards, so they re-walk
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+
+
+def normalize_key(path):
+    """Index key for a folder path (same normalization the scanner uses for dedup)."""
+    return os.path.normpath(str(path)).lower()
+
+
+def stat_signature(root, rel_dirs):
+    """Return [['.', mtime_ns, inode], [rel, mtime_ns], ...] for root and the
+    given relative directories, or None if any of them can no longer be stat'ed.
+    The root's inode catches a game folder replaced wholesale; child directory
+    changes always show up in their own mtime (and in the root's)."""
+    root = Path(root)
+    try:
+        st = os.stat(root)
+    except OSError:
+        return None
+    signature = [['.', st.st_mtime_ns, st.st_ino]]
+    for rel in rel_dirs:
+        if rel == '.':
+            continue
+        try:
+            signature.append([rel, os.stat(root / rel).st_mtime_ns])
+        except OSError:
+            return None
+    return signature
+
+
+def walk_signature(root_stat, entries):
+    """Build the stat_signature shape from data a scandir walk already holds:
+    the root's stat result plus (rel, DirEntry) pairs. DirEntry.stat() is
+    served from the directory listing on Windows, so this costs no syscalls there."""
+    signature = [['.', root_stat.st_mtime_ns, root_stat.st_ino]]
+    for rel, entry in entries:
+        try:
+            signature.append([rel, entry.stat().st_mtime_ns])
+        except OSError:
+            return None
+    return signature
+
+
+class ScanIndex:
+    """Thread-safe folder → facts index persisted as JSON under config.cache_dir.
+
+    Records are FolderFacts objects (serialized with to_dict / from_dict), so
+    detector results added to a record after it was stored are persisted too.
+    """
+
+    def __init__(self, index_path=None, factory=None):
+        self.index_path = Path(index_path or config.scan_index_path)
+        self._factory = factory
+        self._lock = threading.Lock()
+        # Serializes whole saves (snapshot + tmp write + replace): a scan and a
+        # status refresh can save at once and must not share the tmp file
+        self._save_lock = threading.Lock()
+        self._entries = {}
+        self._touched = set()
+        self._loaded = False
+        self.hits = 0
+        self.misses = 0
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                if not self.index_path.exists():
+                    return
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if (data.get('version') != INDEX_VERSION
+                        or data.get('max_scan_depth') != config.max_scan_depth
+                        or data.get('detection_rules') != detection_rules.fingerprint):
+                    debug_log("Scan index format/depth/detection rules changed; starting fresh")
+                    return
+                for key, record in (data.get('entries') or {}).items():
+                    try:
+                        self._entries[key] = self._factory(record) if self._factory else record
+                    except Exception:
+                        continue
+                debug_log(f"Loaded scan index: {len(self._entries)} folders")
+            except Exception as e:
+                debug_log(f"Failed to read scan index {self.index_path}: {e}")
+
+    @staticmethod
+    def is_valid(facts):
+        """True if the facts' recorded signature still matches the filesystem."""
+        recorded = getattr(facts, 'signature', None)
+        recorded_at = getattr(facts, 'recorded_at', 0) or 0
+        if not recorded:
+            return False
+        current = stat_signature(facts.root, [entry[0] for entry in recorded])
+        if current is None or current != recorded:
+            return False
+        # Racily-clean: a change in the same mtime tick would be invisible
+        return all(entry[1] < recorded_at - _RACY_WINDOW_NS for entry in recorded)
+
+    def lookup(self, path):
+        """Return the stored facts for path if its signature is unchanged, else None."""
+        self._ensure_loaded()
+        key = normalize_key(path)
+        with self._lock:
+            facts = self._entries.get(key)
+        if facts is not None and self.is_valid(facts):
+            with self._lock:
+                self._touched.add(key)
+                self.hits += 1
+            return facts
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def store(self, facts):
+        """Record freshly collected facts (must carry signature/recorded_at)."""
+        if not getattr(facts, 'signature', None):
+            return
+        self._ensure_loaded()
+        key = normalize_key(facts.root)
+        with self._lock:
+            self._entries[key] = facts
+            self._touched.add(key)
+
+    def begin_pass(self):
+        """Start a scan pass; save(prune=True) keeps only folders seen in it."""
+        with self._lock:
+            self._touched = set()
+            self.hits = 0
+            self.misses = 0
+
+    def save(self, prune=False):
+        """Persist the index. With prune, folders not seen this pass are dropped."""
+        self._ensure_loaded()
+        with self._save_lock:
+            return self._save(prune)
+
+    def _save(self, prune):
+        # Caller holds _save_lock
+        with self._lock:
+            if prune:
+                self._entries = {k: v for k, v in self._entries.items() if k in self._touched}
+            entries = {}
+            for key, facts in self._entries.items():
+                try:
+                    entries[key] = facts.to_dict() if hasattr(facts, 'to_dict') else facts
+                except Exception:
+                    continue
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'max_scan_depth': config.max_scan_depth,
+                           'detection_rules': detection_rules.fingerprint,
+                           'saved_at': int(time.time()), 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+            debug_log(f"Saved scan index: {len(entries)} folders ({self.hits} reused, {self.misses} walked)")
+            return True
+        except Exception as e:
+            debug_log(f"Failed to save scan index {self.index_path}: {e}")
+            return False
+
+    def clear(self):
+        """Forget every record and delete the on-disk index."""
+        with self._lock:
+            self._entries = {}
+            self._touched = set()
+            self._loaded = True
+        try:
+            self.index_path.unlink(missing_ok=True)
+        except Exception as e:
+            debug_log(f"Failed to delete scan index {self.index_path}: {e}")
@@ -0,0 +1,99 @@
+"""
+Shared, bounded scan scheduler for OptiScaler-GUI.
+
+Every launcher scan submits its per-folder work here instead of creating its
+own thread pool. One pool caps total concurrency (config.max_workers), and a
+per-drive limit (config.scan_workers_per_drive) keeps a single spinning disk
+from being hit by every worker at once while separate drives still scan in
+parallel.
+"""
+import concurrent.futures
+import os
+import threading
+from collections import deque
+from pathlib import Path
+from utils.config import config
+from utils.debug import debug_log
+
+
+def drive_key(path):
+    """Identify the physical volume a path lives on: the drive letter / UNC
+    share on Windows, the device number elsewhere."""
+    try:
+        drive, _ = os.path.splitdrive(os.path.abspath(str(path)))
+        if drive:
+            return drive.upper()
+        return f"dev:{os.stat(path).st_dev}"
+    except (OSError, ValueError):
+        return ''
+
+
+class ScanScheduler:
+    """Runs submitted tasks on one shared pool, at most per_drive at a time per drive.
+
+    Tasks waiting for their drive's slot stay in that drive's queue, so a busy
+    drive never occupies more than per_drive pool workers and never delays work
+    queued for other drives.
+    """
+
+    def __init__(self, max_workers=None, per_drive=None):
+        self.max_workers = max(1, int(max_workers or getattr(config, 'max_workers', 4)))
+        self.per_drive = max(1, int(per_drive or getattr(config, 'scan_workers_per_drive', 2)))
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers,
+                                                           thread_name_prefix="scan")
+        self._lock = threading.Lock()
+        self._queues = {}
+        self._active = {}
+
+    def submit(self, drive, fn, *args):
+        """Queue fn(*args) against drive (see drive_key); returns a Future."""
+        future = concurrent.futures.Future()
+        with self._lock:
+            self._queues.setdefault(drive, deque()).append((future, fn, args))
+            self._active.setdefault(drive, 0)
+        self._dispatch(drive)
+        return future
+
+    def map_folder(self, root, fn, *args):
+        """Submit fn(entry, *args) for every entry of directory root; returns the futures."""
+        drive = drive_key(root)
+        return [self.submit(drive, fn, entry, *args) for entry in Path(root).iterdir()]
+
+    def _dispatch(self, drive):
+        """Hand queued tasks for drive to the pool while the drive has free slots."""
+        while True:
+            with self._lock:
+                queue = self._queues.get(drive)
+                if not queue or self._active[drive] >= self.per_drive:
+                    return
+                task = queue.popleft()
+                self._active[drive] += 1
+            try:
+                self._pool.submit(self._run, drive, *task)
+            except RuntimeError as e:
+                # Pool shut down: fail the task instead of leaving its future pending
+                with self._lock:
+                    self._active[drive] -= 1
+                task[0].set_exception(e)
+
+    def _run(self, drive, future, fn, args):
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            with self._lock:
+                self._active[drive] -= 1
+            self._dispatch(drive)
+
+    def shutdown(self, wait=False):
+        """Stop accepting work; queued tasks are cancelled."""
+        with self._lock:
+            pending = [task for queue in self._queues.values() for task in queue]
+            self._queues = {}
+        for future, _fn, _args in pending:
+            future.cancel()
+        self._pool.shutdown(wait=wait)
+        debug_log(f"Scan scheduler shut down ({len(pending)} queued tasks cancelled)")
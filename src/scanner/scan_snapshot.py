@@ -0,0 +1,102 @@
+"""
+Persisted scan snapshot for OptiScaler-GUI.
+
+The last scan result (every Game with its platform, engine, anti-cheat list,
+OptiScaler state and resolved image path) is kept as JSON under
+config.cache_dir, so the game list can be painted at startup before any
+folder is read, then revalidated in the background and patched with a diff.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from utils.config import config
+from utils.debug import debug_log
+
+SNAPSHOT_VERSION = 1
+
+# Game attributes that make a row look different when they change
+_COMPARED_FIELDS = ("name", "appid", "platform", "engine", "engine_supported",
+                    "anti_cheat_list", "community_verified", "optiscaler_installed")
+
+_lock = threading.Lock()
+
+
+def game_key(game):
+    """Identity of a game across scans: its normalized install path."""
+    return os.path.normpath(str(game.path)).lower()
+
+
+def load_snapshot(factory, path=None):
+    """Return the games from the last saved snapshot, or None if there is none."""
+    path = Path(path or config.scan_snapshot_path)
+    try:
+        if not path.exists():
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != SNAPSHOT_VERSION:
+            debug_log("Scan snapshot format changed; ignoring it")
+            return None
+        games = []
+        for record in data.get('games') or []:
+            try:
+                games.append(factory(record))
+            except Exception:
+                continue
+        debug_log(f"Loaded scan snapshot: {len(games)} games")
+        return games
+    except Exception as e:
+        debug_log(f"Failed to read scan snapshot {path}: {e}")
+        return None
+
+
+def save_snapshot(games, path=None):
+    """Atomically persist games (objects with to_dict) as the current snapshot."""
+    path = Path(path or config.scan_snapshot_path)
+    try:
+        records = [game.to_dict() for game in games]
+        with _lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': SNAPSHOT_VERSION, 'saved_at': int(time.time()), 'games': records},
+                          f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        debug_log(f"Failed to save scan snapshot {path}: {e}")
+        return False
+
+
+def delete_snapshot(path=None):
+    """Remove the on-disk snapshot."""
+    path = Path(path or config.scan_snapshot_path)
+    try:
+        with _lock:
+            path.unlink(missing_ok=True)
+    except Exception as e:
+        debug_log(f"Failed to delete scan snapshot {path}: {e}")
+
+
+def diff_games(old_games, new_games):
+    """Compare a displayed game list with a fresh scan.
+
+    Returns (added, removed, changed): new games not shown yet, shown games
+    that are gone, and (shown_game, fresh_game) pairs whose row-visible
+    fields differ.
+    """
+    old_by_key = {game_key(g): g for g in old_games}
+    new_keys = set()
+    added, changed = [], []
+    for game in new_games:
+        key = game_key(game)
+        new_keys.add(key)
+        old = old_by_key.get(key)
+        if old is None:
+            added.append(game)
+        elif any(getattr(old, f, None) != getattr(game, f, None) for f in _COMPARED_FIELDS):
+            changed.append((old, game))
+    removed = [g for k, g in old_by_key.items() if k not in new_keys]
+    return added, removed, changed
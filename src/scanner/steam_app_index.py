@@ -0,0 +1,335 @@
+"""
+Compact, memory-mapped Steam app-name index for OptiScaler-GUI.
+
+Replaces the ~50k-entry name→AppID dicts (plus the normalized-name map and
+the token index built from them) with one binary file written when the
+catalogue is refreshed. Opening it maps the file and reads a fixed header,
+so startup does no parsing; lookups binary-search the mapped tables and
+only the pages they touch are ever read.
+
+Layout (native byte order, recorded in the header; every section 8-byte aligned):
+    header      magic, version, byte order, counts and section offsets
+    names       sorted lowercase app names: u32 offsets[n+1] + UTF-8 blob
+    appids      u32 appid per name
+    tokcounts   u8 number of distinct tokens per name (capped at 255)
+    norms       sorted normalized names: u32 offsets[m+1] + UTF-8 blob
+    normappids  u32 appid per normalized name
+    tokens      sorted name tokens: u32 offsets[t+1] + UTF-8 blob
+    postings    u32 offsets[t+1] into a u32 array of sorted name indices
+    trigrams    sorted trigrams of the space-padded normalized names (same layout)
+    tripostings u32 offsets[g+1] into a u32 array of sorted normalized-name indices
+"""
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from difflib import get_close_matches
+from pathlib import Path
+from utils.debug import debug_log
+
+_MAGIC = b"OSAI"
+_VERSION = 2
+_BYTEORDER = 1 if sys.byteorder == "little" else 2
+# magic, version, byte order, n_names, n_norms, n_tokens, n_trigrams, then 12 section offsets
+_HEADER = struct.Struct("<4sIIIIII12Q")
+
+# Fuzzy matching scores at most this many trigram-ranked candidates with difflib
+FUZZY_CANDIDATES = 200
+
+_NON_ALNUM = re.compile(r'[^a-z0-9\s]')
+_SPACES = re.compile(r'\s+')
+
+
+def normalize_name(name_key):
+    """Punctuation-stripped, single-spaced form of a lowercase app name."""
+    return _SPACES.sub(' ', _NON_ALNUM.sub(' ', name_key)).strip()
+
+
+def name_tokens(name_key):
+    """Distinct alphanumeric tokens of a lowercase app name."""
+    return set(_NON_ALNUM.sub(' ', name_key).split())
+
+
+def name_trigrams(norm):
+    """Distinct trigrams of a normalized name, padded so word edges count."""
+    padded = f" {norm} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _u32_array(values=()):
+    return array("I", values)
+
+
+def _string_table(strings):
+    offsets = _u32_array([0])
+    blob = bytearray()
+    for s in strings:
+        blob += s
+        offsets.append(len(blob))
+    return offsets.tobytes(), bytes(blob)
+
+
+def _posting_sections(postings_by_key):
+    """Sorted key table, u32 posting offsets and u32 postings for key → indices."""
+    keys = sorted(postings_by_key)
+    offsets = _u32_array([0])
+    postings = _u32_array()
+    for key in keys:
+        postings.extend(postings_by_key[key])
+        offsets.append(len(postings))
+    table_offsets, table_blob = _string_table(keys)
+    return len(keys), [table_offsets + table_blob, offsets.tobytes(), postings.tobytes()]
+
+
+def build_index_bytes(apps):
+    """Serialize a name→appid mapping (lowercase names, numeric appids) to the index format."""
+    by_name = {}
+    by_norm = {}
+    for name_key, appid in apps.items():
+        try:
+            appid = int(appid)
+        except (TypeError, ValueError):
+            continue
+        if not name_key or not 0 <= appid < 2 ** 32:
+            continue
+        by_name[name_key.encode("utf-8")] = appid
+        # Later entries win, like the dicts this replaces
+        by_norm[normalize_name(name_key).encode("utf-8")] = appid
+
+    names = sorted(by_name)
+    norms = sorted(by_norm)
+    postings_by_token = {}
+    tokcounts = bytearray()
+    for i, raw in enumerate(names):
+        tokens = name_tokens(raw.decode("utf-8"))
+        tokcounts.append(min(len(tokens), 255))
+        for tok in tokens:
+            postings_by_token.setdefault(tok.encode("utf-8"), []).append(i)
+    postings_by_trigram = {}
+    for i, raw in enumerate(norms):
+        for gram in name_trigrams(raw.decode("utf-8")):
+            postings_by_trigram.setdefault(gram.encode("utf-8"), []).append(i)
+    n_tokens, token_sections = _posting_sections(postings_by_token)
+    n_trigrams, trigram_sections = _posting_sections(postings_by_trigram)
+
+    names_offsets, names_blob = _string_table(names)
+    norms_offsets, norms_blob = _string_table(norms)
+    sections = [
+        names_offsets + names_blob,
+        _u32_array(by_name[n] for n in names).tobytes(),
+        bytes(tokcounts),
+        norms_offsets + norms_blob,
+        _u32_array(by_norm[n] for n in norms).tobytes(),
+        *token_sections,
+        *trigram_sections,
+    ]
+    offsets = []
+    body = bytearray()
+    pos = _HEADER.size
+    for section in sections:
+        pad = -pos % 8
+        body += b"\0" * pad
+        pos += pad
+        offsets.append(pos)
+        body += section
+        pos += len(section)
+    offsets.append(pos)  # end of file
+    header = _HEADER.pack(_MAGIC, _VERSION, _BYTEORDER, len(names), len(norms), n_tokens, n_trigrams, *offsets)
+    return header + bytes(body)
+
+
+def write_index(path, apps):
+    """Atomically write the index for apps to path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(build_index_bytes(apps))
+    os.replace(tmp_path, path)
+
+
+class _StringTable:
+    """Sorted UTF-8 strings stored as u32 offsets followed by a blob."""
+
+    def __init__(self, buf, start, count):
+        self._buf = buf
+        self._count = count
+        self._offsets = memoryview(buf)[start:start + 4 * (count + 1)].cast("I")
+        self._blob = start + 4 * (count + 1)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        base = self._blob
+        return self._buf[base + self._offsets[i]:base + self._offsets[i + 1]]
+
+    def find(self, key):
+        """Index of the bytes key, or -1."""
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self[mid] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._count and self[lo] == key else -1
+
+
+class _PostingTable:
+    """Sorted keys, each with a sorted array of u32 indices."""
+
+    def __init__(self, buf, view, table, count, offsets, postings, end):
+        self._keys = _StringTable(buf, table, count)
+        self._offsets = view[offsets:offsets + 4 * (count + 1)].cast("I")
+        self._postings = view[postings:end].cast("I")
+
+    def get(self, key):
+        """Indices listed for the str key, or None."""
+        k = self._keys.find(key.encode("utf-8"))
+        if k < 0:
+            return None
+        return self._postings[self._offsets[k]:self._offsets[k + 1]]
+
+    def views(self):
+        return (self._keys._offsets, self._offsets, self._postings)
+
+
+class SteamAppIndex:
+    """Read-only name→AppID index over a buffer in the steam_app_index format."""
+
+    def __init__(self, buf, mapped=None):
+        self._mmap = mapped
+        self._view = memoryview(buf)
+        if len(buf) < _HEADER.size:
+            raise ValueError("not a compatible Steam app index")
+        (magic, version, byteorder, n_names, n_norms, n_tokens, n_trigrams,
+         names, appids, tokcounts, norms, normappids, tokens, post_offsets, postings,
+         trigrams, tri_offsets, tripostings, end) = _HEADER.unpack_from(buf, 0)
+        if magic != _MAGIC or version != _VERSION or byteorder != _BYTEORDER or end > len(buf):
+            raise ValueError("not a compatible Steam app index")
+        self._names = _StringTable(buf, names, n_names)
+        self._appids = self._view[appids:appids + 4 * n_names].cast("I")
+        self._tokcounts = self._view[tokcounts:tokcounts + n_names]
+        self._norms = _StringTable(buf, norms, n_norms)
+        self._normappids = self._view[normappids:normappids + 4 * n_norms].cast("I")
+        self._tokens = _PostingTable(buf, self._view, tokens, n_tokens, post_offsets, postings, trigrams)
+        self._trigrams = _PostingTable(buf, self._view, trigrams, n_trigrams, tri_offsets, tripostings, end)
+
+    @classmethod
+    def from_mapping(cls, apps):
+        """Build an in-memory index (used until the on-disk index exists)."""
+        return cls(build_index_bytes(apps))
+
+    @classmethod
+    def open(cls, path):
+        """Memory-map the index at path; raises OSError/ValueError if unusable."""
+        with open(path, 'rb') as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped, mapped)
+        except Exception:
+            mapped.close()
+            raise
+
+    def __len__(self):
+        return len(self._names)
+
+    def get(self, name_key):
+        """AppID (str) for an exact lowercase app name."""
+        i = self._names.find(name_key.encode("utf-8"))
+        return str(self._appids[i]) if i >= 0 else None
+
+    def get_normalized(self, norm):
+        """AppID (str) for a normalized app name (see normalize_name)."""
+        i = self._norms.find(norm.encode("utf-8"))
+        return str(self._normappids[i]) if i >= 0 else None
+
+    def best_token_match(self, tokens):
+        """AppID of the app whose name contains every token, preferring the
+        name with the fewest tokens; None if no name contains them all."""
+        postings = []
+        for tok in tokens:
+            posting = self._tokens.get(tok)
+            if not posting:
+                return None
+            postings.append(posting)
+        if not postings:
+            return None
+        postings.sort(key=len)
+        best, best_count = None, None
+        for i in postings[0]:
+            if all(_contains(p, i) for p in postings[1:]):
+                count = self._tokcounts[i]
+                if best is None or count < best_count:
+                    best, best_count = i, count
+        return str(self._appids[best]) if best is not None else None
+
+    def fuzzy_match(self, norm, cutoff=0.82, candidates=FUZZY_CANDIDATES):
+        """Closest normalized name to norm by difflib ratio (>= cutoff), or None.
+
+        Instead of scoring every name, candidates are ranked by the number of
+        trigrams they share with norm; names whose length alone rules out the
+        cutoff (difflib's real_quick_ratio bound) are skipped, and only the top
+        candidates are scored with difflib.get_close_matches."""
+        if not norm:
+            return None
+        shared = Counter()
+        for gram in name_trigrams(norm):
+            posting = self._trigrams.get(gram)
+            if posting:
+                shared.update(posting)
+        if not shared:
+            return None
+        offsets = self._norms._offsets
+        size = len(norm)
+        names = []
+        for i, _count in shared.most_common():
+            other = offsets[i + 1] - offsets[i]
+            if 2.0 * min(size, other) / (size + other) >= cutoff:
+                names.append(bytes(self._norms[i]).decode("utf-8"))
+                if len(names) >= candidates:
+                    break
+        matches = get_close_matches(norm, names, n=1, cutoff=cutoff)
+        return matches[0] if matches else None
+
+    def normalized_names(self):
+        """All normalized names, in sorted order."""
+        return [bytes(self._norms[i]).decode("utf-8") for i in range(len(self._norms))]
+
+    def items(self):
+        """Iterate (lowercase name, appid str) pairs."""
+        for i in range(len(self._names)):
+            yield bytes(self._names[i]).decode("utf-8"), str(self._appids[i])
+
+    def close(self):
+        """Release the mapping (the index must not be used afterwards)."""
+        if self._mmap is not None:
+            views = (self._names._offsets, self._appids, self._tokcounts, self._norms._offsets,
+                     self._normappids, *self._tokens.views(), *self._trigrams.views(), self._view)
+            for view in views:
+                view.release()
+            self._mmap.close()
+            self._mmap = None
+
+
+def _contains(sorted_view, value):
+    i = bisect_left(sorted_view, value)
+    return i < len(sorted_view) and sorted_view[i] == value
+
+
+def open_index(path):
+    """Open the index at path, or return None (logged) if missing or unreadable."""
+    try:
+        if not Path(path).exists():
+            return None
+        index = SteamAppIndex.open(path)
+        debug_log(f"Mapped Steam app index: {len(index)} apps")
+        return index
+    except Exception as e:
+        debug_log(f"Steam app index unreadable ({path}): {e}")
+        return None
@@ -0,0 +1,228 @@
+"""
+Concurrent, resumable SteamSpy catalogue download for OptiScaler-GUI.
+
+SteamSpy serves its app catalogue as numbered pages of ~1000 apps. Pages are
+fetched by a few worker threads behind one shared rate limiter, and every
+completed page is checkpointed to its own JSON file (with its ETag and
+Last-Modified) so that:
+- an interrupted download resumes with only the missing pages
+- a refresh asks for each page conditionally and reuses it on 304
+- callers can merge pages into the live app index as they arrive
+"""
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from utils.debug import debug_log
+
+STEAMSPY_URL = "https://steamspy.com/api.php"
+
+# Catalogue entries that are never games
+_NON_GAME = re.compile(r'^(dlc|demo|beta|test)\b')
+
+
+def filter_page(data):
+    """Lowercase name → appid for the games in one SteamSpy page."""
+    apps = {}
+    for appid_str, info in (data or {}).items():
+        name = ((info or {}).get('name') or '').strip()
+        if not name or len(name) < 2:
+            continue
+        key = name.lower()
+        if _NON_GAME.match(key):
+            continue
+        apps[key] = str(appid_str)
+    return apps
+
+
+class _RateLimiter:
+    """Spaces request starts at least interval seconds apart across threads."""
+
+    def __init__(self, interval):
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        """Block until this caller's turn; returns the start time it was given."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            time.sleep(start - now)
+        return start
+
+
+class SteamSpyCatalogue:
+    """Download the SteamSpy catalogue page by page into checkpoint files."""
+
+    def __init__(self, session, pages_dir, max_age_days=7, workers=3, interval=0.5,
+                 max_pages=51, url=STEAMSPY_URL, timeout=15, retries=2, backoff=2.0):
+        self.session = session
+        self.pages_dir = Path(pages_dir)
+        self.max_age = max_age_days * 24 * 60 * 60
+        self.workers = max(1, int(workers))
+        self.max_pages = max_pages
+        self.url = url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._limiter = _RateLimiter(interval)
+        self._lock = threading.Lock()
+        self._callback_lock = threading.Lock()
+        # Stats of the last fetch(): pages downloaded / reused on 304 / resumed from disk / failed
+        self.stats = {}
+
+    def _page_path(self, page):
+        return self.pages_dir / f"page_{page:04d}.json"
+
+    def _load_checkpoint(self, page):
+        try:
+            with open(self._page_path(page), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return None
+
+    def _save_checkpoint(self, page, record):
+        try:
+            self.pages_dir.mkdir(parents=True, exist_ok=True)
+            path = self._page_path(page)
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, separators=(',', ':'))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            debug_log(f"Failed to checkpoint SteamSpy page {page}: {e}")
+
+    def _is_current(self, record):
+        return bool(record) and time.time() - record.get('fetched_at', 0) < self.max_age
+
+    def _request(self, page, previous):
+        """GET one page (conditionally when a previous copy exists), with retries.
+        Returns (status, apps, headers, end) or raises the last error; end is
+        True for the empty page past the end of the catalogue."""
+        headers = {}
+        if previous:
+            if previous.get('etag'):
+                headers['If-None-Match'] = previous['etag']
+            if previous.get('last_modified'):
+                headers['If-Modified-Since'] = previous['last_modified']
+        for attempt in range(self.retries + 1):
+            self._limiter.wait()
+            resp = None
+            try:
+                resp = self.session.get(self.url, params={'request': 'all', 'page': page},
+                                        headers=headers, timeout=self.timeout)
+                if resp.status_code == 304 and previous:
+                    return 304, previous.get('apps', {}), resp.headers, bool(previous.get('end'))
+                resp.raise_for_status()
+                data = resp.json()
+                return resp.status_code, filter_page(data), resp.headers, not data
+            except Exception as e:
+                if attempt >= self.retries:
+                    raise
+                delay = self.backoff * (2 ** attempt)
+                try:
+                    # Honour the server's pacing on 429/503
+                    delay = float(resp.headers['Retry-After'])
+                except Exception:
+                    pass
+                debug_log(f"SteamSpy page {page} attempt {attempt + 1} failed ({e}); retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+    def fetch(self, on_page=None):
+        """Download every page not already checkpointed in this refresh cycle.
+        A page that still fails after its retries stops the run; pages already
+        checkpointed are kept for the next attempt.
+
+        on_page(page, apps) is called (serialized) for each page as it becomes
+        available, resumed pages first. Returns (apps, complete): the merged
+        catalogue in page order, and whether every page up to the end of the
+        catalogue is now checkpointed."""
+        pages = {}
+        end_page = None
+        stale = {}
+        # Resume: pages fetched in this refresh cycle are reused as they are
+        for page in range(self.max_pages):
+            record = self._load_checkpoint(page)
+            if self._is_current(record):
+                pages[page] = record.get('apps', {})
+                if record.get('end'):
+                    end_page = page if end_page is None else min(end_page, page)
+            elif record:
+                stale[page] = record
+        self.stats = {'downloaded': 0, 'not_modified': 0, 'resumed': len(pages), 'failed': 0}
+        if on_page:
+            for page in sorted(pages):
+                on_page(page, pages[page])
+
+        todo = iter([p for p in range(self.max_pages) if p not in pages])
+        failed = set()
+        state = {'end': end_page, 'abort': False}
+
+        def next_page():
+            with self._lock:
+                if state['abort']:
+                    return None
+                for page in todo:
+                    if state['end'] is None or page < state['end']:
+                        return page
+                return None
+
+        def worker():
+            while True:
+                page = next_page()
+                if page is None:
+                    return
+                try:
+                    status, apps, headers, is_end = self._request(page, stale.get(page))
+                except Exception as e:
+                    debug_log(f"SteamSpy page {page} failed: {e}; stopping (resumes next time)")
+                    with self._lock:
+                        failed.add(page)
+                        self.stats['failed'] += 1
+                        # Offline or throttled: don't burn retries on every other page
+                        state['abort'] = True
+                    return
+                previous = stale.get(page) or {}
+                record = {
+                    'fetched_at': time.time(),
+                    'etag': headers.get('ETag') or previous.get('etag'),
+                    'last_modified': headers.get('Last-Modified') or previous.get('last_modified'),
+                    'end': is_end,
+                    'apps': apps,
+                }
+                self._save_checkpoint(page, record)
+                with self._lock:
+                    self.stats['not_modified' if status == 304 else 'downloaded'] += 1
+                    pages[page] = apps
+                    if record['end']:
+                        state['end'] = page if state['end'] is None else min(state['end'], page)
+                        debug_log(f"SteamSpy catalogue ends at page {page}")
+                if on_page:
+                    with self._callback_lock:
+                        on_page(page, apps)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(self.workers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        last = state['end'] if state['end'] is not None else self.max_pages
+        # Workers already in flight may have fetched a few pages past the end
+        for page in range(last + 1, self.max_pages):
+            try:
+                self._page_path(page).unlink(missing_ok=True)
+            except Exception:
+                pass
+        complete = all(p in pages for p in range(last)) and not any(p < last for p in failed)
+        merged = {}
+        for page in sorted(pages):
+            if page < last:
+                merged.update(pages[page])
+        debug_log(f"SteamSpy catalogue: {len(merged)} apps, {self.stats}, complete={complete}")
+        return merged, complete
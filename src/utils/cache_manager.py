@@ -6,6 +6,7 @@ import time
 import shutil
 from pathlib import Path
 from utils.config import config
+from utils.image_cache_index import image_index_for
 
 class CacheManager:
     """Manages cache directories and cleanup operations"""
@@ -14,6 +15,8 @@ class CacheManager:
         self.cache_dir = Path(config.cache_dir)
         self.game_cache_dir = Path(config.game_cache_dir)
         self._session_cleanup_done = False
+        # Images accessed after this are on screen this session and never evicted by size
+        self._session_start = time.time()
     
     def get_cache_size(self):
         """Get total cache size in MB"""
@@ -59,22 +62,14 @@ class CacheManager:
         return stats
     
     def cleanup_old_images(self, max_age_days=30):
-        """Remove old cached images"""
-        removed_count = 0
-        removed_size = 0
+        """Remove cached images not used for max_age_days (by last access in the
+        image index), together with their thumbnails"""
         cutoff_time = time.time() - (max_age_days * 24 * 60 * 60)
-        
         try:
-            for image_file in self.game_cache_dir.glob('*'):
-                if image_file.is_file() and image_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                    if image_file.stat().st_mtime < cutoff_time:
-                        size = image_file.stat().st_size
-                        image_file.unlink()
-                        removed_count += 1
-                        removed_size += size
+            removed_count, removed_size = image_index_for(self.game_cache_dir).evict(older_than=cutoff_time)
         except (OSError, PermissionError) as e:
             print(f"Error cleaning up old images: {e}")
-        
+            return 0, 0.0
         return removed_count, removed_size / (1024 * 1024)
     
     def cleanup_large_cache_once(self):
@@ -88,6 +83,14 @@ class CacheManager:
 
     def cleanup_large_cache(self):
         """Clean up cache if it exceeds size limit"""
+        # Thumbnails of no cached image are never shown again, whatever the cache size
+        try:
+            removed_count, removed_size = image_index_for(self.game_cache_dir).prune_thumbnails()
+            if removed_count > 0:
+                print(f"Removed {removed_count} orphaned thumbnails ({removed_size / (1024 * 1024):.1f} MB)")
+        except (OSError, PermissionError) as e:
+            print(f"Error removing orphaned thumbnails: {e}")
+
         current_size = self.get_cache_size()
         
         if current_size > config.max_cache_size_mb:
@@ -104,35 +107,26 @@ class CacheManager:
                 self._cleanup_by_size()
     
     def _cleanup_by_size(self):
-        """Remove oldest files until cache is under size limit"""
-        try:
-            # Get all image files with their modification times
-            image_files = []
-            for image_file in self.game_cache_dir.glob('*'):
-                if image_file.is_file() and image_file.suffix.lower() in ['.jpg', '.jpeg', '.png', '.webp']:
-                    image_files.append((image_file.stat().st_mtime, image_file))
-            
-            # Sort by modification time (oldest first)
-            image_files.sort()
-
-            removed_count = 0
-            removed_size = 0
+        """Remove least-recently-used images until cache is under size limit.
 
-            # Compute the size once and keep a running total — re-scanning the
-            # whole cache dir per deleted file made this O(N²)
-            current_size = self.get_cache_size()
-            for mtime, image_file in image_files:
-                if current_size <= config.max_cache_size_mb * 0.8:  # Leave some margin
-                    break
-
-                size = image_file.stat().st_size
-                image_file.unlink()
-                removed_count += 1
-                removed_size += size
-                current_size -= size / (1024 * 1024)
-            
+        Only indexed images and their thumbnails can be evicted; the catalogue,
+        scan index and other cache files stay. The images get what the limit
+        leaves after those files, but at least what this session has shown."""
+        try:
+            index = image_index_for(self.game_cache_dir)
+            image_bytes = index.total_bytes
+            other_bytes = max(0, int(self.get_cache_size() * 1024 * 1024) - image_bytes)
+            target_bytes = int(config.max_cache_size_mb * 0.8 * 1024 * 1024)  # Leave some margin
+            session_bytes = index.bytes_accessed_since(self._session_start)
+            max_image_bytes = max(session_bytes, target_bytes - other_bytes)
+            if other_bytes > target_bytes:
+                print(f"Non-image cache files ({other_bytes / (1024 * 1024):.1f} MB) exceed the cache limit; "
+                      f"keeping the {session_bytes / (1024 * 1024):.1f} MB of images used this session")
+            if max_image_bytes >= image_bytes:
+                return
+            removed_count, removed_size = index.evict(max_bytes=max_image_bytes)
             if removed_count > 0:
-                print(f"Removed {removed_count} oldest images ({removed_size / (1024 * 1024):.1f} MB)")
+                print(f"Removed {removed_count} least recently used images ({removed_size / (1024 * 1024):.1f} MB)")
                 
         except (OSError, PermissionError) as e:
             print(f"Error cleaning up cache by size: {e}")
@@ -142,6 +136,7 @@ class CacheManager:
         try:
             if self.cache_dir.exists():
                 shutil.rmtree(self.cache_dir)
+                image_index_for(self.game_cache_dir).clear()
                 self.cache_dir.mkdir(exist_ok=True)
                 self.game_cache_dir.mkdir(exist_ok=True)
                 print("All cache cleared")
@@ -65,6 +65,19 @@ class Config:
         default_workers = min(8, cpu_count * 4)
         # allow persisted override from config.json
         self.max_workers = int(self._settings.get('max_workers', default_workers))
+        # Scan tasks allowed on one drive at a time (keeps HDDs from seek-thrashing)
+        self.scan_workers_per_drive = int(self._settings.get('scan_workers_per_drive', 2))
+        # SteamSpy catalogue download: pages fetched at once, and the minimum
+        # spacing in seconds between request starts (be polite to the API)
+        self.steamspy_workers = int(self._settings.get('steamspy_workers', 3))
+        self.steamspy_request_interval = float(self._settings.get('steamspy_request_interval', 0.5))
+        # Artwork download pool: worker threads, and HTTP requests in flight per host
+        self.concurrent_downloads = int(self._settings.get('concurrent_downloads', self.concurrent_downloads))
+        self.downloads_per_host = int(self._settings.get('downloads_per_host', 4))
+        # Game list rows past the visible ones whose thumbnails are fetched ahead of scrolling
+        self.thumbnail_lookahead_rows = int(self._settings.get('thumbnail_lookahead_rows', 8))
+        # Game list keeps a small pool of row widgets re-bound on scroll (False: one row per game)
+        self.virtualized_game_list = bool(self._settings.get('virtualized_game_list', True))
         # Apply persisted library discovery TTL if provided
         try:
             self.library_discovery_cache_ttl = int(self._settings.get('library_discovery_cache_ttl', self.library_discovery_cache_ttl))
@@ -111,6 +124,41 @@ class Config:
         """Path to the Steam app list cache"""
         return str(self.game_cache_dir / "steam_app_list.json")
 
+    @property
+    def steamspy_pages_dir(self):
+        """Directory of per-page SteamSpy checkpoints (resumable catalogue download)"""
+        return str(self.game_cache_dir / "steamspy_pages")
+
+    @property
+    def steam_app_index_path(self):
+        """Path to the memory-mapped Steam app-name index built from the app list"""
+        return str(self.game_cache_dir / "steam_app_index.bin")
+
+    @property
+    def thumbnail_cache_dir(self):
+        """Directory of row-size game list thumbnails (see utils.thumbnails)"""
+        return str(self.game_cache_dir / "thumbnails")
+
+    @property
+    def artwork_miss_cache_path(self):
+        """Path to the negative cache of games without downloadable artwork"""
+        return str(self.cache_dir / "artwork_misses.json")
+
+    @property
+    def scan_index_path(self):
+        """Path to the persistent incremental scan index"""
+        return str(self.cache_dir / "scan_index.json")
+
+    @property
+    def optiscaler_ini_schema_path(self):
+        """Path to the cached OptiScaler.ini schema (setting types per release)"""
+        return str(self.cache_dir / "optiscaler_ini_schema.json")
+
+    @property
+    def scan_snapshot_path(self):
+        """Path to the persisted last scan result painted at startup"""
+        return str(self.cache_dir / "scan_snapshot.json")
+
 # Global configuration instance
 config = Config()
 
@@ -0,0 +1,161 @@
+"""
+Prioritized network download pool for OptiScaler-GUI.
+
+Artwork downloads run on their own small pool (config.concurrent_downloads
+threads) instead of the GUI executor shared with installs and status checks,
+so a slow CDN can't starve those. Queued work runs in priority order — rows
+on screen first, then retries, then prefetch — and every HTTP request made
+through host_slot() counts against a per-host cap (config.downloads_per_host).
+configure_session() sizes a requests.Session connection pool to match, so
+concurrent requests to one host reuse connections instead of opening
+throwaway ones.
+"""
+import concurrent.futures
+import heapq
+import itertools
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from utils.debug import debug_log
+
+# Lower runs first
+PRIORITY_VISIBLE = 0
+PRIORITY_RETRY = 1
+PRIORITY_PREFETCH = 2
+
+
+def configure_session(session, pool_size):
+    """Mount adapters whose per-host connection pool holds pool_size connections."""
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(1, int(pool_size)))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class DownloadScheduler:
+    """Priority queue drained by a fixed set of daemon workers, plus per-host request slots."""
+
+    def __init__(self, workers=5, per_host=4):
+        self.workers = max(1, int(workers))
+        self.per_host = max(1, int(per_host))
+        self._cond = threading.Condition()
+        self._heap = []
+        self._queued = {}  # key → heap item [priority, seq, fn, args, future, key] still waiting
+        self._seq = itertools.count()
+        self._threads = []
+        self._hosts = {}
+        self._hosts_lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, *args, priority=PRIORITY_PREFETCH, key=None):
+        """Queue fn(*args); returns a concurrent.futures.Future.
+
+        With a key, a task already waiting under the same key is not queued
+        twice: its existing future is returned, it will run the newer fn(*args)
+        (a retry submitted after the app list changed must not be dropped for
+        the stale call), and it moves up if the new priority is more urgent
+        (e.g. a prefetched row scrolled into view)."""
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("download scheduler is shut down")
+            if key is not None and key in self._queued:
+                item = self._queued[key]
+                item[2], item[3] = fn, args
+                return self._bump(item, priority)[4]
+            future = concurrent.futures.Future()
+            item = [priority, next(self._seq), fn, args, future, key]
+            if key is not None:
+                self._queued[key] = item
+            heapq.heappush(self._heap, item)
+            self._start_workers()
+            self._cond.notify()
+            return future
+
+    def reprioritize(self, key, priority):
+        """Move a still-queued task to a more urgent priority; False if it isn't queued."""
+        with self._cond:
+            item = self._queued.get(key)
+            if item is None:
+                return False
+            self._bump(item, priority)
+            return True
+
+    def _bump(self, item, priority):
+        # Caller holds the condition. Heap items can't be re-keyed in place, so
+        # a more urgent copy is pushed and the old one is left to be skipped.
+        if priority >= item[0]:
+            return item
+        fn, item[2] = item[2], None
+        item = [priority, next(self._seq), fn, item[3], item[4], item[5]]
+        self._queued[item[5]] = item
+        heapq.heappush(self._heap, item)
+        self._cond.notify()
+        return item
+
+    def cancel(self, key):
+        """Drop a still-queued task (its future is cancelled); False if it
+        isn't queued any more (already running or done)."""
+        with self._cond:
+            item = self._queued.pop(key, None)
+            if item is None:
+                return False
+            item[2] = None
+            item[4].cancel()
+            return True
+
+    def pending(self):
+        """Number of tasks waiting to run."""
+        with self._cond:
+            return sum(1 for item in self._heap if item[2] is not None)
+
+    def _start_workers(self):
+        # Caller holds the condition
+        while len(self._threads) < self.workers:
+            t = threading.Thread(target=self._worker, name=f"download-{len(self._threads)}", daemon=True)
+            self._threads.append(t)
+            t.start()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if self._shutdown and not self._heap:
+                    return
+                item = heapq.heappop(self._heap)
+                _, _, fn, args, future, key = item
+                if fn is None:
+                    continue  # superseded by a re-prioritized copy
+                if key is not None and self._queued.get(key) is item:
+                    del self._queued[key]
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                debug_log(f"Download task failed: {e}")
+                future.set_exception(e)
+
+    @contextmanager
+    def host_slot(self, url):
+        """Hold one of the per-host request slots for url's host while the block runs."""
+        host = urlparse(url).netloc.lower()
+        with self._hosts_lock:
+            slot = self._hosts.get(host)
+            if slot is None:
+                slot = self._hosts[host] = threading.BoundedSemaphore(self.per_host)
+        with slot:
+            yield
+
+    def shutdown(self, cancel_pending=True):
+        """Stop the workers once the queue drains (cancelling what is still queued)."""
+        with self._cond:
+            self._shutdown = True
+            if cancel_pending:
+                for item in self._heap:
+                    if item[2] is not None:
+                        item[4].cancel()
+                self._heap.clear()
+                self._queued.clear()
+            self._cond.notify_all()
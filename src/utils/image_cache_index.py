@@ -0,0 +1,326 @@
+"""
+Image cache index for OptiScaler-GUI.
+
+Maps each cached image's stem (appid_<id> or the sanitized game name) to its
+file, size and last access, so a cache hit is a dictionary lookup instead of
+exists() probes over every stem/extension pair. The index is persisted as
+JSON next to the image cache directory, loaded once, updated on every write
+and reconciled lazily: the directory is listed again only when its mtime no
+longer matches the saved one (files added or removed behind our back).
+Last-access times back LRU eviction in cache_manager.
+
+Row thumbnails (utils.thumbnails) live in the thumbnails/ subdirectory and
+are recorded under the stem of the image they were rendered from, so they
+are deleted with it: on eviction, on discard and when the image is
+overwritten. Thumbnails recorded under no stem are orphans and are removed by
+prune_thumbnails().
+"""
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from utils.config import config
+from utils.debug import debug_log
+
+INDEX_VERSION = 1
+# Probe order of the old exists() loop: a stem cached in several formats resolves to the first
+IMAGE_EXTENSIONS = ('.jpg', '.png', '.jpeg', '.webp')
+
+# A directory changed within this window of the save can't be proven unchanged
+_RACY_WINDOW_NS = 2 * 1_000_000_000
+# Coalesce index writes during bursts of thumbnail downloads
+_SAVE_DELAY = 5.0
+
+
+class ImageCacheIndex:
+    """Thread-safe stem → {file, size, atime, thumbs} index of one image cache
+    directory; thumbs maps the stem's thumbnail file names to their sizes."""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir or config.game_cache_dir)
+        # Same layout as config.thumbnail_cache_dir
+        self.thumbnail_dir = self.cache_dir / "thumbnails"
+        # cache/game_images → cache/game_images_index.json
+        self.index_path = self.cache_dir.parent / f"{self.cache_dir.name}_index.json"
+        self._lock = threading.RLock()
+        self._entries = {}
+        self._loaded = False
+        self._dirty = False
+        self._save_timer = None
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            data = None
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                debug_log(f"Failed to read image cache index {self.index_path}: {e}")
+            if isinstance(data, dict) and data.get('version') == INDEX_VERSION:
+                self._entries = {k: v for k, v in (data.get('entries') or {}).items() if isinstance(v, dict)}
+                try:
+                    dir_mtime = os.stat(self.cache_dir).st_mtime_ns
+                except OSError:
+                    dir_mtime = None
+                saved_mtime = data.get('dir_mtime_ns')
+                if (saved_mtime is not None and dir_mtime == saved_mtime
+                        and data.get('saved_at_ns', 0) - saved_mtime >= _RACY_WINDOW_NS):
+                    debug_log(f"Loaded image cache index: {len(self._entries)} images")
+                    return
+            self._reconcile()
+
+    def _reconcile(self):
+        """List the cache directory once and bring the entries in line with it,
+        keeping the recorded last access of files that are still there."""
+        found = {}
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    ext = ext.lower()
+                    if ext not in IMAGE_EXTENSIONS or not entry.is_file():
+                        continue
+                    current = found.get(stem)
+                    if current and IMAGE_EXTENSIONS.index(os.path.splitext(current['file'])[1].lower()) <= IMAGE_EXTENSIONS.index(ext):
+                        continue
+                    st = entry.stat()
+                    previous = self._entries.get(stem) or {}
+                    same_file = previous.get('file') == entry.name
+                    found[stem] = {'file': entry.name, 'size': st.st_size,
+                                   'atime': (previous.get('atime') if same_file else None) or st.st_mtime}
+                    if same_file and previous.get('thumbs'):
+                        found[stem]['thumbs'] = previous['thumbs']
+        except OSError as e:
+            debug_log(f"Image cache listing failed for {self.cache_dir}: {e}")
+        self._entries = found
+        self._dirty = True
+        debug_log(f"Reconciled image cache index: {len(found)} images")
+        self._schedule_save()
+
+    def lookup(self, stems):
+        """Path of the first cached image among stems (in order), or None.
+        A hit refreshes the image's last access."""
+        self._ensure_loaded()
+        with self._lock:
+            for stem in stems:
+                entry = self._entries.get(stem)
+                if entry:
+                    entry['atime'] = time.time()
+                    self._dirty = True
+                    self._schedule_save()
+                    return str(self.cache_dir / entry['file'])
+        return None
+
+    def record(self, path):
+        """Register an image just written to the cache directory. Thumbnails
+        of the image it replaces are deleted."""
+        path = Path(path)
+        try:
+            size = path.stat().st_size
+        except OSError:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            previous = self._entries.get(path.stem)
+            if previous:
+                self._delete_thumbnails(previous)
+            self._entries[path.stem] = {'file': path.name, 'size': size, 'atime': time.time()}
+            self._dirty = True
+            self._schedule_save()
+
+    def record_thumbnail(self, source, thumb_path):
+        """Register a thumbnail rendered from the cached image source. Thumbnails
+        outside this index's thumbnail directory, or of images it doesn't hold,
+        are ignored (and pruned later if they are in it)."""
+        source, thumb_path = Path(source), Path(thumb_path)
+        if os.path.normcase(str(thumb_path.parent)) != os.path.normcase(str(self.thumbnail_dir)):
+            return
+        try:
+            size = thumb_path.stat().st_size
+        except OSError:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.get(source.stem)
+            if not entry or entry.get('file') != source.name:
+                return
+            thumbs = entry.setdefault('thumbs', {})
+            if thumbs.get(thumb_path.name) != size:
+                thumbs[thumb_path.name] = size
+                self._dirty = True
+                self._schedule_save()
+
+    def discard(self, stem):
+        """Forget one stem (its file was removed) and delete its thumbnails."""
+        self._ensure_loaded()
+        with self._lock:
+            entry = self._entries.pop(stem, None)
+            if entry is not None:
+                self._delete_thumbnails(entry)
+                self._dirty = True
+                self._schedule_save()
+
+    def _delete_thumbnails(self, entry):
+        # Caller holds the lock
+        for name in entry.pop('thumbs', None) or ():
+            try:
+                (self.thumbnail_dir / name).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                debug_log(f"Could not delete thumbnail {name}: {e}")
+
+    def prune_thumbnails(self):
+        """Delete thumbnails recorded under no cached image (left by a crash
+        before the index was saved, or by an older version). Returns (files
+        removed, bytes removed)."""
+        self._ensure_loaded()
+        with self._lock:
+            known = set()
+            for entry in self._entries.values():
+                known.update(entry.get('thumbs') or ())
+            removed, removed_bytes = 0, 0
+            try:
+                with os.scandir(self.thumbnail_dir) as it:
+                    for entry in it:
+                        if entry.name in known or not entry.is_file():
+                            continue
+                        try:
+                            size = entry.stat().st_size
+                            os.unlink(entry.path)
+                        except OSError as e:
+                            debug_log(f"Could not delete orphaned thumbnail {entry.name}: {e}")
+                            continue
+                        removed += 1
+                        removed_bytes += size
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                debug_log(f"Thumbnail listing failed for {self.thumbnail_dir}: {e}")
+        if removed:
+            debug_log(f"Pruned {removed} orphaned thumbnails ({removed_bytes} bytes)")
+        return removed, removed_bytes
+
+    def clear(self):
+        """Forget everything (the cache directory was wiped) and remove the thumbnail directory."""
+        with self._lock:
+            self._entries = {}
+            self._loaded = False
+            self._dirty = False
+            shutil.rmtree(self.thumbnail_dir, ignore_errors=True)
+
+    def __len__(self):
+        self._ensure_loaded()
+        return len(self._entries)
+
+    @property
+    def total_bytes(self):
+        """Bytes of the indexed images and their recorded thumbnails."""
+        self._ensure_loaded()
+        with self._lock:
+            return sum(_entry_bytes(e) for e in self._entries.values())
+
+    def bytes_accessed_since(self, timestamp):
+        """Bytes of the images (and thumbnails) looked up or written since timestamp."""
+        self._ensure_loaded()
+        with self._lock:
+            return sum(_entry_bytes(e) for e in self._entries.values() if e.get('atime', 0) >= timestamp)
+
+    def evict(self, max_bytes=None, older_than=None):
+        """Delete least-recently-used images (with their thumbnails) until the
+        cache holds at most max_bytes, and/or every image not accessed since the
+        older_than timestamp. Returns (images removed, bytes removed)."""
+        self._ensure_loaded()
+        with self._lock:
+            by_age = sorted(self._entries.items(), key=lambda kv: kv[1].get('atime', 0))
+            total = sum(_entry_bytes(e) for _, e in by_age)
+            removed, removed_bytes = 0, 0
+            for stem, entry in by_age:
+                too_old = older_than is not None and entry.get('atime', 0) < older_than
+                too_big = max_bytes is not None and total > max_bytes
+                if not (too_old or too_big):
+                    break  # sorted by last access: everything after is newer
+                try:
+                    (self.cache_dir / entry['file']).unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    debug_log(f"Could not evict cached image {entry['file']}: {e}")
+                    continue
+                size = _entry_bytes(entry)
+                self._delete_thumbnails(entry)
+                del self._entries[stem]
+                total -= size
+                removed += 1
+                removed_bytes += size
+            if removed:
+                self._dirty = True
+                self.save()
+        return removed, removed_bytes
+
+    def _schedule_save(self):
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(_SAVE_DELAY, self._timed_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def _timed_save(self):
+        with self._lock:
+            self._save_timer = None
+        self.save()
+
+    def save(self):
+        """Write the index atomically if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            entries = {stem: dict(e, thumbs=dict(e['thumbs'])) if e.get('thumbs') else dict(e)
+                       for stem, e in self._entries.items()}
+            self._dirty = False
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # The index lives outside the directory it describes, so saving it
+            # doesn't move the directory mtime compared at the next start
+            data = {'version': INDEX_VERSION, 'dir_mtime_ns': os.stat(self.cache_dir).st_mtime_ns,
+                    'saved_at_ns': time.time_ns(), 'entries': entries}
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp_path, self.index_path)
+        except Exception as e:
+            debug_log(f"Failed to save image cache index {self.index_path}: {e}")
+
+
+def _entry_bytes(entry):
+    return entry.get('size', 0) + sum((entry.get('thumbs') or {}).values())
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def image_index_for(cache_dir=None):
+    """The shared ImageCacheIndex of an image cache directory (config.game_cache_dir by default)."""
+    key = os.path.normcase(os.path.abspath(str(cache_dir or config.game_cache_dir)))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = ImageCacheIndex(cache_dir)
+        return index
+
+
+# Global image cache index instance
+image_cache_index = image_index_for()
@@ -0,0 +1,114 @@
+"""
+Persisted negative cache for OptiScaler-GUI.
+
+Remembers lookups that came back definitively empty (e.g. Steam has no
+artwork for a demo, tool or delisted app) so they are not repeated on every
+launch. Each entry blocks its key for a TTL that doubles with every repeated
+miss (base_ttl, 2×, 4×, … up to max_ttl); a success clears it. Entries may
+carry a stamp — e.g. the size of the catalogue a name lookup was made
+against — and only block while the caller's current stamp matches.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from utils.debug import debug_log
+
+CACHE_VERSION = 1
+# Coalesce writes when many lookups miss at once (first thumbnail pass)
+_SAVE_DELAY = 5.0
+
+
+class NegativeCache:
+    """Thread-safe key → {failures, until, stamp} map persisted as JSON."""
+
+    def __init__(self, path, base_ttl=24 * 60 * 60, max_ttl=30 * 24 * 60 * 60):
+        self.path = Path(path)
+        self.base_ttl = base_ttl
+        self.max_ttl = max_ttl
+        self._lock = threading.Lock()
+        self._entries = None
+        self._dirty = False
+        self._save_timer = None
+
+    def _load(self):
+        # Caller holds the lock
+        if self._entries is not None:
+            return
+        self._entries = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == CACHE_VERSION:
+                now = time.time()
+                # Expired entries keep their failure count (for the backoff) for one max_ttl
+                self._entries = {k: v for k, v in (data.get('entries') or {}).items()
+                                 if isinstance(v, dict) and v.get('until', 0) + self.max_ttl > now}
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            debug_log(f"Failed to read negative cache {self.path}: {e}")
+
+    def blocked(self, key, stamp=None):
+        """True while a recorded miss for key is still within its TTL (and,
+        when the entry has a stamp, the given stamp matches it)."""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+        if not entry or entry.get('until', 0) <= time.time():
+            return False
+        return entry.get('stamp') is None or entry.get('stamp') == stamp
+
+    def record_miss(self, key, stamp=None):
+        """Record a definitive miss; returns the TTL in seconds now applied."""
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key) or {}
+            failures = entry.get('failures', 0) + 1
+            ttl = min(self.base_ttl * (2 ** (failures - 1)), self.max_ttl)
+            self._entries[key] = {'failures': failures, 'until': time.time() + ttl, 'stamp': stamp}
+            self._dirty = True
+            self._schedule_save()
+        return ttl
+
+    def clear(self, key):
+        """Forget key (the lookup succeeded)."""
+        with self._lock:
+            self._load()
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+                self._schedule_save()
+
+    def reset(self):
+        """Forget every entry (the cache directory was wiped)."""
+        with self._lock:
+            self._entries = None
+            self._dirty = False
+
+    def _schedule_save(self):
+        # Caller holds the lock
+        if self._save_timer is not None:
+            return
+        self._save_timer = threading.Timer(_SAVE_DELAY, self.save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def save(self):
+        """Write the cache atomically if it changed."""
+        with self._lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+                self._save_timer = None
+            if not self._dirty or self._entries is None:
+                return
+            entries = dict(self._entries)
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': CACHE_VERSION, 'entries': entries}, f, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            debug_log(f"Failed to save negative cache {self.path}: {e}")
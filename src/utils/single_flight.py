@@ -0,0 +1,50 @@
+"""
+Single-flight call de-duplication for OptiScaler-GUI.
+
+When several threads ask for the same thing at once (two games resolving to
+one AppID, a row rebuild racing the first thumbnail pass, the post-download
+retry overlapping it), only the first caller runs the work; the others wait
+for its result. Nothing is cached once the call finishes — callers keep
+their own caches (image index, AppID memo) for that.
+"""
+import concurrent.futures
+import threading
+
+
+class SingleFlight:
+    """Run at most one call per key at a time; concurrent callers share its result."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        # Calls answered by waiting on another caller's flight (diagnostics / tests)
+        self.shared = 0
+
+    def do(self, key, fn, *args, **kwargs):
+        """Return fn(*args, **kwargs), or the result (or exception) of the
+        call already running under key."""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = concurrent.futures.Future()
+            else:
+                self.shared += 1
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    def in_flight(self, key):
+        """True while a call under key is running."""
+        with self._lock:
+            return key in self._calls
@@ -0,0 +1,97 @@
+"""
+Display-ready game list thumbnails for OptiScaler-GUI.
+
+The image cache (GameScanner.fetch_game_image) keeps covers bounded by
+config.max_image_size; the game list shows them at a fixed row height. This
+module produces the exact row-size thumbnail on worker threads — JPEG
+sources are decoded at reduced resolution with Image.draft() before the final
+resize — and keeps the result on disk next to the image cache, keyed by the
+source file, its mtime and the target height. Each stored thumbnail is
+recorded under its source in the image cache index, which deletes it when the
+source is evicted or replaced. The Tk main thread only wraps the returned
+(fully loaded) image in a CTkImage.
+"""
+import hashlib
+import os
+from pathlib import Path
+from PIL import Image
+from utils.config import config
+from utils.debug import debug_log
+from utils.image_cache_index import image_index_for
+from utils.single_flight import SingleFlight
+
+# Row thumbnail height in logical pixels (game list rows)
+THUMBNAIL_HEIGHT = 80
+
+_LANCZOS = getattr(getattr(Image, 'Resampling', Image), 'LANCZOS', None)
+_flights = SingleFlight()
+
+
+def thumbnail_size(width, height, target_height):
+    """(width, height) of a thumbnail target_height pixels high keeping the aspect ratio."""
+    if not width or not height:
+        raise ValueError("Invalid image dimensions")
+    return max(1, round(width * target_height / height)), target_height
+
+
+def thumbnail_path(source, target_height, cache_dir=None):
+    """Disk cache path of the thumbnail for source at target_height, or None when
+    the source is missing. The source's mtime is part of the key, so replaced
+    artwork gets a new thumbnail."""
+    try:
+        st = os.stat(source)
+    except OSError:
+        return None
+    key = f"{os.path.normcase(os.path.abspath(source))}|{st.st_mtime_ns}|{st.st_size}|{target_height}"
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]
+    directory = Path(cache_dir) if cache_dir is not None else Path(config.thumbnail_cache_dir)
+    return directory / f"{Path(source).stem}_{target_height}h_{digest}.jpg"
+
+
+def render_thumbnail(source, target_height):
+    """Decode source and resize it to target_height; returns a loaded RGB image."""
+    with Image.open(source) as img:
+        width, height = thumbnail_size(img.width, img.height, target_height)
+        if img.format == 'JPEG':
+            # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 (never below the target)
+            img.draft('RGB', (width, height))
+        img = img.convert('RGB') if img.mode != 'RGB' else img
+        return img.resize((width, height), _LANCZOS)
+
+
+def load_thumbnail(source, target_height=THUMBNAIL_HEIGHT, cache_dir=None):
+    """Return a display-ready RGB thumbnail of source, target_height pixels high.
+
+    Served from the thumbnail cache when present, otherwise rendered and
+    stored. Meant for worker threads; raises on unreadable sources. Rows
+    sharing one source (same AppID) wait for a single decode."""
+    key = (os.path.normcase(os.path.abspath(source)), target_height, str(cache_dir))
+    return _flights.do(key, _load_thumbnail, source, target_height, cache_dir)
+
+
+def _load_thumbnail(source, target_height, cache_dir):
+    cached = thumbnail_path(source, target_height, cache_dir)
+    if cached is not None and cached.exists():
+        thumb = None
+        try:
+            with Image.open(cached) as img:
+                img.load()
+                if img.height == target_height:
+                    thumb = img.convert('RGB') if img.mode != 'RGB' else img.copy()
+        except Exception as e:
+            debug_log(f"Discarding unreadable thumbnail {cached}: {e}")
+        if thumb is not None:
+            # Re-record thumbnails the index lost (crash before its save)
+            image_index_for(Path(source).parent).record_thumbnail(source, cached)
+            return thumb
+    thumb = render_thumbnail(source, target_height)
+    if cached is not None:
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cached.with_suffix('.tmp')
+            thumb.save(tmp_path, 'JPEG', quality=config.image_quality)
+            os.replace(tmp_path, cached)
+            image_index_for(Path(source).parent).record_thumbnail(source, cached)
+        except Exception as e:
+            debug_log(f"Failed to store thumbnail {cached}: {e}")
+    return thumb
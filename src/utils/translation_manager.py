@@ -22,6 +22,9 @@ class TranslationManager:
     
     def load_all_translations(self):
         """Load all translation files from the translations directory"""
+        # Filled separately and swapped in at the end, so a reload on a worker
+        # thread never leaves readers with a half-loaded table
+        loaded = {}
         translation_files = {
             "en": "en.json",
             "da": "da.json", 
@@ -33,19 +36,19 @@ class TranslationManager:
             if filepath.exists():
                 try:
                     with open(filepath, 'r', encoding='utf-8') as f:
-                        self.translations[lang_code] = json.load(f)
+                        loaded[lang_code] = json.load(f)
                     print(f"Loaded translation file: {filepath}")
                 except Exception as e:
                     print(f"Error loading translation file {filename}: {e}")
                     # Fallback to empty dict if file can't be loaded
-                    self.translations[lang_code] = {}
+                    loaded[lang_code] = {}
             else:
                 print(f"Translation file not found: {filepath}")
-                self.translations[lang_code] = {}
+                loaded[lang_code] = {}
+        self.translations = loaded
 
     def reload_translations(self):
         """Reload all translation files from disk"""
-        self.translations.clear()
         self.load_all_translations()
     
     def set_language(self, language_code: str):
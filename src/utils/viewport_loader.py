@@ -0,0 +1,96 @@
+"""
+Viewport-driven background loading for OptiScaler-GUI lists.
+
+Instead of queueing work for every row as it is built, the list reports which
+rows are on screen; rows in view are queued first (PRIORITY_VISIBLE), rows
+within the look-ahead distance after them (PRIORITY_PREFETCH), and queued
+work for rows that scrolled far away is cancelled. Scrolling back re-queues
+it; rows whose work already ran are not queued again until invalidated.
+"""
+import math
+import threading
+from utils.download_scheduler import PRIORITY_PREFETCH, PRIORITY_VISIBLE
+
+
+def visible_rows(first, last, count):
+    """[start, end) of the rows shown when a scrollable list of count
+    similar-height rows is scrolled to the (first, last) yview fractions."""
+    if count <= 0:
+        return 0, 0
+    start = max(0, min(count - 1, int(math.floor(first * count))))
+    end = max(start + 1, min(count, int(math.ceil(last * count))))
+    return start, end
+
+
+class ViewportLoader:
+    """Queue task(item) on a DownloadScheduler for the rows around the viewport.
+
+    key(item) identifies an item's work across updates (and in the
+    scheduler, so re-queueing a waiting item only moves it up)."""
+
+    def __init__(self, scheduler, task, key, lookahead=8, keep=None):
+        self.scheduler = scheduler
+        self.task = task
+        self.key = key
+        self.lookahead = max(0, int(lookahead))
+        # Queued work is kept (not cancelled) this far outside the viewport
+        self.keep = self.lookahead * 2 if keep is None else keep
+        self._lock = threading.Lock()
+        self._queued = {}  # key → future still waiting or running
+        self._done = set()
+
+    def update(self, items, start, end):
+        """items are the list's rows in display order; [start, end) are on screen."""
+        wanted = [(i, PRIORITY_VISIBLE) for i in range(start, min(end, len(items)))]
+        wanted += [(i, PRIORITY_PREFETCH) for i in range(end, min(end + self.lookahead, len(items)))]
+        wanted += [(i, PRIORITY_PREFETCH) for i in range(max(0, start - self.lookahead), start)]
+        for i, priority in wanted:
+            self.request(items[i], priority)
+
+        lo, hi = start - self.keep, end + self.keep
+        positions = {self.key(item): i for i, item in enumerate(items)}
+        with self._lock:
+            stale = [k for k in self._queued if k not in positions or not lo <= positions[k] < hi]
+        for k in stale:
+            if self.scheduler.cancel(k):
+                with self._lock:
+                    self._queued.pop(k, None)
+
+    def request(self, item, priority=PRIORITY_VISIBLE):
+        """Queue item's work unless it already ran; a queued item only moves up."""
+        k = self.key(item)
+        with self._lock:
+            if k in self._done:
+                return
+        future = self.scheduler.submit(self.task, item, priority=priority, key=k)
+        with self._lock:
+            if self._queued.get(k) is future:
+                return
+            self._queued[k] = future
+        future.add_done_callback(lambda f, k=k: self._finished(k, f))
+
+    def _finished(self, k, future):
+        with self._lock:
+            if self._queued.get(k) is future:
+                del self._queued[k]
+                if not future.cancelled():
+                    self._done.add(k)
+
+    def invalidate(self, item):
+        """Let item's work run again the next time it is in range (e.g. after a retry)."""
+        with self._lock:
+            self._done.discard(self.key(item))
+
+    def pending(self):
+        """Keys with work queued or running."""
+        with self._lock:
+            return set(self._queued)
+
+    def reset(self):
+        """Cancel everything still queued and forget what ran (the list was rebuilt)."""
+        with self._lock:
+            keys = list(self._queued)
+            self._queued.clear()
+            self._done.clear()
+        for k in keys:
+            self.scheduler.cancel(k)
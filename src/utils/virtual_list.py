@@ -0,0 +1,58 @@
+"""
+Row geometry for virtualized lists in OptiScaler-GUI.
+
+A virtualized list only builds widgets for the rows on screen, so it needs
+to know where every other row would be without building it. RowLayout keeps
+the rows' heights and their prefix sums; finding the rows inside a pixel
+range is a binary search.
+"""
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+
+
+class RowLayout:
+    """Vertical offsets of a list of rows with known heights."""
+
+    def __init__(self, heights=()):
+        self.reset(heights)
+
+    def reset(self, heights):
+        self._heights = [max(0, h) for h in heights]
+        self._offsets = [0] + list(accumulate(self._heights))
+
+    def append(self, heights):
+        for h in heights:
+            h = max(0, h)
+            self._heights.append(h)
+            self._offsets.append(self._offsets[-1] + h)
+
+    def set_height(self, index, height):
+        """Change one row's height; rows after it move."""
+        delta = max(0, height) - self._heights[index]
+        if not delta:
+            return
+        self._heights[index] += delta
+        for i in range(index + 1, len(self._offsets)):
+            self._offsets[i] += delta
+
+    def __len__(self):
+        return len(self._heights)
+
+    @property
+    def total(self):
+        return self._offsets[-1]
+
+    def offset(self, index):
+        return self._offsets[index]
+
+    def height(self, index):
+        return self._heights[index]
+
+    def rows_between(self, top, bottom):
+        """[start, end) of the rows that overlap the pixel range [top, bottom)."""
+        count = len(self._heights)
+        if count == 0 or bottom <= top:
+            return 0, 0
+        start = min(count - 1, max(0, bisect_right(self._offsets, top) - 1))
+        end = max(start + 1, min(count, bisect_left(self._offsets, bottom)))
+        return start, end
@@ -0,0 +1,27 @@
+@echo off
+cls
+echo OptiScaler Uninstaller
+echo ======================
+echo.
+echo This will remove OptiScaler from this game.
+echo.
+set /p removeChoice="Do you want to remove OptiScaler? [y/n]: "
+if "%removeChoice%"=="y" (
+    echo Removing OptiScaler files...
+    if exist "dxgi.dll" del "dxgi.dll"
+    if exist "nvngx_dlss.dll" del "nvngx_dlss.dll"
+    if exist "D3D12_Optiscaler" rd /s /q "D3D12_Optiscaler"
+    if exist "Licenses" rd /s /q "Licenses"
+    if exist OptiScaler.log del OptiScaler.log
+    echo.
+    echo OptiScaler removed successfully!
+    echo.
+) else (
+    echo.
+    echo Operation cancelled.
+    echo.
+)
+pause
+if "%removeChoice%"=="y" (
+    del "%0"
+)
@@ -51,3 +51,34 @@ def steam_structure(tmp_path):
     (steam_root / 'steamapps').mkdir(parents=True)
     (other_library / 'steamapps' / 'common').mkdir(parents=True)
     return steam_root, other_library
+
+
+@pytest.fixture(autouse=True)
+def isolated_ini_schema(tmp_path, monkeypatch):
+    """Keep OptiScaler.ini schemas learned during tests out of the real cache dir."""
+    from utils.config import Config
+    from optiscaler import manager
+    from optiscaler.ini_schema import IniSchema
+
+    schema_path = tmp_path / 'optiscaler_ini_schema.json'
+    monkeypatch.setattr(Config, 'optiscaler_ini_schema_path', property(lambda self: str(schema_path)))
+    monkeypatch.setattr(manager, 'shared_ini_schema', IniSchema(schema_path))
+    return schema_path
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dirs(tmp_path, monkeypatch):
+    """Keep the app catalogue, its index, cached images and scan state written
+    by scanners built in tests out of the real cache dir.
+
+    The catalogue is seeded empty and fresh, so those scanners map an empty
+    app index instead of downloading SteamSpy in the background."""
+    from utils.config import config
+
+    cache_dir = tmp_path / 'app_cache'
+    game_cache_dir = cache_dir / 'game_images'
+    game_cache_dir.mkdir(parents=True)
+    (game_cache_dir / 'steam_app_list.json').write_text('{}', encoding='utf-8')
+    monkeypatch.setattr(config, 'cache_dir', cache_dir)
+    monkeypatch.setattr(config, 'game_cache_dir', game_cache_dir)
+    return cache_dir
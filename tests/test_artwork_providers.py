@@ -0,0 +1,207 @@
+"""
+Tests for local artwork providers (scanner.artwork_providers):
+- Steam librarycache art is found in both the flat and the per-app layouts
+- Heroic image-cache art, Xbox AppxManifest logos and GOG icons are found
+  for their platforms only
+- fetch_game_image caches local art without any network request or AppID match
+- platform art is cached under the platform and name, never the shared AppID
+- GOG icons only stand in when the network lookup finds nothing
+"""
+import hashlib
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from scanner.artwork_providers import (GogIconProvider, HeroicArtworkProvider, SteamLibraryCacheProvider,
+                                       XboxManifestProvider, find_local_artwork)
+from scanner.game_scanner import Game, GameScanner
+from utils.config import config
+from utils.negative_cache import NegativeCache
+
+
+def _image(path, size=(920, 430), color=(200, 30, 30)):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    Image.new("RGB", size, color).save(path, "JPEG")
+    return path
+
+
+def _librarycache(steam_root):
+    cache = steam_root / "appcache" / "librarycache"
+    _image(cache / "220_header.jpg")
+    _image(cache / "220_library_600x900.jpg", size=(600, 900))
+    _image(cache / "1091500" / "library_600x900.jpg", size=(600, 900))
+    _image(cache / "1091500" / "header.jpg")
+    _image(cache / "292030" / "3f1b0c2d" / "capsule_231x87.jpg", size=(231, 87))
+    return cache
+
+
+def test_finds_flat_and_per_app_artwork(tmp_path):
+    empty_root = tmp_path / "empty_steam"
+    cache = _librarycache(tmp_path / "steam")
+    provider = SteamLibraryCacheProvider(lambda: [str(empty_root), str(tmp_path / "steam")])
+
+    assert provider.find("Half-Life 2", "220") == str(cache / "220_header.jpg")
+    assert Path(provider.find("Cyberpunk 2077", "1091500")) == cache / "1091500" / "header.jpg"
+    assert Path(provider.find("The Witcher 3", 292030)) == cache / "292030" / "3f1b0c2d" / "capsule_231x87.jpg"
+    assert provider.find("Unknown", "12345") is None
+    assert provider.find("No AppID") is None
+
+
+class _NoNetwork:
+    def get(self, *args, **kwargs):
+        raise AssertionError("network request made for locally available artwork")
+
+
+def _offline_scanner(tmp_path):
+    image_cache = tmp_path / "images"
+    image_cache.mkdir()
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    scanner.steam_paths = [str(tmp_path / "steam")]
+    scanner.game_cache_dir = image_cache
+    scanner._requests_session = _NoNetwork()
+    return scanner, image_cache
+
+
+def test_fetch_game_image_uses_local_artwork_offline(tmp_path):
+    _librarycache(tmp_path / "steam")
+    scanner, image_cache = _offline_scanner(tmp_path)
+
+    path = Path(scanner.fetch_game_image("Half-Life 2", "220"))
+
+    assert path == image_cache / "appid_220.jpg"
+    with Image.open(path) as cached:
+        assert cached.width <= config.max_image_size[0]
+        assert cached.height <= config.max_image_size[1]
+    # A second call is served straight from the image cache
+    assert Path(scanner.fetch_game_image("Half-Life 2", "220")) == path
+
+
+COVER_URL = "https://cdn.example.com/epic/cover.jpg"
+
+
+def _heroic_root(root, install_path):
+    (root / "store_cache").mkdir(parents=True)
+    library = {"library": [{"app_name": "Fortnite", "title": "Some Epic Game", "art_cover": COVER_URL,
+                            "install": {"install_path": str(install_path)}},
+                           {"app_name": "Other", "title": "Uncached Game", "art_cover": "https://cdn.example.com/x.jpg"}]}
+    (root / "store_cache" / "legendary_library.json").write_text(json.dumps(library), encoding="utf-8")
+    side_art = _image(root / "side" / "art.png")
+    sideload = {"games": [{"title": "My Sideload", "art_square": side_art.as_uri()}]}
+    (root / "sideload_apps").mkdir()
+    (root / "sideload_apps" / "library.json").write_text(json.dumps(sideload), encoding="utf-8")
+    return _image(root / "images-cache" / hashlib.sha256(COVER_URL.encode()).hexdigest()), side_art
+
+
+def _appx_package(folder):
+    folder.mkdir(parents=True)
+    (folder / "AppxManifest.xml").write_text(
+        '<?xml version="1.0" encoding="utf-8"?>'
+        '<Package xmlns="http://schemas.microsoft.com/appx/manifest/foundation/windows10"'
+        ' xmlns:uap="http://schemas.microsoft.com/appx/manifest/uap/windows10">'
+        '<Properties><Logo>Assets\\StoreLogo.png</Logo></Properties>'
+        '<Applications><Application><uap:VisualElements Square150x150Logo="Assets\\Square150.png">'
+        '<uap:DefaultTile Wide310x150Logo="Assets\\Wide.png"/></uap:VisualElements>'
+        '</Application></Applications></Package>', encoding="utf-8")
+    _image(folder / "Assets" / "Wide.scale-100.png", size=(310, 150))
+    wide = _image(folder / "Assets" / "Wide.scale-200.png", size=(620, 300))
+    _image(folder / "Assets" / "StoreLogo.png", size=(50, 50))
+    return wide
+
+
+def test_platform_providers(tmp_path):
+    heroic_game = Game("Some Epic Game", tmp_path / "Games" / "SomeEpicGame", platform="Heroic")
+    cover, side_art = _heroic_root(tmp_path / "heroic", heroic_game.path)
+    heroic = HeroicArtworkProvider(lambda: [tmp_path / "heroic"])
+    assert heroic.find(heroic_game.name, game=heroic_game) == str(cover)
+    # Matched by install path even when the scanned name differs
+    renamed = Game("SomeEpicGame", heroic_game.path, platform="Heroic")
+    assert heroic.find(renamed.name, game=renamed) == str(cover)
+    assert heroic.find("My Sideload", game=Game("My Sideload", tmp_path / "x", platform="Heroic")) == str(side_art)
+    assert heroic.find("Uncached Game", game=Game("Uncached Game", tmp_path / "y", platform="Heroic")) is None
+
+    xbox_game = Game("Forza", tmp_path / "XboxGames" / "Forza", platform="Xbox")
+    wide = _appx_package(Path(xbox_game.path) / "Content")
+    assert XboxManifestProvider().find(xbox_game.name, game=xbox_game) == str(wide)
+
+    gog_dir = tmp_path / "GOG" / "Witcher"
+    gog_dir.mkdir(parents=True)
+    (gog_dir / "goggame-1207664643.info").write_text("{}", encoding="utf-8")
+    Image.new("RGBA", (64, 64), (0, 0, 255, 255)).save(gog_dir / "goggame-1207664643.ico")
+    gog_game = Game("The Witcher", gog_dir, platform="GOG")
+    assert GogIconProvider().find(gog_game.name, game=gog_game) == str(gog_dir / "goggame-1207664643.ico")
+
+    # Each provider only serves its own platform
+    providers = [GogIconProvider(), XboxManifestProvider(), heroic]
+    assert find_local_artwork(providers, xbox_game.name, None, xbox_game) == ("xbox-manifest", str(wide))
+    steam_game = Game("Forza", xbox_game.path, platform="Steam")
+    assert find_local_artwork(providers, steam_game.name, None, steam_game) == (None, None)
+
+
+def test_fetch_game_image_skips_appid_matching_for_local_art(tmp_path):
+    scanner, image_cache = _offline_scanner(tmp_path)
+    game = Game("Forza", tmp_path / "XboxGames" / "Forza", platform="Xbox")
+    _appx_package(Path(game.path))
+    scanner._get_appid_from_name = lambda name: (_ for _ in ()).throw(AssertionError("AppID lookup"))
+
+    path = Path(scanner.fetch_game_image(game.name, None, game=game))
+
+    assert path == image_cache / "xbox_Forza.jpg"
+    with Image.open(path) as cached:
+        assert cached.mode == "RGB"
+
+
+class _Cdn:
+    """Steam CDN that only has a header for the given AppIDs; the Store API knows nothing."""
+
+    def __init__(self, appids=()):
+        self.appids = set(appids)
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        response = type("Response", (), {"status_code": 404, "content": b"", "json": lambda self: {}})()
+        if any(f"/apps/{appid}/header.jpg" in url for appid in self.appids):
+            buffer = io.BytesIO()
+            Image.new("RGB", (460, 215), (0, 200, 0)).save(buffer, "JPEG")
+            response.status_code, response.content = 200, buffer.getvalue()
+        return response
+
+
+def test_platform_art_is_not_shared_through_the_appid(tmp_path):
+    scanner, image_cache = _offline_scanner(tmp_path)
+    scanner._requests_session = _Cdn(appids=["1551360"])
+    # AppID stamped on the Xbox game from a fuzzy match
+    xbox_game = Game("Forza", tmp_path / "XboxGames" / "Forza", platform="Xbox")
+    _appx_package(Path(xbox_game.path))
+
+    assert Path(scanner.fetch_game_image(xbox_game.name, "1551360", game=xbox_game)) == image_cache / "xbox_Forza.jpg"
+    assert scanner._requests_session.urls == []
+
+    steam_path = Path(scanner.fetch_game_image("Forza Horizon 5", "1551360",
+                                               game=Game("Forza Horizon 5", tmp_path / "fh5", platform="Steam")))
+    assert steam_path == image_cache / "appid_1551360.jpg"
+    with Image.open(steam_path) as cached:
+        assert cached.getpixel((10, 10))[1] > 150  # the CDN header, not the Xbox logo
+
+
+def test_gog_icons_only_stand_in_for_missing_store_art(tmp_path):
+    scanner, image_cache = _offline_scanner(tmp_path)
+    scanner._requests_session = _Cdn(appids=["292030"])
+    scanner.artwork_misses = NegativeCache(tmp_path / "artwork_misses.json")
+    gog_dir = tmp_path / "GOG" / "Witcher"
+    gog_dir.mkdir(parents=True)
+    (gog_dir / "goggame-1207664643.info").write_text("{}", encoding="utf-8")
+    Image.new("RGBA", (64, 64), (0, 0, 255, 255)).save(gog_dir / "goggame-1207664643.ico")
+
+    witcher = Game("The Witcher 3", gog_dir, platform="GOG")
+    assert Path(scanner.fetch_game_image(witcher.name, "292030", game=witcher)) == image_cache / "appid_292030.jpg"
+
+    unknown = Game("Witcher Fan Mod", gog_dir, platform="GOG")
+    assert Path(scanner.fetch_game_image(unknown.name, "999", game=unknown)) == image_cache / "gog_Witcher Fan Mod.jpg"
+    # Known-missing store art: served from the cached icon without asking again
+    scanner._requests_session = _NoNetwork()
+    assert Path(scanner.fetch_game_image(unknown.name, "999", game=unknown)) == image_cache / "gog_Witcher Fan Mod.jpg"
@@ -0,0 +1,50 @@
+"""
+Tests for the compiled detection rules (data/detection_rules.json):
+- engine rules keep their priority order (Unreal > Unity > Godot > Prism3D)
+- anti-cheat patterns nested in longer patterns are still reported
+- alias rules are skipped by shallow detection
+- a new engine is a data change only
+"""
+from scanner.detection_rules import DetectionRules, detection_rules
+
+
+def _engine(top_files=(), top_dirs=(), probe_dirs=()):
+    return detection_rules.match_engine({'top_files': list(top_files), 'top_dirs': list(top_dirs),
+                                         'probe_dirs': list(probe_dirs)})
+
+
+def test_engine_priority_and_patterns():
+    assert _engine(top_files=['unityplayer.dll'], probe_dirs=['engine/binaries/win64']) == 'Unreal'
+    assert _engine(top_files=['prism3d.dll', 'unityplayer.dll']) == 'Unity'
+    assert _engine(top_files=['project.godot']) == 'Godot'
+    assert _engine(top_dirs=['.import']) == 'Godot'
+    assert _engine(top_files=['euro truck simulator.exe']) == 'Prism3D'
+    assert _engine(top_files=['scs_game.ini']) == 'Prism3D'
+    # Partial names don't match whole-name rules
+    assert _engine(top_files=['unityplayer.dll.bak', 'prism.dll.txt'], top_dirs=['assets2']) is None
+
+
+def test_anti_cheat_reports_nested_patterns_and_aliases():
+    names = ['easyanticheat_eos_setup.exe', 'beservice.exe', 'readme.txt']
+    assert detection_rules.match_anti_cheat(names) == [
+        'EasyAntiCheat', 'BattlEye', 'Easy Anti-Cheat', 'BattleEye (BE)']
+    # 'EasyAntiCheat' is a prefix of 'EasyAntiCheat.exe' — both rules still fire
+    assert detection_rules.match_anti_cheat(['easyanticheat.exe']) == ['EasyAntiCheat', 'Easy Anti-Cheat']
+    assert detection_rules.match_anti_cheat(['easyanticheat.exe'], include_aliases=False) == ['EasyAntiCheat']
+    assert detection_rules.match_anti_cheat(['game.exe']) == []
+
+
+def test_optiscaler_indicators_come_from_rules():
+    from scanner.game_scanner import GameScanner
+    assert 'OptiScaler.dll' in GameScanner.OPTISCALER_INDICATOR_FILES
+    assert 'mods' in GameScanner.OPTISCALER_SUBDIRS
+
+
+def test_new_rules_are_data_only():
+    rules = DetectionRules({
+        'engines': [{'name': 'Source', 'top_files': ['hl2\\.exe'], 'top_dirs': ['bin']}],
+        'anti_cheat': [{'name': 'VAC', 'patterns': ['vac']}],
+    })
+    assert rules.match_engine({'top_dirs': ['bin']}) == 'Source'
+    assert rules.match_anti_cheat(['steamservice_vac.dll']) == ['VAC']
+    assert rules.fingerprint != detection_rules.fingerprint
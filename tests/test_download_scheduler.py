@@ -0,0 +1,106 @@
+"""
+Tests for the prioritized download pool (utils.download_scheduler):
+- queued work runs visible rows first, then retries, then prefetch
+- a queued key is not queued twice, runs the newest call and moves up when it becomes urgent
+- requests to one host never exceed the per-host cap
+- the scanner's HTTP session pool is sized to the configured concurrency
+"""
+import threading
+import time
+from unittest.mock import patch
+
+import requests
+
+from scanner.game_scanner import GameScanner
+from utils.config import config
+from utils.download_scheduler import (PRIORITY_PREFETCH, PRIORITY_RETRY, PRIORITY_VISIBLE, DownloadScheduler,
+                                      configure_session)
+
+
+def _blocked_scheduler():
+    """One worker, held busy until the returned event is set."""
+    scheduler = DownloadScheduler(workers=1)
+    gate = threading.Event()
+    scheduler.submit(gate.wait, priority=PRIORITY_VISIBLE)
+    time.sleep(0.05)
+    return scheduler, gate
+
+
+def test_runs_in_priority_order():
+    scheduler, gate = _blocked_scheduler()
+    order = []
+    futures = [scheduler.submit(order.append, name, priority=priority) for name, priority in
+               [("prefetch-1", PRIORITY_PREFETCH), ("retry", PRIORITY_RETRY),
+                ("visible", PRIORITY_VISIBLE), ("prefetch-2", PRIORITY_PREFETCH)]]
+    assert scheduler.pending() == 4
+    gate.set()
+    for f in futures:
+        f.result(timeout=2)
+
+    assert order == ["visible", "retry", "prefetch-1", "prefetch-2"]
+    scheduler.shutdown()
+
+
+def test_keyed_tasks_are_deduplicated_and_bumped():
+    scheduler, gate = _blocked_scheduler()
+    order = []
+    first = scheduler.submit(order.append, "a", priority=PRIORITY_PREFETCH, key="a")
+    scheduler.submit(order.append, "b", priority=PRIORITY_PREFETCH, key="b")
+    # Row "a" scrolled into view: same future, now ahead of "b", running the newer call once
+    again = scheduler.submit(order.append, "a-again", priority=PRIORITY_VISIBLE, key="a")
+    assert again is first
+    assert scheduler.reprioritize("missing", PRIORITY_VISIBLE) is False
+    gate.set()
+    first.result(timeout=2)
+    time.sleep(0.05)
+
+    assert order == ["a-again", "b"]
+    scheduler.shutdown()
+
+
+def test_retry_of_a_still_queued_key_is_not_dropped():
+    scheduler, gate = _blocked_scheduler()
+    ran = []
+    first = scheduler.submit(lambda: ran.append("first fetch") or "placeholder", key=("image", "game"))
+    # The catalogue finished while the first fetch was still waiting
+    retry = scheduler.submit(lambda: ran.append("retry") or "art", priority=PRIORITY_RETRY, key=("image", "game"))
+    gate.set()
+
+    assert retry is first
+    assert retry.result(timeout=2) == "art"
+    assert ran == ["retry"]
+    scheduler.shutdown()
+
+
+def test_per_host_cap():
+    scheduler = DownloadScheduler(workers=6, per_host=2)
+    active = {"cdn": 0, "store": 0}
+    peak = {"cdn": 0, "store": 0}
+    lock = threading.Lock()
+
+    def request(host):
+        with scheduler.host_slot(f"https://{host}.example.com/x.jpg"):
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.03)
+            with lock:
+                active[host] -= 1
+
+    futures = [scheduler.submit(request, "cdn" if i % 2 else "store") for i in range(12)]
+    for f in futures:
+        f.result(timeout=5)
+
+    assert peak == {"cdn": 2, "store": 2}
+    scheduler.shutdown()
+
+
+def test_session_pool_matches_concurrency():
+    session = configure_session(requests.Session(), 7)
+    assert session.get_adapter("https://cdn.akamai.steamstatic.com")._pool_maxsize == 7
+
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    adapter = scanner._requests_session.get_adapter("https://cdn.akamai.steamstatic.com")
+    assert adapter._pool_maxsize >= config.downloads_per_host
+    assert scanner.download_scheduler.workers == config.concurrent_downloads
@@ -0,0 +1,124 @@
+"""
+Tests for the os.scandir FolderFacts collector:
+- every directory is listed at most once and the root is stat'ed once
+- probe dirs (Unreal binaries, OptiScaler subdirs) are captured in the same
+  pass, even beyond max_scan_depth or after the 1000-file cap
+- detectors make no filesystem calls once they have FolderFacts
+"""
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+from scanner.game_scanner import GameScanner, FolderFacts
+from scanner.scan_index import ScanIndex
+
+
+def _scanner(tmp_path) -> GameScanner:
+    scanner = GameScanner()
+    scanner._scan_index = ScanIndex(tmp_path / "scan_index.json", factory=FolderFacts.from_dict)
+    scanner._scan_index._ensure_loaded()
+    return scanner
+
+
+def _make_unreal_game(base: Path, name: str, top_files: int = 0) -> Path:
+    d = base / name
+    (d / "Data").mkdir(parents=True)
+    (d / f"{name}.exe").touch()
+    for i in range(6):
+        (d / "Data" / f"data{i}.pak").touch()
+    for i in range(top_files):
+        (d / f"loose{i}.txt").touch()
+    win64 = d / "Engine" / "Binaries" / "Win64"
+    (win64 / "mods").mkdir(parents=True)
+    (win64 / f"{name}-Win64-Shipping.exe").touch()
+    (win64 / "mods" / "OptiScaler.dll").touch()
+    return d
+
+
+@contextmanager
+def _count_listing_calls(under: Path):
+    """Record scandir/stat calls on paths below under (the scanner's background
+    app-list loader may touch other files meanwhile)."""
+    calls = {"scandir": [], "stat": []}
+    real_scandir, real_stat = os.scandir, os.stat
+
+    def record(kind, path):
+        path = os.fspath(path)
+        if path.startswith(str(under)):
+            calls[kind].append(path)
+
+    def scandir(path="."):
+        record("scandir", path)
+        return real_scandir(path)
+
+    def stat(path, *args, **kwargs):
+        record("stat", path)
+        return real_stat(path, *args, **kwargs)
+
+    with patch("scanner.game_scanner.os.scandir", side_effect=scandir), \
+         patch("scanner.game_scanner.os.stat", side_effect=stat):
+        yield calls
+
+
+@contextmanager
+def _forbid_filesystem():
+    """Fail filesystem calls made from the test thread (other threads pass through)."""
+    touched = []
+    test_thread = threading.get_ident()
+    originals = {name: getattr(Path, name) for name in ("exists", "is_dir", "iterdir", "glob")}
+    real_scandir, real_stat = os.scandir, os.stat
+
+    def guard(real):
+        def call(*args, **kwargs):
+            if threading.get_ident() != test_thread:
+                return real(*args, **kwargs)
+            touched.append(args)
+            raise AssertionError("filesystem access from a detector")
+        return call
+
+    with patch("scanner.game_scanner.os.scandir", side_effect=guard(real_scandir)), \
+         patch("scanner.game_scanner.os.stat", side_effect=guard(real_stat)), \
+         patch.multiple(Path, **{name: guard(real) for name, real in originals.items()}):
+        yield touched
+
+
+def test_each_directory_listed_once_and_probes_captured(tmp_path):
+    scanner = _scanner(tmp_path)
+    game_dir = _make_unreal_game(tmp_path, "WalkGame")
+
+    with _count_listing_calls(game_dir) as calls:
+        facts = scanner._collect_folder_facts(game_dir)
+
+    # root, Data, Engine, Binaries, Win64 from the walk + Win64/mods (past max depth) as a probe
+    assert len(calls["scandir"]) == 6
+    assert len(set(calls["scandir"])) == 6
+    assert calls["stat"] == [str(game_dir)]
+    assert facts.probe_files["engine/binaries/win64/mods"] == ["optiscaler.dll"]
+    assert [entry[0] for entry in facts.signature][-2:] == [
+        os.path.join("Engine", "Binaries", "Win64"),
+        os.path.join("Engine", "Binaries", "Win64", "mods"),
+    ]
+
+    with _forbid_filesystem() as touched:
+        assert scanner._is_game_folder(game_dir, facts) is True
+        assert scanner._detect_engine_type(game_dir, facts) == "Unreal"
+        assert scanner._detect_optiscaler(game_dir, facts) is True
+        assert scanner._detect_anti_cheat(game_dir, facts) == []
+    assert touched == []
+
+
+def test_probes_survive_the_file_cap(tmp_path):
+    scanner = _scanner(tmp_path)
+    # Root files alone exceed the 1000-file cap, so the walk stops at the root
+    game_dir = _make_unreal_game(tmp_path, "BigGame", top_files=1001)
+
+    facts = scanner._collect_folder_facts(game_dir)
+
+    assert facts.file_count == 1001
+    assert len(facts.top_files) == 1002
+    with _forbid_filesystem() as touched:
+        assert scanner._detect_engine_type(game_dir, facts) == "Unreal"
+        assert scanner._detect_optiscaler(game_dir, facts) is True
+    assert touched == []
@@ -0,0 +1,81 @@
+"""
+Tests for the game list search index (scanner.game_search):
+- name words match by prefix, every query word must match
+- platform / engine / anti-cheat / installed state are searchable as words
+  and as field:value terms
+- re-indexing a changed game and removing games update the results
+- filtering 2,000 games per keystroke stays well under a frame
+"""
+import time
+
+from scanner.game_scanner import Game
+from scanner.game_search import GameSearchIndex, parse_query
+
+
+def _games():
+    return [
+        Game("The Witcher 3: Wild Hunt", "C:/Games/Witcher3", engine="REDengine", platform="Steam"),
+        Game("Cyberpunk 2077", "C:/Games/Cyberpunk", engine="REDengine", platform="GOG",
+             optiscaler_installed=True),
+        Game("Elden Ring", "C:/Games/EldenRing", engine="Unknown", platform="Steam",
+             anti_cheat_list=["EasyAntiCheat"], engine_supported=False),
+        Game("Hogwarts Legacy", "C:/Games/Hogwarts", engine="Unreal", platform="Epic",
+             community_verified=True),
+    ]
+
+
+def _names(index, games, query):
+    return [g.name for g in index.filter(games, query)]
+
+
+def test_prefix_words_and_fields():
+    games = _games()
+    index = GameSearchIndex(games)
+
+    assert _names(index, games, "") == [g.name for g in games]
+    assert _names(index, games, "wit") == ["The Witcher 3: Wild Hunt"]
+    assert _names(index, games, "w h") == ["The Witcher 3: Wild Hunt"]
+    assert _names(index, games, "redengine") == ["The Witcher 3: Wild Hunt", "Cyberpunk 2077"]
+    assert _names(index, games, "steam") == ["The Witcher 3: Wild Hunt", "Elden Ring"]
+    assert _names(index, games, "installed:yes") == ["Cyberpunk 2077"]
+    assert _names(index, games, "red installed:n") == ["The Witcher 3: Wild Hunt"]
+    assert _names(index, games, "ac:easy") == ["Elden Ring"]
+    assert _names(index, games, "anticheat:no verified:yes") == ["Hogwarts Legacy"]
+    assert _names(index, games, "supported:no") == ["Elden Ring"]
+    assert _names(index, games, "platform:epic unreal") == ["Hogwarts Legacy"]
+    assert _names(index, games, "witcher gog") == []
+    # Unknown fields are plain words
+    assert parse_query("year:2077") == [("plain", "year"), ("plain", "2077")]
+
+
+def test_update_and_remove():
+    games = _games()
+    index = GameSearchIndex(games)
+    assert _names(index, games, "installed:yes") == ["Cyberpunk 2077"]
+
+    games[0].optiscaler_installed = True
+    index.update(games[0])
+    assert _names(index, games, "installed:yes") == ["The Witcher 3: Wild Hunt", "Cyberpunk 2077"]
+
+    index.remove([games[1]])
+    assert len(index) == 3
+    assert _names(index, games, "installed:yes") == ["The Witcher 3: Wild Hunt"]
+    assert _names(index, games, "cyber") == []
+
+
+def test_keystroke_latency_on_large_library():
+    words = ["dark", "souls", "legend", "space", "star", "war", "racing", "city", "farm", "quest"]
+    games = [Game(f"{words[i % 10]} {words[(i // 10) % 10]} {i}", f"C:/Games/{i}",
+                  engine=("Unreal" if i % 3 else "Unity"), platform=("Steam" if i % 2 else "Epic"),
+                  optiscaler_installed=bool(i % 5 == 0))
+             for i in range(2000)]
+    index = GameSearchIndex(games)
+
+    typed = "star war installed:yes"
+    start = time.perf_counter()
+    for n in range(1, len(typed) + 1):
+        shown = index.filter(games, typed[:n])
+    per_keystroke = (time.perf_counter() - start) / len(typed)
+
+    assert shown and all(g.optiscaler_installed and {"star", "war"} <= set(g.name.split()) for g in shown)
+    assert per_keystroke < 0.016
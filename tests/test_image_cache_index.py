@@ -0,0 +1,160 @@
+"""
+Tests for the image cache index (utils.image_cache_index):
+- cache hits are index lookups, with the old stem/extension preference
+- the saved index is reused while the directory is unchanged and
+  reconciled when files appear or disappear behind its back
+- eviction removes least-recently-used images first
+- row thumbnails are deleted with their image (eviction, overwrite) and
+  orphaned ones are pruned
+- the size cleanup budgets images against the files it can't evict and keeps
+  the images of the current session
+- fetch_game_image answers cache hits without exists() probes
+"""
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from PIL import Image
+
+from utils import image_cache_index
+from utils.cache_manager import CacheManager
+from utils.config import config
+from utils.image_cache_index import ImageCacheIndex
+from utils.thumbnails import load_thumbnail
+from scanner.game_scanner import GameScanner
+
+
+def _write(path, size=100):
+    path.write_bytes(b"x" * size)
+    return path
+
+
+def _age_dir(path, seconds=60):
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_lookup_reconciles_once_and_prefers_jpg(tmp_path):
+    images = tmp_path / "game_images"
+    images.mkdir()
+    _write(images / "appid_220.png")
+    _write(images / "appid_220.jpg")
+    _write(images / "Some Game.webp")
+    _write(images / "notes.txt")
+    index = ImageCacheIndex(images)
+
+    assert index.lookup(["appid_220"]) == str(images / "appid_220.jpg")
+    assert index.lookup(["appid_999", "Some Game"]) == str(images / "Some Game.webp")
+    assert index.lookup(["notes"]) is None
+    assert len(index) == 2
+
+    _write(images / "appid_5.jpg", 300)
+    index.record(images / "appid_5.jpg")
+    assert index.lookup(["appid_5"]) == str(images / "appid_5.jpg")
+    assert index.total_bytes == 500
+
+
+def test_saved_index_is_reused_until_the_directory_changes(tmp_path):
+    images = tmp_path / "game_images"
+    images.mkdir()
+    _write(images / "appid_1.jpg")
+    _age_dir(images)
+    first = ImageCacheIndex(images)
+    assert len(first) == 1
+    first.save()
+
+    with patch("os.scandir", side_effect=AssertionError("directory listed again")):
+        assert ImageCacheIndex(images).lookup(["appid_1"]) == str(images / "appid_1.jpg")
+
+    # A file added by something else changes the directory mtime
+    _write(images / "appid_2.jpg")
+    reloaded = ImageCacheIndex(images)
+    assert reloaded.lookup(["appid_2"]) == str(images / "appid_2.jpg")
+
+
+def test_evict_removes_least_recently_used_first(tmp_path):
+    images = tmp_path / "game_images"
+    images.mkdir()
+    index = ImageCacheIndex(images)
+    for i in range(4):
+        index.record(_write(images / f"appid_{i}.jpg"))
+    with patch("time.time", return_value=time.time() + 100):
+        index.lookup(["appid_0"])
+
+    assert index.evict(max_bytes=200) == (2, 200)
+    assert sorted(p.name for p in images.iterdir()) == ["appid_0.jpg", "appid_3.jpg"]
+    assert index.evict(older_than=time.time() + 50) == (1, 100)
+    assert index.lookup(["appid_3"]) is None
+    assert index.lookup(["appid_0"]) is not None
+
+
+def test_fetch_game_image_cache_hit_without_probes(tmp_path):
+    images = tmp_path / "game_images"
+    images.mkdir()
+    _write(images / "appid_220.jpg")
+    _write(images / "Legacy Name.png")
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    scanner.game_cache_dir = images
+
+    with patch.object(Path, "exists", side_effect=AssertionError("exists() probe")):
+        assert scanner.fetch_game_image("Half-Life 2", "220") == str(images / "appid_220.jpg")
+        assert scanner.fetch_game_image("Legacy Name", "404") == str(images / "Legacy Name.png")
+
+
+def test_thumbnails_go_with_their_image(tmp_path):
+    images = tmp_path / "game_images"
+    images.mkdir()
+    index = ImageCacheIndex(images)
+    cover = images / "appid_220.jpg"
+    Image.new("RGB", (300, 140)).save(cover)
+    index.record(cover)
+
+    with patch.dict(image_cache_index._indexes, clear=True):
+        image_cache_index._indexes[os.path.normcase(os.path.abspath(str(images)))] = index
+        load_thumbnail(cover, 80, cache_dir=index.thumbnail_dir)
+        load_thumbnail(cover, 120, cache_dir=index.thumbnail_dir)
+        assert len(list(index.thumbnail_dir.iterdir())) == 2
+        assert index.total_bytes == sum(p.stat().st_size for p in images.rglob("*.jpg"))
+
+        # New artwork for the game: the old source's thumbnails are stale
+        Image.new("RGB", (200, 200)).save(cover)
+        index.record(cover)
+        assert list(index.thumbnail_dir.iterdir()) == []
+
+        load_thumbnail(cover, 80, cache_dir=index.thumbnail_dir)
+        (index.thumbnail_dir / "appid_9_80h_0123456789abcdef.jpg").write_bytes(b"orphan")
+        assert index.prune_thumbnails() == (1, 6)
+        assert len(list(index.thumbnail_dir.iterdir())) == 1
+
+        assert index.evict(max_bytes=0)[0] == 1
+        assert list(index.thumbnail_dir.iterdir()) == []
+
+    index.record(_write(images / "appid_5.jpg"))
+    (index.thumbnail_dir / "appid_5_80h_0123456789abcdef.jpg").write_bytes(b"x")
+    index.clear()
+    assert not index.thumbnail_dir.exists()
+
+
+def test_size_cleanup_keeps_this_sessions_images(tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    images = cache / "game_images"
+    images.mkdir(parents=True)
+    index = ImageCacheIndex(images)
+    # Old covers from earlier sessions, then the catalogue and scan index outgrowing the limit
+    with patch("time.time", return_value=time.time() - 3600):
+        for i in range(3):
+            index.record(_write(images / f"appid_{i}.jpg", 100_000))
+    _write(images / "steam_app_index.bin", 1_100_000)
+    manager = CacheManager()
+    manager.cache_dir, manager.game_cache_dir = cache, images
+    index.record(_write(images / "appid_3.jpg", 100_000))
+    index.lookup(["appid_1"])
+    monkeypatch.setattr(config, "max_cache_size_mb", 1)
+
+    with patch.dict(image_cache_index._indexes, clear=True):
+        image_cache_index._indexes[os.path.normcase(os.path.abspath(str(images)))] = index
+        manager._cleanup_by_size()
+
+    assert sorted(p.name for p in images.glob("appid_*")) == ["appid_1.jpg", "appid_3.jpg"]
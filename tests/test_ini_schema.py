@@ -0,0 +1,81 @@
+"""
+Tests for the cached OptiScaler.ini schema (optiscaler.ini_schema):
+- a game INI with a known release's comments is read without type inference
+- values that don't fit the cached type are inferred again
+- a plain read does not write the schema file itself
+"""
+from unittest.mock import patch
+
+from optiscaler.ini_schema import IniSchema
+from optiscaler.manager import OptiScalerManager
+
+RELEASE_INI = """[Upscalers]
+; Select upscaler for Dx12 games
+; 0 = XeSS | 1 = FSR 2.1 | 2 = DLSS
+Dx12Upscaler=2
+
+[Log]
+; Enable logging - true or false
+LoggingEnabled=true
+; Log level
+LogLevel=2
+"""
+
+
+def _manager(tmp_path, schema_path):
+    return OptiScalerManager(download_dir=tmp_path / "downloads", ini_schema=IniSchema(schema_path))
+
+
+def test_release_schema_is_reused_for_game_inis(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    release = tmp_path / "release"
+    release.mkdir()
+    (release / "OptiScaler.ini").write_text(RELEASE_INI, encoding="utf-8")
+
+    manager = _manager(tmp_path, schema_path)
+    manager._last_release_info = {"tag_name": "v0.7.7"}
+    manager._learn_ini_schema(release)
+    expected = manager.read_optiscaler_ini(release / "OptiScaler.ini")
+
+    game = tmp_path / "game"
+    game.mkdir()
+    (game / "OptiScaler.ini").write_text(RELEASE_INI.replace("Dx12Upscaler=2", "Dx12Upscaler=0"),
+                                         encoding="utf-8")
+    # A fresh manager (new session) reads the persisted schema
+    manager = _manager(tmp_path, schema_path)
+    assert manager.ini_schema.has_release("v0.7.7")
+    with patch.object(OptiScalerManager, "_infer_type", side_effect=AssertionError("inferred")):
+        settings = manager.read_optiscaler_ini(game / "OptiScaler.ini")
+
+    assert settings["Upscalers"]["Dx12Upscaler"]["value"] == "0"
+    for section, keys in expected.items():
+        for key, data in keys.items():
+            assert settings[section][key]["type"] == data["type"]
+            assert settings[section][key]["options"] == data["options"]
+
+
+def test_value_outside_cached_type_is_inferred_again(tmp_path):
+    manager = _manager(tmp_path, tmp_path / "schema.json")
+    manager.ini_schema.add_release("v0.7.7", {"Log": {"LogLevel": {
+        "value": "2", "comment": "Log level", "type": "int", "options": None}}})
+
+    ini = tmp_path / "OptiScaler.ini"
+    ini.write_text("[Log]\n; Log level\nLogLevel=verbose\n", encoding="utf-8")
+    settings = manager.read_optiscaler_ini(ini)
+
+    assert settings["Log"]["LogLevel"]["type"] == "string"
+    assert manager.ini_schema.misses == 1
+
+
+def test_plain_read_does_not_write_schema(tmp_path, isolated_ini_schema):
+    ini = tmp_path / "OptiScaler.ini"
+    ini.write_text(RELEASE_INI, encoding="utf-8")
+    manager = OptiScalerManager(download_dir=tmp_path / "downloads")
+
+    settings = manager.read_optiscaler_ini(ini)
+
+    assert settings["Log"]["LogLevel"]["type"] == "int"
+    # Learned blocks are written later by the debounced save, to the test's schema path
+    assert not isolated_ini_schema.exists()
+    assert manager.ini_schema.save() is True
+    assert isolated_ini_schema.exists()
@@ -0,0 +1,83 @@
+"""
+Tests for targeted OptiScaler status refresh (GameScanner.refresh_install_status):
+- only games whose folder changed on disk are re-walked
+- changed games are updated in place and reported to on_games_changed
+"""
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from scanner.game_scanner import FolderFacts, Game, GameScanner
+from scanner.scan_index import ScanIndex
+
+
+def _age(path: Path, seconds: float = 600):
+    stamp = time.time() - seconds
+    for root, dirs, _files in os.walk(path):
+        for d in dirs:
+            os.utime(Path(root) / d, (stamp, stamp))
+    os.utime(path, (stamp, stamp))
+
+
+def _make_game(base: Path, name: str) -> Game:
+    d = base / name
+    (d / "Data").mkdir(parents=True)
+    (d / f"{name}.exe").touch()
+    for i in range(6):
+        (d / "Data" / f"data{i}.pak").touch()
+    _age(d)
+    return Game(name, str(d))
+
+
+def _scanner(tmp_path: Path) -> GameScanner:
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    scanner._scan_index = ScanIndex(tmp_path / "scan_index.json", factory=FolderFacts.from_dict)
+    scanner._snapshot_path = tmp_path / "snapshot.json"
+    return scanner
+
+
+def test_only_changed_folders_are_walked(tmp_path):
+    scanner = _scanner(tmp_path)
+    games = [_make_game(tmp_path / "lib", name) for name in ("Alpha", "Beta", "Gamma")]
+    scanner._cached_games = list(games)
+    assert scanner.refresh_install_status(games) == []
+
+    # OptiScaler lands in Beta (an install)
+    (Path(games[1].path) / scanner.OPTISCALER_INDICATOR_FILES[0]).touch()
+    events = []
+    scanner.on_games_changed = events.append
+    walked = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        walked.append(Path(path).name)
+        return real_scandir(path)
+
+    with patch("scanner.game_scanner.os.scandir", side_effect=scandir):
+        changed = scanner.refresh_install_status(games)
+
+    assert changed == [games[1]]
+    assert events == [[games[1]]]
+    assert games[1].optiscaler_installed is True
+    assert not games[0].optiscaler_installed and not games[2].optiscaler_installed
+    assert "Beta" in walked and "Alpha" not in walked and "Gamma" not in walked
+    assert scanner._snapshot_path.exists()
+
+
+def test_uninstall_reported_once(tmp_path):
+    scanner = _scanner(tmp_path)
+    game = _make_game(tmp_path / "lib", "Delta")
+    indicator = Path(game.path) / scanner.OPTISCALER_INDICATOR_FILES[0]
+    indicator.touch()
+    assert scanner.refresh_install_status([game]) == [game]
+
+    indicator.unlink()
+    events = []
+    scanner.on_games_changed = events.append
+    assert scanner.refresh_install_status([game]) == [game]
+    assert game.optiscaler_installed is False
+    # Nothing changed since: no event
+    assert scanner.refresh_install_status([game]) == []
+    assert events == [[game]]
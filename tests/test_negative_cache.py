@@ -0,0 +1,147 @@
+"""
+Tests for the artwork negative cache (utils.negative_cache):
+- misses back off exponentially up to the maximum TTL and persist
+- stamped entries only block while the stamp matches
+- fetch_game_image makes no requests for known-missing art on a later
+  launch (including apps the Store API refuses), and does not record
+  transient server errors or failed image downloads as misses
+"""
+import time
+from unittest.mock import patch
+
+import requests
+
+from scanner.game_scanner import GameScanner
+from scanner.steam_app_index import SteamAppIndex
+from utils.negative_cache import NegativeCache
+
+HOUR = 60 * 60
+
+
+def test_backoff_doubles_and_persists(tmp_path):
+    path = tmp_path / "misses.json"
+    cache = NegativeCache(path, base_ttl=HOUR, max_ttl=5 * HOUR)
+
+    assert [cache.record_miss("appid:1") for _ in range(4)] == [HOUR, 2 * HOUR, 4 * HOUR, 5 * HOUR]
+    assert cache.blocked("appid:1")
+    assert not cache.blocked("appid:2")
+    cache.save()
+
+    reloaded = NegativeCache(path, base_ttl=HOUR, max_ttl=5 * HOUR)
+    assert reloaded.blocked("appid:1")
+    with patch("time.time", return_value=time.time() + 6 * HOUR):
+        assert not reloaded.blocked("appid:1")
+    reloaded.clear("appid:1")
+    assert not reloaded.blocked("appid:1")
+
+
+def test_stamped_entries_expire_with_the_stamp(tmp_path):
+    cache = NegativeCache(tmp_path / "misses.json")
+    cache.record_miss("name:demo", stamp=5000)
+    assert cache.blocked("name:demo", 5000)
+    assert not cache.blocked("name:demo", 5200)
+
+
+class _Response:
+    def __init__(self, status, payload=None):
+        self.status_code = status
+        self._payload = payload
+        self.content = b""
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error")
+
+
+class _SteamWithoutArt:
+    """CDN has no header.jpg; the Store API knows nothing about the app (or
+    answers store_status, or lists a header_image whose download fails)."""
+
+    def __init__(self, cdn_status=404, store_status=200, header_image=None):
+        self.cdn_status = cdn_status
+        self.store_status = store_status
+        self.header_image = header_image
+        self.urls = []
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        if "appdetails" in url:
+            if self.header_image:
+                return _Response(200, {"480": {"success": True, "data": {"header_image": self.header_image}}})
+            return _Response(self.store_status, {"480": {"success": False}})
+        if url == self.header_image:
+            raise requests.ConnectionError("connection reset")
+        return _Response(self.cdn_status)
+
+
+def _scanner(tmp_path, session):
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    scanner.game_cache_dir = tmp_path / "images"
+    scanner.game_cache_dir.mkdir(exist_ok=True)
+    scanner.artwork_misses = NegativeCache(tmp_path / "artwork_misses.json")
+    scanner._requests_session = session
+    return scanner
+
+
+def test_known_missing_art_makes_no_requests_next_launch(tmp_path):
+    first = _SteamWithoutArt()
+    scanner = _scanner(tmp_path, first)
+    placeholder = str(scanner.no_image_path)
+    assert scanner.fetch_game_image("Spacewar", "480") == placeholder
+    assert len(first.urls) == 2
+    scanner.artwork_misses.save()
+
+    second = _SteamWithoutArt()
+    relaunched = _scanner(tmp_path, second)
+    assert relaunched.fetch_game_image("Spacewar", "480") == placeholder
+    assert second.urls == []
+
+
+def test_transient_errors_are_not_recorded(tmp_path):
+    session = _SteamWithoutArt(cdn_status=503)
+    scanner = _scanner(tmp_path, session)
+    scanner.fetch_game_image("Spacewar", "480")
+    scanner.fetch_game_image("Spacewar", "480")
+    assert len(session.urls) == 4
+
+
+def test_store_refusal_after_cdn_miss_is_recorded(tmp_path):
+    first = _SteamWithoutArt(store_status=403)
+    scanner = _scanner(tmp_path, first)
+    scanner.fetch_game_image("Delisted Game", "480")
+    assert len(first.urls) == 2
+    scanner.artwork_misses.save()
+
+    second = _SteamWithoutArt(store_status=403)
+    _scanner(tmp_path, second).fetch_game_image("Delisted Game", "480")
+    assert second.urls == []
+
+
+def test_failed_store_image_download_is_not_recorded(tmp_path):
+    session = _SteamWithoutArt(header_image="https://cdn.example/header.jpg")
+    scanner = _scanner(tmp_path, session)
+    scanner.fetch_game_image("Spacewar", "480")
+    scanner.fetch_game_image("Spacewar", "480")
+    # CDN, Store API and the header_image download, on both passes
+    assert len(session.urls) == 6
+    assert not scanner.artwork_misses.blocked("appid:480")
+
+
+def test_unmatched_names_are_retried_when_the_catalogue_changes(tmp_path):
+    scanner = _scanner(tmp_path, _SteamWithoutArt())
+    scanner.steam_app_index = SteamAppIndex.from_mapping({"half-life 2": "220"})
+    lookups = []
+    resolve = scanner._get_appid_from_name
+    scanner._get_appid_from_name = lambda name: lookups.append(name) or resolve(name)
+
+    scanner.fetch_game_image("Homebrew Tool", None)
+    scanner.fetch_game_image("Homebrew Tool", None)
+    assert lookups == ["Homebrew Tool"]
+
+    scanner.steam_app_index = SteamAppIndex.from_mapping({"half-life 2": "220", "portal": "400"})
+    scanner.fetch_game_image("Homebrew Tool", None)
+    assert len(lookups) == 2
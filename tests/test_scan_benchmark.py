@@ -0,0 +1,37 @@
+"""
+Smoke test for the scan benchmark harness (benchmarks/run_scan_benchmark.py):
+the synthetic library is fully detected by scan_games, and the warm rescan is
+served from the scan index with fewer filesystem calls.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.run_scan_benchmark import make_scanner, run_benchmark  # noqa: E402
+from benchmarks.synthetic_library import LAUNCHERS, generate_library  # noqa: E402
+
+
+def test_synthetic_library_is_fully_detected(tmp_path):
+    lib = generate_library(tmp_path / "library", 10)
+    scanner = make_scanner(lib, tmp_path / "scan_index.json")
+
+    games = scanner.scan_games(force_refresh=True)
+
+    found = {}
+    for game in games:
+        found.setdefault(game.platform, []).append(game.name)
+    for launcher in LAUNCHERS:
+        assert sorted(found.get(launcher, [])) == sorted(lib.expected[launcher]), launcher
+
+
+def test_benchmark_reports_cold_and_warm_runs(tmp_path):
+    result = run_benchmark(10, tmp_path, files_per_game=12)
+
+    assert result["cold"]["games_found"] == result["games"] == 10
+    assert set(result["cold"]["per_launcher_s"]) == set(LAUNCHERS)
+    assert result["warm"]["index_hits"] == 10
+    assert result["warm"]["fs_calls"]["scandir"] < result["cold"]["fs_calls"]["scandir"]
+    assert result["cold_memory"]["peak_mem_mb"] > 0
@@ -0,0 +1,168 @@
+"""
+Tests for the persistent incremental scan index:
+- unchanged folders are served from the index (no walk, detectors memoized)
+- any signature change (new file, OptiScaler in Engine/Binaries/Win64) re-walks
+- freshly modified folders are never trusted (racy mtime window)
+- concurrent saves never interleave on the tmp file
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from scanner.game_scanner import GameScanner, FolderFacts
+from scanner.scan_index import ScanIndex
+
+
+def _age(path: Path, seconds: float = 600):
+    """Backdate mtimes of path and every directory below it."""
+    stamp = time.time() - seconds
+    for root, dirs, _files in os.walk(path):
+        for d in dirs:
+            os.utime(Path(root) / d, (stamp, stamp))
+    os.utime(path, (stamp, stamp))
+
+
+def _make_game(base: Path, name: str, unreal: bool = False) -> Path:
+    d = base / name
+    (d / "Data").mkdir(parents=True)
+    (d / f"{name}.exe").touch()
+    for i in range(6):
+        (d / "Data" / f"data{i}.pak").touch()
+    (d / "EasyAntiCheat").mkdir()
+    (d / "EasyAntiCheat" / "EasyAntiCheat.exe").touch()
+    if unreal:
+        (d / "Engine" / "Binaries" / "Win64").mkdir(parents=True)
+    _age(d)
+    return d
+
+
+def _scanner(index_path: Path) -> GameScanner:
+    scanner = GameScanner()
+    scanner._scan_index = ScanIndex(index_path, factory=FolderFacts.from_dict)
+    return scanner
+
+
+def _detect_all(scanner, game_dir, facts):
+    return (scanner._is_game_folder(game_dir, facts),
+            scanner._detect_engine_type(game_dir, facts),
+            scanner._detect_anti_cheat(game_dir, facts),
+            scanner._detect_optiscaler(game_dir, facts))
+
+
+def test_unchanged_folder_reused_across_sessions(tmp_path):
+    index_path = tmp_path / "scan_index.json"
+    game_dir = _make_game(tmp_path / "lib", "IndexedGame")
+
+    first = _scanner(index_path)
+    first._scan_index.begin_pass()
+    facts = first._collect_folder_facts(game_dir)
+    expected = _detect_all(first, game_dir, facts)
+    assert set(facts.detected) == {"engine", "anti_cheat", "optiscaler"}
+    assert first._scan_index.save(prune=True)
+
+    second = _scanner(index_path)
+    with patch("scanner.game_scanner.os.scandir", side_effect=AssertionError("walked")), \
+         patch.object(second, "_probe_optiscaler", side_effect=AssertionError("probed")), \
+         patch.object(second, "_probe_anti_cheat", side_effect=AssertionError("probed")):
+        cached = second._collect_folder_facts(game_dir)
+        assert cached is not None
+        assert _detect_all(second, game_dir, cached) == expected
+    assert second._scan_index.hits == 1
+
+
+def test_new_root_file_invalidates_record(tmp_path):
+    index_path = tmp_path / "scan_index.json"
+    game_dir = _make_game(tmp_path / "lib", "ChangedGame")
+    scanner = _scanner(index_path)
+    facts = scanner._collect_folder_facts(game_dir)
+    assert scanner._detect_optiscaler(game_dir, facts) is False
+    scanner._scan_index.save()
+
+    (game_dir / "dxgi.dll").touch()
+    _age(game_dir, 300)
+
+    rescanned = _scanner(index_path)
+    facts2 = rescanned._collect_folder_facts(game_dir)
+    assert rescanned._scan_index.misses == 1
+    assert rescanned._detect_optiscaler(game_dir, facts2) is True
+
+
+def test_unreal_binaries_change_invalidates_record(tmp_path):
+    index_path = tmp_path / "scan_index.json"
+    game_dir = _make_game(tmp_path / "lib", "UnrealGame", unreal=True)
+    scanner = _scanner(index_path)
+    facts = scanner._collect_folder_facts(game_dir)
+    assert scanner._detect_engine_type(game_dir, facts) == "Unreal"
+    assert scanner._detect_optiscaler(game_dir, facts) is False
+    scanner._scan_index.save()
+
+    # Installing into Engine/Binaries/Win64 leaves the game root mtime untouched
+    (game_dir / "Engine" / "Binaries" / "Win64" / "OptiScaler.dll").touch()
+    _age(game_dir / "Engine" / "Binaries" / "Win64", 300)
+
+    rescanned = _scanner(index_path)
+    facts2 = rescanned._collect_folder_facts(game_dir)
+    assert rescanned._detect_optiscaler(game_dir, facts2) is True
+
+
+def test_recently_modified_folder_is_not_trusted(tmp_path):
+    scanner = _scanner(tmp_path / "scan_index.json")
+    game_dir = tmp_path / "FreshGame"
+    game_dir.mkdir()
+    (game_dir / "game.exe").touch()
+
+    scanner._collect_folder_facts(game_dir)
+    scanner._collect_folder_facts(game_dir)
+
+    assert scanner._scan_index.hits == 0
+    assert scanner._scan_index.misses == 2
+
+
+def test_prune_drops_folders_not_seen_this_pass(tmp_path):
+    index_path = tmp_path / "scan_index.json"
+    kept = _make_game(tmp_path / "lib", "KeptGame")
+    gone = _make_game(tmp_path / "lib", "GoneGame")
+    scanner = _scanner(index_path)
+    scanner._collect_folder_facts(kept)
+    scanner._collect_folder_facts(gone)
+    scanner._scan_index.save()
+
+    scanner = _scanner(index_path)
+    scanner._scan_index.begin_pass()
+    scanner._collect_folder_facts(kept)
+    scanner._scan_index.save(prune=True)
+
+    reloaded = _scanner(index_path)
+    reloaded._scan_index._ensure_loaded()
+    assert list(reloaded._scan_index._entries) == [os.path.normpath(str(kept)).lower()]
+
+
+def test_concurrent_saves_do_not_interleave(tmp_path):
+    index_path = tmp_path / "scan_index.json"
+    games = [_make_game(tmp_path / "lib", f"Game{i}") for i in range(4)]
+    scanner = _scanner(index_path)
+    for game_dir in games:
+        scanner._collect_folder_facts(game_dir)
+
+    active, overlaps = [0], []
+    dump = json.dump
+
+    def slow_dump(*args, **kwargs):
+        active[0] += 1
+        overlaps.append(active[0])
+        time.sleep(0.01)
+        dump(*args, **kwargs)
+        active[0] -= 1
+
+    with patch("scanner.scan_index.json.dump", side_effect=slow_dump):
+        threads = [threading.Thread(target=scanner._scan_index.save) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert overlaps == [1] * 6
+    assert len(json.loads(index_path.read_text())["entries"]) == len(games)
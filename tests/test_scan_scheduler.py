@@ -0,0 +1,86 @@
+"""
+Tests for the shared scan scheduler:
+- no drive ever runs more than per_drive tasks at once
+- separate drives are scanned in parallel within the global bound
+- launcher sources run concurrently and still stream every batch
+"""
+import threading
+import time
+from collections import defaultdict
+
+from scanner.game_scanner import GameScanner, Game, FolderFacts
+from scanner.scan_index import ScanIndex
+from scanner.scan_scheduler import ScanScheduler, drive_key
+
+
+class _Tracker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = defaultdict(int)
+        self.peak = defaultdict(int)
+        self.total_active = 0
+        self.total_peak = 0
+
+    def task(self, drive):
+        with self.lock:
+            self.active[drive] += 1
+            self.total_active += 1
+            self.peak[drive] = max(self.peak[drive], self.active[drive])
+            self.total_peak = max(self.total_peak, self.total_active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active[drive] -= 1
+            self.total_active -= 1
+        return drive
+
+
+def test_per_drive_limit_and_global_bound():
+    scheduler = ScanScheduler(max_workers=4, per_drive=2)
+    tracker = _Tracker()
+    try:
+        futures = [scheduler.submit(drive, tracker.task, drive)
+                   for _ in range(8) for drive in ("C:", "D:", "E:")]
+        results = [f.result(timeout=5) for f in futures]
+    finally:
+        scheduler.shutdown(wait=True)
+
+    assert sorted(results) == sorted(["C:", "D:", "E:"] * 8)
+    assert all(peak <= 2 for peak in tracker.peak.values())
+    # More than one drive made progress at the same time, never above the pool size
+    assert 2 < tracker.total_peak <= 4
+
+
+def test_task_exception_is_delivered_through_future():
+    scheduler = ScanScheduler(max_workers=1, per_drive=1)
+    try:
+        future = scheduler.submit("C:", lambda: 1 / 0)
+        ok = scheduler.submit("C:", lambda: "next")
+        assert isinstance(future.exception(timeout=5), ZeroDivisionError)
+        # A failing task frees its drive slot for the next one
+        assert ok.result(timeout=5) == "next"
+    finally:
+        scheduler.shutdown(wait=True)
+
+
+def test_drive_key_groups_paths_on_same_volume(tmp_path):
+    (tmp_path / "a").mkdir()
+    assert drive_key(tmp_path / "a") == drive_key(tmp_path)
+
+
+def test_launcher_sources_run_concurrently(tmp_path):
+    scanner = GameScanner()
+    scanner._scan_index = ScanIndex(tmp_path / "scan_index.json", factory=FolderFacts.from_dict)
+    scanner._snapshot_path = str(tmp_path / "scan_snapshot.json")
+    barrier = threading.Barrier(3, timeout=5)
+
+    def source(name):
+        def scan():
+            # Deadlocks (BrokenBarrierError) unless all three run at once
+            barrier.wait()
+            return [Game(name, f"C:\\Games\\{name}", platform=name)]
+        return scan
+
+    scanner._launcher_sources = lambda scan_pass=None: [(n, source(n)) for n in ("Steam", "Epic", "GOG")]
+    scanner._discover_library_sources = lambda force_refresh=False: []
+    names = sorted(g.name for g in scanner.scan_games(force_refresh=True))
+    assert names == ["Epic", "GOG", "Steam"]
@@ -0,0 +1,107 @@
+"""
+Tests for the persisted scan snapshot (scanner.scan_snapshot):
+- a completed scan is saved and loads back without touching game folders
+- revalidation reports only added / removed / changed games and updates the
+  snapshot's Game objects in place, keeping their resolved artwork
+"""
+import json
+import shutil
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.run_scan_benchmark import make_scanner  # noqa: E402
+from benchmarks.synthetic_library import generate_library  # noqa: E402
+from scanner.game_scanner import Game, apply_game_updates  # noqa: E402
+from scanner.scan_snapshot import diff_games  # noqa: E402
+
+
+def test_game_round_trips_through_dict():
+    game = Game("Alpha", "C:/Games/Alpha", appid="10", image_path="cache/appid_10.jpg",
+                optiscaler_installed=True, engine="Unreal", anti_cheat_list=["EasyAntiCheat"],
+                engine_supported=False, platform="Steam")
+
+    copy = Game.from_dict(json.loads(json.dumps(game.to_dict())))
+
+    assert copy.to_dict() == game.to_dict()
+
+
+def test_diff_reports_added_removed_and_changed():
+    kept = Game("Kept", "C:/Games/Kept", engine="Unity")
+    edited = Game("Edited", "C:/Games/Edited")
+    gone = Game("Gone", "C:/Games/Gone")
+    fresh_edited = Game("Edited", "c:/games/edited", optiscaler_installed=True)
+    new = Game("New", "C:/Games/New")
+
+    added, removed, changed = diff_games(
+        [kept, edited, gone], [Game("Kept", "C:/Games/Kept", engine="Unity"), fresh_edited, new])
+
+    assert added == [new]
+    assert removed == [gone]
+    assert changed == [(edited, fresh_edited)]
+
+
+def test_snapshot_is_saved_and_revalidated(tmp_path):
+    lib = generate_library(tmp_path / "library", 10, files_per_game=8)
+    index_path = tmp_path / "scan_index.json"
+    snapshot_path = tmp_path / "scan_snapshot.json"
+    first = make_scanner(lib, index_path).scan_games(force_refresh=True)
+    assert snapshot_path.exists()
+
+    scanner = make_scanner(lib, index_path)
+    with patch.object(scanner, "_collect_folder_facts", side_effect=AssertionError("folder walked")):
+        shown = scanner.load_snapshot()
+    assert sorted(g.name for g in shown) == sorted(g.name for g in first)
+    assert sorted(g.name for g in scanner.get_cached_games()) == sorted(g.name for g in first)
+
+    by_platform = {}
+    for game in shown:
+        by_platform.setdefault(game.platform, []).append(game)
+    removed_game = by_platform["Epic"][0]
+    changed_game = by_platform["GOG"][0]
+    kept_game = by_platform["Heroic"][0]
+    kept_game.image_path = str(tmp_path / "art.jpg")
+    shutil.rmtree(removed_game.path)
+    (Path(changed_game.path) / "OptiScaler.dll").touch()
+    new_folder = lib.epic_path / "BrandNewGame"
+    (new_folder / "Data").mkdir(parents=True)
+    (new_folder / "BrandNewGame.exe").touch()
+    for i in range(6):
+        (new_folder / "Data" / f"data{i}.pak").touch()
+    (new_folder / ".egstore").mkdir()
+    (new_folder / ".egstore" / "NEW.mancfg").write_text(json.dumps({"DisplayName": "Brand New Game"}))
+
+    added, removed, changed = scanner.revalidate_snapshot()
+
+    assert [g.name for g in added] == ["Brand New Game"]
+    assert removed == [removed_game]
+    assert [game for game, _ in changed] == [changed_game]
+    assert changed[0][1] == {"optiscaler_installed": True}
+    # Shown games only change when the UI thread applies the updates
+    assert changed_game.optiscaler_installed is False
+    assert apply_game_updates(changed) == [changed_game]
+    assert changed_game.optiscaler_installed is True
+    cached = scanner.get_cached_games()
+    assert any(g is kept_game for g in cached)
+    assert kept_game.image_path == str(tmp_path / "art.jpg")
+
+    saved = {g["name"]: g for g in json.loads(snapshot_path.read_text())["games"]}
+    assert "Brand New Game" in saved and removed_game.name not in saved
+    assert saved[kept_game.name]["image_path"] == str(tmp_path / "art.jpg")
+
+
+def test_rescan_keeps_artwork_resolved_for_the_same_folder(tmp_path):
+    lib = generate_library(tmp_path / "library", 5, files_per_game=8)
+    scanner = make_scanner(lib, tmp_path / "scan_index.json")
+    games = scanner.scan_games(force_refresh=True)
+    games[0].image_path = str(tmp_path / "art.jpg")
+
+    rescanned = scanner.scan_games(force_refresh=True)
+
+    match = [g for g in rescanned if g.path == games[0].path]
+    assert match and match[0] is not games[0]
+    assert match[0].image_path == str(tmp_path / "art.jpg")
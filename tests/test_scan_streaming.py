@@ -0,0 +1,50 @@
+"""
+Tests for the streaming scan pipeline:
+- scan_games_iter yields one deduplicated batch per source as it finishes
+- duplicates across sources are dropped from later batches
+- scan_games returns the flattened batches and caches them
+"""
+from unittest.mock import patch
+
+from scanner.game_scanner import GameScanner, Game, FolderFacts
+from scanner.scan_index import ScanIndex
+
+
+def _scanner(tmp_path, sources):
+    scanner = GameScanner()
+    scanner._scan_index = ScanIndex(tmp_path / "scan_index.json", factory=FolderFacts.from_dict)
+    scanner._snapshot_path = str(tmp_path / "scan_snapshot.json")
+    scanner._scan_sources = lambda force_refresh=False, scan_pass=None: iter(sources)
+    return scanner
+
+
+def test_batches_stream_per_source_with_cross_source_dedup(tmp_path):
+    sources = [
+        ("Steam", [Game("Alpha", "C:\\Games\\Alpha", platform="Steam"),
+                   Game("Steam Launcher", "C:\\Games\\Launcher", platform="Steam")]),
+        ("Epic", []),
+        ("Xbox", [Game("Beta", "C:\\XboxGames\\Beta", platform="Xbox")]),
+        # Same Xbox game seen again through WindowsApps, plus a repeat of Alpha
+        ("Xbox library", [Game("Beta", "C:\\Program Files\\WindowsApps\\Beta", platform="Xbox"),
+                          Game("alpha", "C:\\Games\\Alpha", platform="Steam"),
+                          Game("Gamma", "D:\\Games\\Gamma", platform="Xbox")]),
+    ]
+    scanner = _scanner(tmp_path, sources)
+    with patch("scanner.game_scanner.threading.Thread"):
+        batches = [[g.name for g in batch] for batch in scanner.scan_games_iter(force_refresh=True)]
+
+    assert batches == [["Alpha"], ["Beta"], ["Gamma"]]
+    assert [g.name for g in scanner.get_cached_games()] == ["Alpha", "Beta", "Gamma"]
+
+
+def test_cache_is_filled_only_after_the_stream_completes(tmp_path):
+    sources = [("Steam", [Game("Alpha", "C:\\Games\\Alpha", platform="Steam")]),
+               ("GOG", [Game("Delta", "C:\\GOG\\Delta", platform="GOG")])]
+    scanner = _scanner(tmp_path, sources)
+    with patch("scanner.game_scanner.threading.Thread"):
+        stream = scanner.scan_games_iter(force_refresh=True)
+        next(stream)
+        assert scanner.get_cached_games() is None
+        assert [g.name for g in scanner.scan_games()] == ["Alpha", "Delta"]
+        # A cached scan is served as a single batch
+        assert [[g.name for g in b] for b in scanner.scan_games_iter()] == [["Alpha", "Delta"]]
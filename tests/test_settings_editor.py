@@ -0,0 +1,116 @@
+"""
+Tests for what the settings editor saves when only some sections were expanded
+(gui.widgets.settings_editor_frame):
+- sections that were never built are written back with their file values
+- auto settings reach both built widgets and keys of unbuilt sections
+
+Tk can't open a window here, so the frame is set up from a SettingsModel
+without its widgets; the expanded section gets stand-ins for the option menus
+and entries it would have built.
+"""
+import sys
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from gui.widgets.settings_editor_frame import SettingsEditorFrame
+from optiscaler.manager import OptiScalerManager
+from optiscaler.settings_model import load_settings_model
+
+INI = """[Dlss]
+; Enable DLSS - true or false
+Enabled=false
+; Quality mode
+; 0 = Performance | 1 = Balanced | 2 = Quality
+QualityMode=0
+
+[Fsr]
+; Enable FSR - true or false
+Enabled=true
+; Quality mode
+; 0 = Performance | 1 = Balanced | 2 = Quality
+QualityMode=1
+; Sharpness
+Sharpness=0.3
+"""
+
+
+class _OptionMenu:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class _Entry:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def delete(self, first, last):
+        self.value = ""
+
+    def insert(self, index, text):
+        self.value = text
+
+
+def _frame(tmp_path, expanded):
+    ini_path = tmp_path / "OptiScaler.ini"
+    ini_path.write_text(INI, encoding="utf-8")
+    manager = OptiScalerManager(download_dir=tmp_path / "downloads")
+    frame = SettingsEditorFrame.__new__(SettingsEditorFrame)
+    frame.ini_path = str(ini_path)
+    frame.optiscaler_manager = manager
+    frame.model = load_settings_model(str(ini_path), manager)
+    frame.settings = frame.model.settings
+    frame.widgets = {}
+    for section in expanded:
+        for key, data in frame.settings[section].items():
+            shown = frame._display_value(data, data["value"])
+            widget = _OptionMenu(shown) if data["type"] in ("bool_options", "options") else _Entry(shown)
+            frame.widgets[f"{section}.{key}"] = widget
+    return frame
+
+
+def _saved(frame):
+    return {section: {key: data["value"] for key, data in keys.items()}
+            for section, keys in frame.optiscaler_manager.read_optiscaler_ini(frame.ini_path).items()}
+
+
+def test_unexpanded_sections_keep_file_values_and_take_auto_settings(tmp_path):
+    frame = _frame(tmp_path, expanded=["Dlss"])
+    frame._detect_gpu = lambda: {"name": "GeForce RTX 4070", "name_upper": "GEFORCE RTX 4070", "vram_gb": 12}
+    messages = []
+    messagebox = SimpleNamespace(CTkMessagebox=lambda **kwargs: messages.append(kwargs))
+
+    with patch.dict(sys.modules, {"CTkMessagebox": messagebox}):
+        frame._apply_auto_settings()
+        # The built widgets show the recommendation as the user would see it
+        assert frame.widgets["Dlss.QualityMode"].get() == "Quality"
+        frame._save_settings()
+
+    assert len(messages) == 2
+    assert _saved(frame) == {
+        "Dlss": {"Enabled": "true", "QualityMode": "2"},
+        # Never expanded: recommendations written straight into the settings,
+        # everything else as read from the file
+        "Fsr": {"Enabled": "auto", "QualityMode": "2", "Sharpness": "0.3"},
+    }
+
+
+def test_edits_in_collapsed_built_sections_are_saved(tmp_path):
+    frame = _frame(tmp_path, expanded=["Fsr"])
+    frame.widgets["Fsr.Sharpness"].delete(0, "end")
+    frame.widgets["Fsr.Sharpness"].insert(0, "0.8")
+
+    with patch.dict(sys.modules, {"CTkMessagebox": SimpleNamespace(CTkMessagebox=lambda **kwargs: None)}):
+        frame._save_settings()
+
+    saved = _saved(frame)
+    assert saved["Fsr"] == {"Enabled": "true", "QualityMode": "1", "Sharpness": "0.8"}
+    assert saved["Dlss"] == {"Enabled": "false", "QualityMode": "0"}
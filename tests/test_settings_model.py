@@ -0,0 +1,47 @@
+"""
+Tests for the settings editor's off-thread model (load_settings_model):
+- the INI is parsed and every displayed string is resolved up front
+- a missing INI gives an empty model instead of an error
+"""
+import threading
+
+from optiscaler.settings_model import BOOL_VALUES, load_settings_model
+from utils.translation_manager import get_translation_manager
+
+INI = """[Upscalers]
+; Select upscaler for Dx12 games
+; 0 = XeSS | 1 = FSR 2.1 | 2 = DLSS
+Dx12Upscaler=2
+
+[Log]
+; Enable logging - true or false
+LoggingEnabled=true
+LogFile=auto
+"""
+
+
+def test_model_is_ready_to_render(tmp_path):
+    ini = tmp_path / "OptiScaler.ini"
+    ini.write_text(INI, encoding="utf-8")
+
+    result = {}
+    worker = threading.Thread(target=lambda: result.setdefault("model", load_settings_model(str(ini))))
+    worker.start()
+    worker.join()
+    model = result["model"]
+
+    assert list(model.settings) == ["Upscalers", "Log"]
+    assert model.settings["Upscalers"]["Dx12Upscaler"]["type"] == "options"
+    assert model.settings["Log"]["LoggingEnabled"]["type"] == "bool_options"
+    tm = get_translation_manager()
+    assert model.section_title("Upscalers") == tm.get_section_title("Upscalers")
+    assert model.bool_labels == [tm.get_setting_value_label(v) for v in BOOL_VALUES]
+    # Every key has a description, falling back to the "no description" text
+    assert all(model.description(section, key)
+               for section, keys in model.settings.items() for key in keys)
+
+
+def test_missing_ini_gives_empty_model(tmp_path):
+    model = load_settings_model(str(tmp_path / "OptiScaler.ini"))
+    assert model.settings == {}
+    assert len(model.bool_labels) == len(BOOL_VALUES)
@@ -0,0 +1,99 @@
+"""
+Tests for single-flight de-duplication (utils.single_flight):
+- concurrent calls under one key run once and share the result or error
+- concurrent fetch_game_image calls for one AppID download and encode once
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from scanner.game_scanner import GameScanner
+from utils.negative_cache import NegativeCache
+from utils.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_run():
+    flights = SingleFlight()
+    calls = []
+    started = threading.Event()
+
+    def work(x):
+        calls.append(x)
+        started.set()
+        time.sleep(0.1)
+        return x * 2
+
+    with ThreadPoolExecutor(8) as pool:
+        leader = pool.submit(flights.do, "k", work, 21)
+        started.wait(1)
+        followers = [pool.submit(flights.do, "k", work, 99) for _ in range(7)]
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert calls == [21]
+    assert results == [42] * 8
+    assert flights.shared == 7
+    assert not flights.in_flight("k")
+    # Finished flights are not cached
+    assert flights.do("k", work, 1) == 2
+
+
+def test_errors_reach_every_waiter():
+    flights = SingleFlight()
+    started = threading.Event()
+
+    def fail():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(3) as pool:
+        leader = pool.submit(flights.do, "k", fail)
+        started.wait(1)
+        follower = pool.submit(flights.do, "k", fail)
+        for f in (leader, follower):
+            with pytest.raises(ValueError):
+                f.result()
+
+
+class _SlowCdn:
+    def __init__(self):
+        self.urls = []
+        buf = BytesIO()
+        Image.new("RGB", (460, 215), (1, 2, 3)).save(buf, "JPEG")
+        self.jpeg = buf.getvalue()
+
+    def get(self, url, **kwargs):
+        self.urls.append(url)
+        time.sleep(0.2)
+        resp = type("Resp", (), {})()
+        resp.status_code = 200
+        resp.content = self.jpeg
+        return resp
+
+
+def test_same_appid_downloads_once(tmp_path):
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = GameScanner()
+    scanner.game_cache_dir = tmp_path / "images"
+    scanner.game_cache_dir.mkdir()
+    scanner.artwork_misses = NegativeCache(tmp_path / "misses.json")
+    scanner.steam_paths = []
+    cdn = _SlowCdn()
+    scanner._requests_session = cdn
+    saves = []
+    real_save = scanner._save_cache_image
+    scanner._save_cache_image = lambda image, out: saves.append(out) or real_save(image, out)
+
+    # Base game and its GOTY edition both resolve to AppID 292030
+    with ThreadPoolExecutor(4) as pool:
+        paths = list(pool.map(lambda name: scanner.fetch_game_image(name, "292030"),
+                              ["The Witcher 3", "The Witcher 3 GOTY", "The Witcher 3", "Witcher 3"]))
+
+    assert len(cdn.urls) == 1
+    assert len(saves) == 1
+    assert set(paths) == {str(tmp_path / "images" / "appid_292030.jpg")}
@@ -0,0 +1,237 @@
+"""
+Tests for the memory-mapped Steam app-name index (scanner.steam_app_index):
+- exact, normalized and token-subset lookups match the dict-based behaviour
+- the on-disk index is mapped at startup instead of re-parsing the JSON list
+- fuzzy matching scores trigram-ranked candidates and agrees with a full
+  difflib scan at the same 0.82 cutoff
+- batch AppID resolution agrees with single lookups and stamps scanned games
+- misses against an index swapped out mid-resolution don't stick to the new one
+- a catalogue download rebuilds the index at doubling intervals, notifies the
+  UI once and hands back names matched against the partial index
+"""
+import difflib
+import json
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from scanner import game_scanner
+from scanner.game_scanner import GameScanner
+from scanner.steam_app_index import SteamAppIndex, write_index
+from utils.config import config
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from benchmarks.run_fuzzy_benchmark import make_catalogue, make_queries, run_benchmark  # noqa: E402
+from benchmarks.run_scan_benchmark import make_scanner  # noqa: E402
+from benchmarks.synthetic_library import generate_library  # noqa: E402
+
+APPS = {
+    "half-life 2": "220",
+    "half-life: alyx": "546560",
+    "the witcher 3: wild hunt": "292030",
+    "the witcher 3: wild hunt - blood and wine": "378648",
+    "cyberpunk 2077": "1091500",
+    "pokémon legends": "999",
+    "bad appid": "not-a-number",
+}
+
+
+def test_lookups_over_mapped_index(tmp_path):
+    path = tmp_path / "steam_app_index.bin"
+    write_index(path, APPS)
+    index = SteamAppIndex.open(path)
+    try:
+        assert len(index) == 6
+        assert index.get("half-life 2") == "220"
+        assert index.get("pokémon legends") == "999"
+        assert index.get("bad appid") is None
+        assert index.get("half-life") is None
+        assert index.get_normalized("half life alyx") == "546560"
+        # All tokens must match; the name with the fewest tokens wins
+        assert index.best_token_match({"witcher", "3"}) == "292030"
+        assert index.best_token_match({"wine", "witcher"}) == "378648"
+        assert index.best_token_match({"witcher", "cyberpunk"}) is None
+        assert index.best_token_match({"nosuchtoken"}) is None
+        assert "cyberpunk 2077" in index.normalized_names()
+        assert dict(index.items())["cyberpunk 2077"] == "1091500"
+    finally:
+        index.close()
+
+
+def test_empty_index():
+    index = SteamAppIndex.from_mapping({})
+    assert len(index) == 0
+    assert index.get("anything") is None
+    assert index.best_token_match({"anything"}) is None
+
+
+def test_fuzzy_match_agrees_with_full_difflib_scan():
+    catalogue = make_catalogue(3000)
+    index = SteamAppIndex.from_mapping(catalogue)
+    all_norms = index.normalized_names()
+
+    for query in make_queries(catalogue, 45):
+        expected = (difflib.get_close_matches(query, all_norms, n=1, cutoff=0.82) or [None])[0]
+        assert index.fuzzy_match(query, cutoff=0.82) == expected, query
+
+    assert index.fuzzy_match("") is None
+    assert index.fuzzy_match("qqqqqqqqqq") is None
+
+
+def test_fuzzy_benchmark_reports_both_paths(tmp_path):
+    result = run_benchmark(1000, 12, tmp_path)
+
+    assert result["apps"] == 1000
+    assert result["agreement"] == 1.0
+    assert result["indexed_matches"] > 0
+
+
+def _scanner():
+    # Run the app-list init synchronously in the test instead of on a thread
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        return GameScanner()
+
+
+def test_startup_maps_index_and_resolves_names(tmp_path):
+    (tmp_path / "steam_app_list.json").write_text(json.dumps(APPS), encoding="utf-8")
+    with patch.object(config, "game_cache_dir", tmp_path):
+        first = _scanner()
+        first._init_app_list_async()
+        # A fresh JSON list from an older version is converted once
+        assert (tmp_path / "steam_app_index.bin").exists()
+
+        scanner = _scanner()
+        with patch("json.load", side_effect=AssertionError("JSON list re-parsed")):
+            scanner._init_app_list_async()
+
+    assert len(scanner.steam_app_index) == 6
+    assert scanner._get_appid_from_name("Half-Life 2") == "220"
+    assert scanner._get_appid_from_name("The Witcher 3 Wild Hunt GOTY Edition") == "292030"
+    assert scanner._get_appid_from_name("Cyberpunk 2077 for Windows") == "1091500"
+    assert scanner._get_appid_from_name("Cyberpunc 2077") == "1091500"
+    assert scanner._get_appid_from_name("Completely Unknown Title") is None
+
+
+def test_batch_resolution_matches_single_lookups():
+    scanner = _scanner()
+    scanner.steam_app_index = SteamAppIndex.from_mapping(APPS)
+    names = ["Half-Life 2", "half-life 2", "HALF LIFE ALYX", "The Witcher 3 Wild Hunt GOTY Edition",
+             "Cyberpunc 2077", "Unknown Thing", "", None]
+
+    batch = scanner.resolve_appids(names)
+
+    single = _scanner()
+    single.steam_app_index = scanner.steam_app_index
+    assert batch == {name: single._get_appid_from_name(name) for name in names}
+    assert batch["Half-Life 2"] == batch["half-life 2"] == "220"
+    assert batch["Unknown Thing"] is None
+
+
+
+def test_index_swap_during_resolution_keeps_misses_with_the_old_index():
+    scanner = _scanner()
+    scanner.steam_app_index = SteamAppIndex.from_mapping({"portal": "400"})
+    real_resolve = scanner._resolve_appid_keys
+
+    def resolve_while_catalogue_grows(index, keys):
+        found = real_resolve(index, keys)
+        scanner._set_steam_app_index(SteamAppIndex.from_mapping(APPS))
+        return found
+
+    with patch.object(scanner, "_resolve_appid_keys", resolve_while_catalogue_grows):
+        assert scanner.resolve_appids(["Half-Life 2"]) == {"Half-Life 2": None}
+
+    assert scanner.resolve_appids(["Half-Life 2"]) == {"Half-Life 2": "220"}
+
+
+def test_catalogue_download_merges_rarely_and_notifies_once(tmp_path):
+    clock = [0.0]
+    seen_mid_download = []
+
+    class _Catalogue:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def fetch(self, on_page):
+            pages = {}
+            for page in range(40):
+                clock[0] += 1.0  # one page a second
+                apps = {f"catalogue game {page}": str(1000 + page)}
+                pages.update(apps)
+                on_page(page, apps)
+                if page == 20:
+                    seen_mid_download.append(scanner.resolve_appids(["Catalogue Game 2"])["Catalogue Game 2"])
+                    seen_mid_download.append(scanner.take_provisional_appids())
+            return pages, True
+
+    scanner = _scanner()
+    notified = []
+    scanner.on_app_list_ready = lambda: notified.append(len(scanner.steam_app_index))
+    rebuilds = []
+    real_from_mapping = SteamAppIndex.from_mapping
+
+    def counting_from_mapping(apps):
+        rebuilds.append(len(apps))
+        return real_from_mapping(apps)
+
+    with patch.object(config, "game_cache_dir", tmp_path), \
+            patch.object(game_scanner, "SteamSpyCatalogue", _Catalogue), \
+            patch.object(game_scanner, "time", SimpleNamespace(monotonic=lambda: clock[0], time=time.time)), \
+            patch.object(SteamAppIndex, "from_mapping", counting_from_mapping), \
+            patch.object(scanner, "_build_local_steam_app_list", lambda: {}):
+        scanner._init_app_list_async()
+
+    # Local manifests, then rebuilds 3, 6 and 12 s apart (not every 3 s)
+    assert rebuilds == [0, 3, 9, 21]
+    assert notified == [40]
+    assert seen_mid_download == ["1002", set()]
+    assert scanner.take_provisional_appids() == {"catalogue game 2"}
+    assert scanner.take_provisional_appids() == set()
+
+
+def test_retry_pass_re_resolves_names_matched_against_a_partial_index(tmp_path):
+    from gui.widgets.game_list_frame import GameListFrame
+    from scanner.game_scanner import Game
+
+    scanner = _scanner()
+    scanner._set_steam_app_index(SteamAppIndex.from_mapping({"cyberpunk 2077 demo": "111"}), partial=True)
+    cover = tmp_path / "appid_111.jpg"
+    cover.write_bytes(b"jpg")
+    epic = Game("Cyberpunk 2077", tmp_path / "epic", appid=scanner._get_appid_from_name("Cyberpunk 2077"),
+                image_path=str(cover), platform="Epic")
+    steam = Game("Cyberpunk 2077", tmp_path / "steam", appid="1091500", image_path=str(cover), platform="Steam")
+    scanner.steam_app_index = SteamAppIndex.from_mapping(APPS)
+    invalidated = []
+    frame = SimpleNamespace(game_scanner=scanner, _all_games=[epic, steam],
+                            _executor=SimpleNamespace(submit=lambda fn: fn()),
+                            after=lambda ms, fn: fn(),
+                            _thumb_loader=SimpleNamespace(invalidate=invalidated.append),
+                            _update_viewport=lambda: None)
+
+    GameListFrame._retry_missing_images(frame)
+
+    assert epic.appid == "1091500" and epic.image_path is None
+    assert steam.image_path == str(cover)
+    assert invalidated == [epic]
+
+def test_scan_stamps_appids_for_non_steam_games(tmp_path):
+    lib = generate_library(tmp_path / "library", 10, files_per_game=8)
+    with patch.object(GameScanner, "_init_app_list_async", lambda self: None):
+        scanner = make_scanner(lib, tmp_path / "scan_index.json")
+    epic_name = lib.expected["Epic"][0]
+    scanner.steam_app_index = SteamAppIndex.from_mapping({epic_name.lower(): "777"})
+    calls = []
+    real_resolve = scanner.resolve_appids
+    scanner.resolve_appids = lambda names: calls.append(list(names)) or real_resolve(names)
+
+    games = {g.name: g for g in scanner.scan_games(force_refresh=True)}
+
+    assert games[epic_name].appid == "777"
+    assert all(g.appid for g in games.values() if g.platform == "Steam")
+    # One batch call per streamed launcher batch, not one per game
+    assert len(calls) <= 5
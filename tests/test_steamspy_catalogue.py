@@ -0,0 +1,178 @@
+"""
+Tests for the SteamSpy catalogue fetcher (scanner.steamspy_catalogue) against
+a local HTTP stand-in for the SteamSpy API:
+- pages download concurrently, behind the shared rate limiter
+- an interrupted download resumes with only the missing pages
+- a refresh revalidates pages with ETags and reuses them on 304
+"""
+import json
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from scanner.steamspy_catalogue import SteamSpyCatalogue, _RateLimiter
+
+PAGES = 8
+PER_PAGE = 5
+
+
+class _FakeSteamSpy:
+    """Serves PAGES pages of PER_PAGE apps, then an empty page."""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.failing = set()
+        self.requests = []
+        self.not_modified = 0
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def page_data(self, page):
+        if page >= PAGES:
+            return {}
+        data = {str(page * 100 + i): {"name": f"Game {page}-{i}"} for i in range(PER_PAGE)}
+        data[str(page * 100 + 99)] = {"name": f"DLC pack {page}"}  # filtered out
+        return data
+
+    def handle(self, handler):
+        page = int(parse_qs(urlparse(handler.path).query)["page"][0])
+        with self.lock:
+            self.requests.append((page, time.monotonic()))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            etag = f'"page-{page}"'
+            if page in self.failing:
+                handler.send_response(500)
+                handler.end_headers()
+            elif handler.headers.get("If-None-Match") == etag:
+                with self.lock:
+                    self.not_modified += 1
+                handler.send_response(304)
+                handler.send_header("ETag", etag)
+                handler.end_headers()
+            else:
+                body = json.dumps(self.page_data(page)).encode()
+                handler.send_response(200)
+                handler.send_header("Content-Type", "application/json")
+                handler.send_header("ETag", etag)
+                handler.send_header("Content-Length", str(len(body)))
+                handler.end_headers()
+                handler.wfile.write(body)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@contextmanager
+def _serve(api):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            api.handle(self)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/api.php"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _catalogue(url, pages_dir, **kwargs):
+    options = dict(workers=4, interval=0.0, max_pages=20, retries=0, backoff=0.0)
+    options.update(kwargs)
+    return SteamSpyCatalogue(requests.Session(), pages_dir, url=url, **options)
+
+
+def _expected():
+    return {f"game {p}-{i}": str(p * 100 + i) for p in range(PAGES) for i in range(PER_PAGE)}
+
+
+def test_pages_download_concurrently_until_the_end(tmp_path):
+    api = _FakeSteamSpy(latency=0.15)
+    seen = []
+    with _serve(api) as url:
+        start = time.monotonic()
+        apps, complete = _catalogue(url, tmp_path).fetch(lambda page, page_apps: seen.append(page))
+        elapsed = time.monotonic() - start
+
+    assert complete is True
+    assert apps == _expected()
+    assert set(range(PAGES + 1)) <= set(seen)
+    assert api.max_active > 1
+    # 9 requests of 0.15 s each would take 1.35 s one after another
+    assert elapsed < 1.0
+    # Nothing far past the empty end page is requested
+    assert max(page for page, _ in api.requests) < PAGES + 4
+
+
+def test_rate_limiter_spaces_request_starts():
+    # A frozen clock: the limiter's start times and sleeps are exact, whatever the load
+    sleeps = []
+    with patch("scanner.steamspy_catalogue.time.monotonic", return_value=100.0), \
+            patch("scanner.steamspy_catalogue.time.sleep", side_effect=sleeps.append):
+        limiter = _RateLimiter(0.5)
+        starts = []
+        threads = [threading.Thread(target=lambda: starts.append(limiter.wait())) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(starts) == [100.0 + 0.5 * i for i in range(6)]
+    # The first caller goes at once; everyone else sleeps until their slot
+    assert sorted(sleeps) == [0.5 * i for i in range(1, 6)]
+
+
+def test_rate_limiter_does_not_delay_after_idle():
+    with patch("scanner.steamspy_catalogue.time.monotonic", side_effect=[10.0, 20.0]), \
+            patch("scanner.steamspy_catalogue.time.sleep") as sleep:
+        limiter = _RateLimiter(0.5)
+        assert limiter.wait() == 10.0
+        assert limiter.wait() == 20.0
+    sleep.assert_not_called()
+
+
+def test_interrupted_download_resumes_missing_pages(tmp_path):
+    api = _FakeSteamSpy()
+    api.failing = {5}
+    with _serve(api) as url:
+        partial, complete = _catalogue(url, tmp_path, workers=1).fetch()
+        assert complete is False
+        assert "game 4-0" in partial and "game 5-0" not in partial
+
+        api.failing = set()
+        api.requests.clear()
+        apps, complete = _catalogue(url, tmp_path, workers=1).fetch()
+
+    assert complete is True
+    assert apps == _expected()
+    assert sorted(page for page, _ in api.requests) == list(range(5, PAGES + 1))
+
+
+def test_refresh_revalidates_pages_with_etags(tmp_path):
+    api = _FakeSteamSpy()
+    with _serve(api) as url:
+        _catalogue(url, tmp_path).fetch()
+        # A catalogue older than max_age is revalidated page by page
+        refresher = _catalogue(url, tmp_path, max_age_days=0)
+        apps, complete = refresher.fetch()
+
+    assert complete is True
+    assert apps == _expected()
+    assert refresher.stats["not_modified"] == PAGES + 1
+    # Only pages past the end (requested by workers already in flight) are new
+    assert refresher.stats["downloaded"] <= 3
+    assert sorted(tmp_path.iterdir())[-1].name == f"page_{PAGES:04d}.json"
@@ -0,0 +1,64 @@
+"""
+Tests for display-ready list thumbnails (utils.thumbnails):
+- thumbnails come out at the exact row height, aspect ratio kept
+- JPEG sources are decoded with draft() (reduced-resolution decode)
+- rendered thumbnails are served from the disk cache until the source changes
+"""
+import os
+from unittest.mock import patch
+
+from PIL import Image, JpegImagePlugin
+
+from utils import thumbnails
+from utils.thumbnails import load_thumbnail, thumbnail_path
+
+
+def _source(path, size=(300, 140), fmt="JPEG", color=(10, 120, 200)):
+    mode = "RGBA" if fmt == "PNG" else "RGB"
+    Image.new(mode, size, color).save(path, fmt)
+    return path
+
+
+def test_thumbnail_has_exact_row_height(tmp_path):
+    jpg = _source(tmp_path / "appid_220.jpg")
+    png = _source(tmp_path / "Forza.png", size=(620, 300), fmt="PNG")
+
+    thumb = load_thumbnail(jpg, 80, cache_dir=tmp_path / "thumbs")
+    assert thumb.size == (171, 80)
+    assert thumb.mode == "RGB"
+    assert load_thumbnail(png, 160, cache_dir=tmp_path / "thumbs").size == (331, 160)
+
+
+def test_jpeg_sources_use_draft_decoding(tmp_path):
+    jpg = _source(tmp_path / "big.jpg", size=(1920, 1080))
+    drafts = []
+    real_draft = JpegImagePlugin.JpegImageFile.draft
+
+    def spy(self, mode, size):
+        drafts.append(size)
+        return real_draft(self, mode, size)
+
+    with patch.object(JpegImagePlugin.JpegImageFile, "draft", spy):
+        thumb = load_thumbnail(jpg, 80, cache_dir=tmp_path / "thumbs")
+
+    assert drafts == [(142, 80)]
+    assert thumb.size == (142, 80)
+
+
+def test_thumbnails_are_cached_until_the_source_changes(tmp_path):
+    jpg = _source(tmp_path / "appid_220.jpg")
+    cache_dir = tmp_path / "thumbs"
+    load_thumbnail(jpg, 80, cache_dir=cache_dir)
+    cached = thumbnail_path(jpg, 80, cache_dir)
+    assert cached.exists()
+
+    with patch.object(thumbnails, "render_thumbnail", side_effect=AssertionError("re-rendered")):
+        assert load_thumbnail(jpg, 80, cache_dir=cache_dir).size == (171, 80)
+
+    # New artwork for the same game gets a fresh thumbnail
+    _source(jpg, size=(200, 200))
+    st = os.stat(jpg)
+    os.utime(jpg, ns=(st.st_atime_ns, st.st_mtime_ns + 10_000_000))
+    assert thumbnail_path(jpg, 80, cache_dir) != cached
+    assert load_thumbnail(jpg, 80, cache_dir=cache_dir).size == (80, 80)
+    assert thumbnail_path(tmp_path / "missing.jpg", 80, cache_dir) is None
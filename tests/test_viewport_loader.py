@@ -0,0 +1,98 @@
+"""
+Tests for viewport-driven thumbnail loading (utils.viewport_loader):
+- yview fractions map to the rows on screen
+- visible rows run first, look-ahead rows are queued as prefetch
+- queued rows that scroll far away are cancelled; finished rows are not
+  re-queued until invalidated
+"""
+import threading
+import time
+
+from utils.download_scheduler import PRIORITY_VISIBLE, DownloadScheduler
+from utils.viewport_loader import ViewportLoader, visible_rows
+
+
+def _blocked_scheduler():
+    """One worker, held busy until the returned event is set."""
+    scheduler = DownloadScheduler(workers=1)
+    gate = threading.Event()
+    scheduler.submit(gate.wait, priority=PRIORITY_VISIBLE)
+    time.sleep(0.05)
+    return scheduler, gate
+
+
+def _wait_idle(loader, timeout=2):
+    deadline = time.time() + timeout
+    while loader.pending() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_visible_rows():
+    assert visible_rows(0.0, 1.0, 0) == (0, 0)
+    assert visible_rows(0.0, 0.1, 100) == (0, 10)
+    assert visible_rows(0.505, 0.6, 100) == (50, 60)
+    # Scrolled to the very end, and a list shorter than the window
+    assert visible_rows(1.0, 1.0, 100) == (99, 100)
+    assert visible_rows(0.0, 1.0, 5) == (0, 5)
+
+
+def test_visible_rows_first_then_lookahead():
+    scheduler, gate = _blocked_scheduler()
+    order = []
+    loader = ViewportLoader(scheduler, order.append, key=lambda i: i, lookahead=2)
+    items = list(range(20))
+    # Viewport 10..13: rows 8, 9 (behind) and 13, 14 (ahead) are look-ahead
+    loader.update(items, 10, 13)
+    assert loader.pending() == {8, 9, 10, 11, 12, 13, 14}
+    gate.set()
+    _wait_idle(loader)
+
+    assert order[:3] == [10, 11, 12]
+    assert sorted(order[3:]) == [8, 9, 13, 14]
+    scheduler.shutdown()
+
+
+def test_scrolling_away_cancels_queued_rows():
+    scheduler, gate = _blocked_scheduler()
+    order = []
+    loader = ViewportLoader(scheduler, order.append, key=lambda i: i, lookahead=1, keep=2)
+    items = list(range(100))
+    loader.update(items, 0, 3)
+    # Jump to the end before anything ran: the top rows are dropped
+    loader.update(items, 90, 93)
+    assert loader.pending() == {89, 90, 91, 92, 93}
+    gate.set()
+    _wait_idle(loader)
+
+    assert sorted(order) == [89, 90, 91, 92, 93]
+    # Scrolling back queues the cancelled rows again
+    loader.update(items, 0, 3)
+    _wait_idle(loader)
+    assert sorted(order) == [0, 1, 2, 3, 89, 90, 91, 92, 93]
+    scheduler.shutdown()
+
+
+def test_finished_rows_wait_for_invalidate():
+    scheduler = DownloadScheduler(workers=1)
+    calls = []
+    loader = ViewportLoader(scheduler, calls.append, key=lambda i: i, lookahead=0)
+    items = ["a", "b"]
+    loader.update(items, 0, 2)
+    _wait_idle(loader)
+    time.sleep(0.05)
+    loader.update(items, 0, 2)
+    _wait_idle(loader)
+    assert sorted(calls) == ["a", "b"]
+
+    loader.invalidate("b")
+    loader.update(items, 0, 2)
+    _wait_idle(loader)
+    time.sleep(0.05)
+    assert sorted(calls) == ["a", "b", "b"]
+
+    loader.reset()
+    loader.update(items, 0, 1)
+    _wait_idle(loader)
+    time.sleep(0.05)
+    assert sorted(calls) == ["a", "a", "b", "b"]
+    scheduler.shutdown()
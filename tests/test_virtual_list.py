@@ -0,0 +1,62 @@
+"""
+Tests for the virtualized game list geometry (utils.virtual_list, gui.widgets.game_row):
+- rows inside a pixel range are found from the prefix offsets
+- height changes and appends move the following rows
+- row heights follow the number of action buttons a game shows
+- the list only virtualizes when the CTkScrollableFrame internals it drives exist
+"""
+from types import SimpleNamespace
+
+from gui.widgets.game_list_frame import GameListFrame
+from gui.widgets.game_row import button_count, row_height
+from utils.virtual_list import RowLayout
+
+
+def test_rows_between():
+    layout = RowLayout([100, 100, 50, 150])
+    assert layout.total == 400
+    assert layout.rows_between(0, 100) == (0, 1)
+    assert layout.rows_between(150, 260) == (1, 4)
+    # A row ending exactly at the top edge is not on screen
+    assert layout.rows_between(100, 200) == (1, 2)
+    assert layout.rows_between(390, 1000) == (3, 4)
+    assert layout.rows_between(5000, 6000) == (3, 4)
+    assert RowLayout().rows_between(0, 500) == (0, 0)
+
+
+def test_height_changes_move_later_rows():
+    layout = RowLayout([80] * 5)
+    layout.set_height(1, 140)
+    assert [layout.offset(i) for i in range(5)] == [0, 80, 220, 300, 380]
+    assert layout.total == 460
+    layout.append([90, 90])
+    assert len(layout) == 7
+    assert layout.offset(6) == 550
+    assert layout.rows_between(221, 222) == (2, 3)
+
+
+def test_row_height_follows_buttons():
+    plain = SimpleNamespace(optiscaler_installed=False)
+    installed = SimpleNamespace(optiscaler_installed=True)
+    assert button_count(plain) == 2
+    assert button_count(installed) == 3
+    assert button_count(installed, update_available=True) == 4
+    assert row_height(plain) < row_height(installed) < row_height(installed, update_available=True)
+
+
+class _Canvas:
+    def __init__(self, items):
+        self.items = items
+
+    def type(self, item):
+        return self.items.get(item, "")
+
+
+def test_virtualization_requires_the_checked_internals():
+    frame = SimpleNamespace(_parent_canvas=_Canvas({7: "window"}), _create_window_id=7, _scrollbar=object())
+    assert GameListFrame._virtual_internals_ok(frame)
+
+    # A customtkinter that renamed or restructured them falls back to the chunked list
+    assert not GameListFrame._virtual_internals_ok(SimpleNamespace(_parent_canvas=_Canvas({}), _scrollbar=None))
+    frame._create_window_id = 8
+    assert not GameListFrame._virtual_internals_ok(frame)